@@ -1,9 +1,12 @@
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
-from typing import List
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List
 from threading import Event, Thread
 
 import backend.time_util as tu
+from backend.config import Config
+from backend.show_clock import ShowClock
 
 @dataclass
 class AbstractPlayerItem(ABC):
@@ -13,11 +16,16 @@ class AbstractPlayerItem(ABC):
 class AbstractPlayer(ABC):
 
     TIME_RESOLUTION: float = tu.TIME_RESOLUTION / 50.0
+    CATCH_UP_THRESHOLD: float = Config.get_constant('player_catch_up_threshold')
+    LEAD_TIME: float = 0.0
+    LATENESS_BUCKETS: List[float] = [0.001, 0.005, 0.01, 0.05, 0.1, 0.5]
 
-    _items: List[AbstractPlayerItem]
+    _timestamps: List[float]
+    _skipped_items: int
+    _lateness_counts: List[int]
 
-    _origin_timestamp: float
-    _pause_started_timestamp: float
+    _clock: ShowClock
+    _owns_clock: bool
     _current_item_index: int
 
     _paused: bool
@@ -30,7 +38,9 @@ class AbstractPlayer(ABC):
     _stop_event: Event
     _destroy_event: Event
 
-    def __init__(self):
+    def __init__(self, clock: ShowClock = None):
+        self._owns_clock = clock is None
+        self._clock = ShowClock() if clock is None else clock
         self.reset()
 
     def reset(self):
@@ -39,9 +49,11 @@ class AbstractPlayer(ABC):
         self._stop_event = None
         self._destroy_event = None
         
-        self._origin_timestamp = 0.0
-        self._pause_started_timestamp = 0.0
+        if self._owns_clock:
+            self._clock.reset()
         self._current_item_index = 0
+        self._skipped_items = 0
+        self._lateness_counts = [0] * (len(self.LATENESS_BUCKETS) + 1)
 
         self._paused = True
         self._playing = False
@@ -55,10 +67,8 @@ class AbstractPlayer(ABC):
         self._thread = None
 
     def _next_item_index(self, timestamp: float) -> int:
-        for i, item in enumerate(self._items):
-            if item.timestamp >= timestamp:
-                return i
-            
+        return bisect_left(self._timestamps, timestamp)
+
     def _mainloop(self):
         while not self._destroy_event.is_set():
             if self._play_event.is_set():
@@ -85,11 +95,36 @@ class AbstractPlayer(ABC):
         self._destroy_event.clear()
 
     def _tick(self):
-        if self._items[self._current_item_index].timestamp < tu.timestamp_now() - self._origin_timestamp:
-            self._play_item()
-            self._current_item_index += 1
-            if self._current_item_index >= len(self._items):
-                self.stop()
+        if self._current_item_index >= len(self._timestamps):
+            self.stop()
+            return
+        now = self._clock.now() + self.LEAD_TIME
+        lateness = now - self._timestamps[self._current_item_index]
+        if lateness <= 0.0:
+            return
+
+        latest_due_index = bisect_left(self._timestamps, now) - 1
+        if (
+            latest_due_index > self._current_item_index
+            and lateness > self.CATCH_UP_THRESHOLD
+        ):
+            self._skip_items(latest_due_index)
+            self._skipped_items += (
+                latest_due_index - self._current_item_index
+            )
+            self._current_item_index = latest_due_index
+            lateness = now - self._timestamps[latest_due_index]
+
+        self._count_lateness(lateness)
+        self._play_item()
+        self._current_item_index += 1
+        if self._current_item_index >= len(self._timestamps):
+            self.stop()
+
+    def _count_lateness(self, lateness: float):
+        self._lateness_counts[
+            bisect_right(self.LATENESS_BUCKETS, lateness)
+        ] += 1
 
     @abstractmethod
     def _start_playing(self):
@@ -102,6 +137,12 @@ class AbstractPlayer(ABC):
     @abstractmethod
     def _end_playing(self):
         raise NotImplementedError("@abstractmethod")
+
+    def _seek_item(self):
+        pass
+
+    def _skip_items(self, until_index: int):
+        pass
     
     def run(self):
         self._play_event = Event()
@@ -115,23 +156,29 @@ class AbstractPlayer(ABC):
     def play(self):
         if self._thread is None:
             self.run()
-        dt = tu.timestamp_now() - self._pause_started_timestamp
-        self._origin_timestamp += dt
+        if self._owns_clock:
+            if self._clock.is_started:
+                self._clock.resume()
+            else:
+                self._clock.start()
         self._play_event.set()
 
     def pause(self):
-        self._pause_started_timestamp = tu.timestamp_now()
+        if self._owns_clock:
+            self._clock.pause()
         self._pause_event.set()
 
     def stop(self):
-        self._origin_timestamp = tu.timestamp_now()
-        self._pause_started_timestamp = self._origin_timestamp
-        self._current_frame_index = 0
+        if self._owns_clock:
+            self._clock.reset()
+        self._current_item_index = 0
         self._stop_event.set()
 
-    def jump(self, timestamp: float):
-        self._origin_timestamp = tu.timestamp_now() - timestamp
-        self._current_frame_index = self._search_frame(timestamp)
+    def seek(self, timestamp: float):
+        if self._owns_clock:
+            self._clock.seek(timestamp)
+        self._current_item_index = self._next_item_index(timestamp)
+        self._seek_item()
 
     def is_playing(self) -> bool:
         return self._playing
@@ -140,8 +187,20 @@ class AbstractPlayer(ABC):
         return self._paused
 
     def current_time(self) -> int:
-        return tu.timestamp_now() - self._origin_timestamp
+        return self._clock.now()
 
     def total_duration(self) -> int:
-        return self._items[-1].timestamp
+        return self._timestamps[-1]
+
+    def playback_state(self) -> Dict[str, Any]:
+        bucket_names = [
+            f"<{bucket * 1000:g}ms" for bucket in self.LATENESS_BUCKETS
+        ] + [f">={self.LATENESS_BUCKETS[-1] * 1000:g}ms"]
+        return {
+            'current_item_index': self._current_item_index,
+            'skipped_items': self._skipped_items,
+            'lateness_histogram': dict(
+                zip(bucket_names, self._lateness_counts)
+            )
+        }
 
@@ -9,6 +9,7 @@ import ctypes
 import tempfile
 import os
 from backend.logger import logger
+from backend.show_clock import ShowClock
 # import subprocess
 # import sys
 
@@ -172,16 +173,22 @@ def handle_error(func):
 class AudioPlayer:
 
     _emergency_audio_player: EmergencyAudioPlayer
+    _clock: ShowClock
+    _owns_clock: bool
     _paused: bool
     _playing: bool
+    _offset: float
     
-    def __init__(self, wav_filename: str):
+    def __init__(self, wav_filename: str, clock: ShowClock = None):
         if wav_filename.endswith('.mp3'):
             logger.info("Converting to wav")
             wav_filename = self._convert_to_wav(wav_filename)
 
+        self._owns_clock = clock is None
+        self._clock = ShowClock() if clock is None else clock
         self._paused = False
         self._playing = False
+        self._offset = 0.0
         self._emergency_audio_player = EmergencyAudioPlayer(wav_filename)
 
     def _convert_to_wav(self, filename: str) -> str:
@@ -195,26 +202,43 @@ class AudioPlayer:
         return self._temp_wav_filename
 
     def play(self) -> bool:
-        if self._paused:
+        if self._owns_clock:
+            if self._clock.is_started:
+                self._clock.resume()
+            else:
+                self._clock.start()
+        if self._paused and self._emergency_audio_player.is_paused:
             self._emergency_audio_player.continue_()
-            self._paused = False
         else:
-            self._emergency_audio_player.play()
+            self._emergency_audio_player.play(self._offset)
+        self._paused = False
         self._playing = True
         return True
 
     def pause(self) -> bool:
+        if self._owns_clock:
+            self._clock.pause()
         self._emergency_audio_player.pause()
         self._paused = True
         return True
 
     def stop(self):
+        if self._owns_clock:
+            self._clock.reset()
         self._emergency_audio_player.stop()
         self._playing = False
         self._paused = False
-
-    def jump(self, timestamp: int) -> bool:
-        # jump NOT IMPLEMENTED
+        self._offset = 0.0
+
+    def seek(self, timestamp: float) -> bool:
+        self._offset = timestamp
+        if self._playing:
+            self._emergency_audio_player.stop()
+        self._emergency_audio_player.prepare(self._offset)
+        if self._playing and not self._paused:
+            self._emergency_audio_player.play(self._offset)
+        if self._owns_clock:
+            self._clock.seek(timestamp)
         return True
 
     def is_playing(self) -> bool:
@@ -223,9 +247,8 @@ class AudioPlayer:
     def is_paused(self) -> bool:
         return self._paused
 
-    def current_time(self) -> int:
-        # current_time NOT IMPLEMENTED
-        return 0
+    def current_time(self) -> float:
+        return self._clock.now()
 
     def total_duration(self) -> int:
         # total_duration NOT IMPLEMENTED
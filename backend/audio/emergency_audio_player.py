@@ -18,12 +18,16 @@ class AudioPlayer:
     STATE_PAUSED: str = 'paused'
 
     _wav_filename: str
+    _offset_filename: str
+    _prepared_offset: float
     _state: str
     _process: subprocess.Popen
     _thread: Thread
 
     def __init__(self, filename: str):
         self._wav_filename = filename
+        self._offset_filename = None
+        self._prepared_offset = None
         self._state = self.STATE_READY
         self._thread = None
 
@@ -33,11 +37,15 @@ class AudioPlayer:
             self._thread.join()
         self._thread = None
 
-    def play(self):
+    def play(self, offset: float = 0.0):
         if self._state != self.STATE_READY:
             return
+        filename = self._wav_filename
+        if offset > 0.0:
+            self.prepare(offset)
+            filename = self._offset_filename
         self._process = subprocess.Popen(
-            [self.APLAY_EXECUTABLE, self._wav_filename],
+            [self.APLAY_EXECUTABLE, filename],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL
         )
@@ -64,6 +72,42 @@ class AudioPlayer:
         if self._thread and self._thread.is_alive():
             self._thread.join()
 
+    def prepare(self, offset: float):
+        if self._state != self.STATE_READY:
+            return
+        if offset <= 0.0 or offset == self._prepared_offset:
+            return
+        self._remove_offset_file()
+        self._export_from(offset)
+        self._prepared_offset = offset
+
+    @property
+    def is_paused(self) -> bool:
+        return self._state == self.STATE_PAUSED
+
+    def _export_from(self, offset: float) -> str:
+        temp_file = tempfile.NamedTemporaryFile(
+            prefix=self.TEMP_FILE_PREFIX,
+            suffix=f".{self.FILE_FORMAT}",
+            delete=False
+        )
+        temp_file.close()
+        audio_segment = pydub.AudioSegment.from_file(
+            self._wav_filename, format=self.FILE_FORMAT
+        )
+        audio_segment[int(offset * 1000):].export(
+            temp_file.name, format=self.FILE_FORMAT
+        )
+        self._offset_filename = temp_file.name
+        return self._offset_filename
+
+    def _remove_offset_file(self):
+        if self._offset_filename is not None:
+            os.remove(self._offset_filename)
+            self._offset_filename = None
+            self._prepared_offset = None
+
     def _wait_for_process_termination(self):
         self._process.wait()
+        self._remove_offset_file()
         self._state = self.STATE_READY
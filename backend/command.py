@@ -1,11 +1,6 @@
-from threading import Thread
 from typing import Any, Dict
 
-import backend.time_util as tu
 from backend.address import Address
-from backend.config import Config
-from backend.hardware import Hardware
-from backend.logger import logger
 from backend.rl_exception import RlException
 
 
@@ -14,12 +9,9 @@ class Command:
     class AlreadyFiredException(RlException):
         pass
 
-    IGNITION_DURATION: float = Config.get_constant('ignition_duration')
-
     _address: Address
     _timestamp: float
     _name: str
-    _thread: Thread
     _fired: bool
     _fireing: bool
     _faulty: bool
@@ -31,34 +23,22 @@ class Command:
         self._name = name
         self.reset()
 
-    def _thread_handler(self):
-        self._fireing = True
-
-        try:
-            Hardware.light(self._address)
-            tu.sleep(self.IGNITION_DURATION)
-            Hardware.unlight(self._address)
-        except Exception:
-            self._faulty = True
-            self._faulty_reason = f"Error lighting {self}"
-            raise
-
-        self._fired = True
-        self._fireing = False
-
     def reset(self):
         self._fired = False
         self._fireing = False
         self._faulty = False
         self._faulty_reason = ""
         
-    def light(self):
-        logger.debug(f"Light {self}")
-        self._thread = Thread(target=self._thread_handler, name=f"light_{self._address}")
-        self._thread.start()
+    def mark_fireing(self):
+        self._fireing = True
+
+    def mark_fired(self):
+        self._fired = True
+        self._fireing = False
 
-    def increase_timestamp(self, offset: float):
-        self._timestamp += offset
+    def mark_faulty(self, reason: str):
+        self._faulty = True
+        self._faulty_reason = reason
 
     @property
     def address(self) -> Address:
@@ -68,9 +48,8 @@ class Command:
     def timestamp(self) -> float:
         return self._timestamp
 
-    @property
-    def seconds_left(self) -> float:
-        return self._timestamp - tu.timestamp_now()
+    def seconds_left(self, current_timestamp: float) -> float:
+        return self._timestamp - current_timestamp
 
     @property
     def name(self) -> str:
@@ -87,7 +66,7 @@ class Command:
     def __str__(self):
         return f"{self._name}: {self.address} ({self._timestamp})"
 
-    def get_state(self) -> Dict[str, Any]:
+    def get_state(self, current_timestamp: float = 0.0) -> Dict[str, Any]:
         return {
             'address': {
                 'device_id': self._address.device_id,
@@ -95,7 +74,7 @@ class Command:
                 'number': self._address.number
             },
             'timestamp': self._timestamp,
-            'seconds_left': self.seconds_left,
+            'seconds_left': self.seconds_left(current_timestamp),
             'name': self._name,
             'fired': self._fired,
             'fireing': self._fireing,
@@ -0,0 +1,387 @@
+import hashlib
+import json
+import mmap
+import os
+from typing import Any, Dict, Iterable, List, Union
+
+import numpy as np
+
+from backend.dmx.dmx import DMX_UNIVERSE_SIZE
+from backend.dmx.dmx_timeline import DmxTimeline
+from backend.ilda.ilda import HELIOS_POINT_DTYPE
+from backend.ilda.ilda_timeline import IldaTimeline
+from backend.rl_exception import RlException
+
+
+class CompiledProgram:
+
+    class InvalidCompiledProgram(RlException):
+        pass
+
+    MAGIC: bytes = b"RLCP"
+    VERSION: int = 8
+    ILDA_COMPILE_BATCH: int = 256
+    ALIGNMENT: int = 8
+
+    HEADER_DTYPE: np.dtype = np.dtype([
+        ('magic', 'S4'),
+        ('version', '<u4'),
+        ('section_amount', '<u4'),
+        ('reserved', '<u4')
+    ])
+    SECTION_DTYPE: np.dtype = np.dtype([
+        ('name', 'S8'),
+        ('offset', '<u8'),
+        ('length', '<u8')
+    ])
+    FUSE_DTYPE: np.dtype = np.dtype([
+        ('timestamp', '<f8'),
+        ('letter', 'S1'),
+        ('number', 'u1')
+    ])
+    ILDA_FRAME_DTYPE: np.dtype = np.dtype([
+        ('timestamp', '<f8'),
+        ('frame_rate', '<u4'),
+        ('point_offset', '<u4'),
+        ('point_amount', '<u4'),
+        ('source_point_amount', '<u4'),
+        ('last_frame', 'u1'),
+        ('projector', 'u1')
+    ])
+    DMX_FRAME_DTYPE: np.dtype = np.dtype([
+        ('timestamp', '<f8'),
+        ('span_offset', '<u8'),
+        ('first_channel', '<u2'),
+        ('universe', '<u2')
+    ])
+
+    META_SECTION: str = 'meta'
+    FUSES_SECTION: str = 'fuses'
+    FUSE_NAMES_SECTION: str = 'names'
+    ILDA_FRAMES_SECTION: str = 'ilda_frm'
+    ILDA_POINTS_SECTION: str = 'ilda_pts'
+    DMX_FRAMES_SECTION: str = 'dmx_frm'
+    DMX_SPANS_SECTION: str = 'dmx_span'
+    DMX_KEYFRAMES_SECTION: str = 'dmx_key'
+
+    _filename: str
+    _mmap: mmap.mmap
+    _sections: Dict[str, np.ndarray]
+    _meta: Dict[str, Any]
+
+    @staticmethod
+    def source_signature(source_filename: str) -> Dict[str, int]:
+        stat = os.stat(source_filename)
+        return {
+            'source_size': stat.st_size,
+            'source_mtime_ns': stat.st_mtime_ns
+        }
+
+    @staticmethod
+    def source_md5(source_filename: str) -> str:
+        md5 = hashlib.md5()
+        with open(source_filename, 'rb') as file:
+            for chunk in iter(lambda: file.read(1 << 20), b''):
+                md5.update(chunk)
+        return md5.hexdigest()
+
+    @classmethod
+    def is_valid_for(
+        cls, filename: str, source_filename: str,
+        expected_meta: Dict[str, Any] = None
+    ) -> bool:
+        if not os.path.exists(filename):
+            return False
+        try:
+            meta = cls(filename).meta
+        except cls.InvalidCompiledProgram:
+            return False
+        if any(
+            meta.get(key) != value
+            for key, value in (expected_meta or {}).items()
+        ):
+            return False
+        signature = cls.source_signature(source_filename)
+        if all(meta.get(key) == value for key, value in signature.items()):
+            return True
+        if meta.get('source_size') != signature['source_size']:
+            return False
+        return meta.get('source_md5') == cls.source_md5(source_filename)
+
+    @classmethod
+    def ilda_tables(
+        cls, timelines: Dict[int, IldaTimeline]
+    ) -> Dict[str, Iterable]:
+        point_amounts = {}
+
+        def unique_positions(timeline: IldaTimeline) -> Dict[int, int]:
+            first_positions = {}
+            for position, key in enumerate(timeline.point_keys):
+                first_positions.setdefault(key, position)
+            return first_positions
+
+        def points():
+            for projector_number, timeline in timelines.items():
+                first_positions = unique_positions(timeline)
+                unique_keys = list(first_positions)
+                for start in range(
+                    0, len(unique_keys), cls.ILDA_COMPILE_BATCH
+                ):
+                    keys = unique_keys[start:start + cls.ILDA_COMPILE_BATCH]
+                    for key, frame_points in zip(keys, timeline.frame_points(
+                        [first_positions[key] for key in keys]
+                    )):
+                        point_amounts[(projector_number, key)] = len(
+                            frame_points
+                        )
+                        yield frame_points
+
+        def frame_tables():
+            point_offsets = {}
+            point_amount = 0
+            for unique_key, amount in point_amounts.items():
+                point_offsets[unique_key] = point_amount
+                point_amount += amount
+            for projector_number, timeline in timelines.items():
+                keys = [
+                    (projector_number, key) for key in timeline.point_keys
+                ]
+                table = np.zeros(len(timeline), dtype=cls.ILDA_FRAME_DTYPE)
+                table['timestamp'] = timeline.timestamps
+                table['frame_rate'] = timeline.frame_rates
+                table['point_offset'] = [point_offsets[key] for key in keys]
+                table['point_amount'] = [point_amounts[key] for key in keys]
+                table['source_point_amount'] = [
+                    timeline.source_point_amounts[key]
+                    for key in timeline.point_keys
+                ]
+                table['last_frame'] = timeline.last_frames
+                table['projector'] = projector_number
+                yield table
+
+        return {
+            cls.ILDA_POINTS_SECTION: points(),
+            cls.ILDA_FRAMES_SECTION: frame_tables()
+        }
+
+    @classmethod
+    def dmx_tables(
+        cls, timelines: Dict[int, DmxTimeline]
+    ) -> Dict[str, Union[np.ndarray, Iterable]]:
+        span_offsets = {}
+        span_amount = 0
+        for universe, timeline in timelines.items():
+            span_offsets[universe] = span_amount
+            span_amount += len(timeline.spans)
+
+        def frame_tables():
+            for universe, timeline in timelines.items():
+                table = np.zeros(len(timeline) + 1, dtype=cls.DMX_FRAME_DTYPE)
+                table['timestamp'][:-1] = timeline.timestamps
+                table['span_offset'] = (
+                    timeline.span_offsets + span_offsets[universe]
+                )
+                table['first_channel'][:-1] = timeline.first_channels
+                table['universe'] = universe
+                yield table
+
+        return {
+            cls.DMX_FRAMES_SECTION: frame_tables(),
+            cls.DMX_SPANS_SECTION: [
+                timeline.spans for timeline in timelines.values()
+            ],
+            cls.DMX_KEYFRAMES_SECTION: [
+                timeline.keyframes for timeline in timelines.values()
+            ]
+        }
+
+    @classmethod
+    def write(
+        cls, filename: str, meta: Dict[str, Any],
+        sections: Dict[str, Union[np.ndarray, bytes, Iterable]]
+    ):
+        sections = {
+            cls.META_SECTION: json.dumps(meta).encode('utf-8'), **sections
+        }
+        header = np.zeros(1, dtype=cls.HEADER_DTYPE)
+        header[0] = (cls.MAGIC, cls.VERSION, len(sections), 0)
+        section_table = np.zeros(len(sections), dtype=cls.SECTION_DTYPE)
+
+        temp_filename = f"{filename}.tmp"
+        with open(temp_filename, 'wb') as file:
+            offset = cls._align(header.nbytes + section_table.nbytes)
+            for idx, (name, data) in enumerate(sections.items()):
+                file.seek(offset)
+                length = 0
+                for chunk in cls._chunks(data):
+                    file.write(chunk)
+                    length += len(chunk)
+                section_table[idx] = (name.encode('ascii'), offset, length)
+                offset = cls._align(offset + length)
+            file.truncate(offset)
+            file.seek(0)
+            file.write(header.tobytes())
+            file.write(section_table.tobytes())
+        os.replace(temp_filename, filename)
+
+    @staticmethod
+    def _chunks(
+        data: Union[np.ndarray, bytes, Iterable]
+    ) -> Iterable[bytes]:
+        if isinstance(data, (bytes, np.ndarray)):
+            data = [data]
+        for chunk in data:
+            if isinstance(chunk, np.ndarray):
+                chunk = np.ascontiguousarray(chunk).tobytes()
+            yield chunk
+
+    @classmethod
+    def _align(cls, offset: int) -> int:
+        return -(-offset // cls.ALIGNMENT) * cls.ALIGNMENT
+
+    def __init__(self, filename: str):
+        self._filename = filename
+        with open(filename, 'rb') as file:
+            try:
+                self._mmap = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_COPY
+                )
+            except ValueError:
+                raise self.InvalidCompiledProgram(
+                    f"{filename} is empty"
+                )
+        self._read_section_table()
+        self._meta = json.loads(
+            self._raw_section(self.META_SECTION).decode('utf-8')
+        )
+
+    def _read_section_table(self):
+        if len(self._mmap) < self.HEADER_DTYPE.itemsize:
+            raise self.InvalidCompiledProgram(
+                f"{self._filename} is too small"
+            )
+        header = np.frombuffer(self._mmap, self.HEADER_DTYPE, count=1)[0]
+        if header['magic'] != self.MAGIC:
+            raise self.InvalidCompiledProgram(
+                f"{self._filename} has an invalid magic number"
+            )
+        if header['version'] != self.VERSION:
+            raise self.InvalidCompiledProgram(
+                f"{self._filename} has version {header['version']}, "
+                f"expected {self.VERSION}"
+            )
+        section_table = np.frombuffer(
+            self._mmap, self.SECTION_DTYPE,
+            count=int(header['section_amount']),
+            offset=self.HEADER_DTYPE.itemsize
+        )
+        self._sections = {
+            entry['name'].decode('ascii'): (
+                int(entry['offset']), int(entry['length'])
+            )
+            for entry in section_table
+        }
+
+    def _raw_section(self, name: str) -> bytes:
+        offset, length = self._sections[name]
+        return self._mmap[offset:offset + length]
+
+    def has_section(self, name: str) -> bool:
+        return name in self._sections
+
+    def section(self, name: str, dtype: np.dtype) -> np.ndarray:
+        offset, length = self._sections[name]
+        return np.frombuffer(
+            self._mmap, dtype, count=length // dtype.itemsize, offset=offset
+        )
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        return self._meta
+
+    @property
+    def has_fuses(self) -> bool:
+        return self.has_section(self.FUSES_SECTION)
+
+    @property
+    def has_ilda(self) -> bool:
+        return self.has_section(self.ILDA_FRAMES_SECTION)
+
+    @property
+    def has_dmx(self) -> bool:
+        return self.has_section(self.DMX_FRAMES_SECTION)
+
+    @property
+    def fuses(self) -> np.ndarray:
+        return self.section(self.FUSES_SECTION, self.FUSE_DTYPE)
+
+    @property
+    def fuse_names(self) -> List[str]:
+        return json.loads(
+            self._raw_section(self.FUSE_NAMES_SECTION).decode('utf-8')
+        )
+
+    def ilda_timelines(self) -> Dict[int, IldaTimeline]:
+        frame_table = self.section(
+            self.ILDA_FRAMES_SECTION, self.ILDA_FRAME_DTYPE
+        )
+        points = self.section(self.ILDA_POINTS_SECTION, HELIOS_POINT_DTYPE)
+        return {
+            projector_number: self._ilda_timeline(
+                frame_table[frame_table['projector'] == projector_number],
+                points
+            )
+            for projector_number in np.unique(frame_table['projector']).tolist()
+        }
+
+    def _ilda_timeline(
+        self, frame_table: np.ndarray, points: np.ndarray
+    ) -> IldaTimeline:
+        point_offsets = frame_table['point_offset'].astype(np.int64)
+        point_amounts = frame_table['point_amount'].astype(np.int64)
+        starts = point_offsets.tolist()
+        ends = (point_offsets + point_amounts).tolist()
+
+        def loader(positions: List[int]) -> List[np.ndarray]:
+            return [
+                points[starts[position]:ends[position]].copy()
+                for position in positions
+            ]
+
+        return IldaTimeline(
+            frame_table['timestamp'].astype(np.float64),
+            frame_table['frame_rate'].astype(np.int64),
+            (point_offsets << 32) | point_amounts,
+            frame_table['last_frame'].astype(bool),
+            loader,
+            frame_table.nbytes + 2 * point_offsets.nbytes,
+            self,
+            source_point_amounts=frame_table['source_point_amount']
+        )
+
+    def dmx_timelines(self) -> Dict[int, DmxTimeline]:
+        frame_table = self.section(
+            self.DMX_FRAMES_SECTION, self.DMX_FRAME_DTYPE
+        )
+        spans = self.section(self.DMX_SPANS_SECTION, np.dtype(np.uint8))
+        keyframes = self.section(
+            self.DMX_KEYFRAMES_SECTION, np.dtype(np.uint8)
+        ).reshape(-1, DMX_UNIVERSE_SIZE)
+        keyframe_interval = self._meta['dmx_keyframe_interval']
+
+        timelines = {}
+        keyframe_offset = 0
+        for universe in dict.fromkeys(frame_table['universe'].tolist()):
+            universe_table = frame_table[frame_table['universe'] == universe]
+            span_offsets = universe_table['span_offset'].astype(np.int64)
+            keyframe_amount = (len(universe_table) - 1) // keyframe_interval + 1
+            timelines[universe] = DmxTimeline(
+                universe_table['timestamp'][:-1].astype(np.float64),
+                universe_table['first_channel'][:-1].astype(np.int64),
+                span_offsets - span_offsets[0],
+                spans[span_offsets[0]:span_offsets[-1]],
+                keyframes[keyframe_offset:keyframe_offset + keyframe_amount],
+                keyframe_interval
+            )
+            keyframe_offset += keyframe_amount
+        return timelines
@@ -2,7 +2,7 @@ from concurrent.futures import ThreadPoolExecutor
 from threading import Lock
 import time
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import backend.time_util as tu
 from backend.address import Address
@@ -15,6 +15,7 @@ from backend.led_controller import LedController
 from backend.logger import logger
 from backend.program import Program
 from backend.rl_exception import RlException
+from backend.salvo import Salvo
 from backend.schedule import Schedule
 from backend.state_machine import State, StateMachine
 from backend.system import System
@@ -76,8 +77,8 @@ class DeviceController:
         logger.debug("Program unloaded")
 
     @classmethod
-    def _run_program(cls):
-        cls._program.run(callback=cls._program_finished)
+    def _run_program(cls, offset: float = 0.0):
+        cls._program.run(callback=cls._program_finished, offset=offset)
         logger.debug("Programm running")
 
     @classmethod
@@ -159,9 +160,12 @@ class DeviceController:
     @classmethod
     @lock
     @raise_for_state_transition
-    def run_program(cls):
-        logger.info("Run program")
-        cls._state_machine.transition(cls.RUNNING)
+    def run_program(cls, offset: float = 0.0):
+        logger.info(f"Run program at offset {offset}")
+        if cls._state_machine.state == cls.PAUSED:
+            cls._state_machine.transition(cls.RUNNING)
+        else:
+            cls._state_machine.transition(cls.RUNNING, offset)
 
     @classmethod
     @lock
@@ -209,7 +213,7 @@ class DeviceController:
         )
         if cls._state_machine.state == cls.NOT_LOADED:
             command = Command(address, 0, f"manual_fire_command_{address}")
-            command.light()
+            Salvo(command.timestamp, [command]).light()
         else:
             raise cls.ProgramIsLoadedError(
                 "Can only fire when not program is loaded"
@@ -343,6 +347,16 @@ class MasterController:
     @classmethod
     def _call_device_method(
         cls, method_name: str, *args, **kwargs
+    ) -> Dict[str, Dict]:
+        return cls._call_device_method_with(
+            method_name,
+            {device_id: args for device_id in cls._devices.keys()},
+            **kwargs
+        )
+
+    @classmethod
+    def _call_device_method_with(
+        cls, method_name: str, args_by_device: Dict[str, Tuple], **kwargs
     ) -> Dict[str, Dict]:
         if not len(cls._devices):
             return {}
@@ -353,7 +367,7 @@ class MasterController:
             futures = {
                 device_id: executor.submit(
                     getattr(device, method_name),
-                    *args, **kwargs
+                    *args_by_device[device_id], **kwargs
                 )
                 for device_id, device in cls._devices.items()
             }
@@ -377,8 +391,14 @@ class MasterController:
             zipfile_handler = ZipfileHandler(data)
             return cls._call_device_method("load_zip_program", name, zipfile_handler)
         else:
-            Program.raise_on_json(data)
-            return cls._call_device_method("load_program", name, data)
+            events_by_device = Program.raise_on_json(data).split_json(data)
+            return cls._call_device_method_with(
+                "load_program",
+                {
+                    device_id: (name, events_by_device.get(device_id.lower(), []))
+                    for device_id in cls._devices.keys()
+                }
+            )
 
     @classmethod
     @lock
@@ -400,9 +420,9 @@ class MasterController:
 
     @classmethod
     @lock
-    def run_program(cls):
-        logger.info("Run program")
-        return cls._call_device_method("run_program")
+    def run_program(cls, offset: float = 0.0):
+        logger.info(f"Run program at offset {offset}")
+        return cls._call_device_method("run_program", offset)
 
     @classmethod
     @lock
@@ -177,9 +177,11 @@ class Device:
         logger.debug(f"{self._device_id}: unschedule program")
         return self._post("program/control", {'action': 'unschedule'})
 
-    def run_program(self):
-        logger.debug(f"{self._device_id}: run program")
-        return self._post("program/control", {'action': 'run'})
+    def run_program(self, offset: float = 0.0):
+        logger.debug(f"{self._device_id}: run program at offset {offset}")
+        return self._post(
+            "program/control", {'action': 'run', 'offset': offset}
+        )
 
     def pause_program(self):
         logger.debug(f"{self._device_id}: pause program")
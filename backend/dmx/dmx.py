@@ -1,6 +1,10 @@
 import ctypes
 
+import numpy as np
+
 DMX_MAGIC: int = 0x444D5820
+DMX_CHANNEL_AMOUNT: int = 512
+DMX_UNIVERSE_SIZE: int = DMX_CHANNEL_AMOUNT + 1
 
 class DmxHeader(ctypes.Structure):
     _fields_ = [
@@ -24,3 +28,18 @@ class DmxValue(ctypes.Structure):
         ('channel', ctypes.c_uint16),
         ('value', ctypes.c_uint8)
     ]
+
+
+DMX_HEADER_DTYPE: np.dtype = np.dtype([
+    ('magic', '<u4'),
+    ('padding', '<u2'),
+    ('universe', '<u2'),
+    ('elementAmount', '<u4'),
+    ('duration', '<u4')
+], align=True)
+DMX_ELEMENT_DTYPE: np.dtype = np.dtype(
+    [('timestamp', '<u4'), ('valueAmount', '<u2')], align=True
+)
+DMX_VALUE_DTYPE: np.dtype = np.dtype(
+    [('channel', np.uint16), ('value', np.uint8)], align=True
+)
@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Tuple
+
+
+class DmxInterface(ABC):
+
+    CHANNEL_RANGE: Tuple[int, int] = (1, 512)
+    VALUE_RANGE: Tuple[int, int] = (0, 255)
+    UNIVERSE_SIZE: int = CHANNEL_RANGE[-1] + 1
+    BLACKOUT: bytes = bytes(UNIVERSE_SIZE)
+
+    @classmethod
+    def _raise_for_channels(cls, first_channel: int, last_channel: int):
+        if not (
+            cls.CHANNEL_RANGE[0] <= first_channel
+            and last_channel <= cls.CHANNEL_RANGE[-1]
+        ):
+            raise ValueError(
+                f"Channels {first_channel}-{last_channel} out of range."
+            )
+
+    @abstractmethod
+    def initialize(self):
+        raise NotImplementedError("@abstractmethod")
+
+    @abstractmethod
+    def destroy(self):
+        raise NotImplementedError("@abstractmethod")
+
+    @abstractmethod
+    def set_channels(self, first_channel: int, values: bytes):
+        raise NotImplementedError("@abstractmethod")
+
+    @abstractmethod
+    def blackout(self):
+        raise NotImplementedError("@abstractmethod")
+
+    @abstractmethod
+    def render(self):
+        raise NotImplementedError("@abstractmethod")
+
+    @abstractmethod
+    def get_state(self) -> Dict[str, Any]:
+        raise NotImplementedError("@abstractmethod")
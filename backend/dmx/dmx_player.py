@@ -1,60 +1,180 @@
-import ctypes
+import struct
 
-from dataclasses import dataclass
-from typing import List, Tuple, Type
+from typing import Any, Dict, List, Tuple
 
-from backend.abstract_player import AbstractPlayer, AbstractPlayerItem
-from backend.dmx.ftdi_dmx_interface import FtdiDmxInterface
-from backend.dmx.dmx import DmxHeader, DmxElement, DmxValue
+import numpy as np
 
-@dataclass
-class DmxFrame(AbstractPlayerItem):
-    values: List[Tuple[int, int]] = None
+from backend.abstract_player import AbstractPlayer
+from backend.config import Config
+from backend.dmx.dmx_interface import DmxInterface
+from backend.dmx.ftdi_dmx_interface import FtdiDmxInterface
+from backend.dmx.network_dmx_interface import NetworkDmxInterface
+from backend.dmx.dmx import DMX_HEADER_DTYPE, DMX_ELEMENT_DTYPE, DMX_VALUE_DTYPE
+from backend.dmx.dmx_timeline import DmxFrame, DmxTimeline
+from backend.logger import logger
+from backend.show_clock import ShowClock
 
 
 class DmxPlayer(AbstractPlayer):
-    HEADER_SIZE: int = ctypes.sizeof(DmxHeader)
-    ELEMENT_SIZE: int = ctypes.sizeof(DmxElement)
-    VALUE_SIZE: int = ctypes.sizeof(DmxValue)
+    UNIVERSE: int = 0
+    FTDI_OUTPUT: str = 'ftdi'
+    HEADER_SIZE: int = DMX_HEADER_DTYPE.itemsize
+    ELEMENT_SIZE: int = DMX_ELEMENT_DTYPE.itemsize
+    VALUE_SIZE: int = DMX_VALUE_DTYPE.itemsize
+    VALUE_AMOUNT_OFFSET: int = DMX_ELEMENT_DTYPE.fields['valueAmount'][1]
+    VALUE_AMOUNT_STRUCT: struct.Struct = struct.Struct('<H')
+
+    _interface: DmxInterface
+    _universe: int
+    _timeline: DmxTimeline
+    _pending_state: np.ndarray
+
+    @classmethod
+    def from_file(
+        cls, dmx_filename: str, clock: ShowClock = None, output: str = None
+    ) -> Dict[int, 'DmxPlayer']:
+        return {
+            universe: cls(
+                DmxTimeline.from_frames(frames), clock, universe, output
+            )
+            for universe, frames in cls.read_file(dmx_filename).items()
+        }
+
+    @classmethod
+    def interface_for(cls, universe: int, output: str = None) -> DmxInterface:
+        output = output or Config.get_value('dmx_output')
+        if output == cls.FTDI_OUTPUT:
+            return FtdiDmxInterface.for_universe(universe)
+        return NetworkDmxInterface.for_universe(output, universe)
 
-    _interface: Type[FtdiDmxInterface] = FtdiDmxInterface
-    
-    def __init__(self, dmx_filename: str):
+    @classmethod
+    def read_file(cls, dmx_filename: str) -> Dict[int, List[DmxFrame]]:
         with open(dmx_filename, 'rb') as file:
             dmx_data = file.read()
-        self._read_dmx_data(dmx_data)
-        super().__init__()
+
+        universes = {}
+        magic = None
+        offset = 0
+        while offset + cls.HEADER_SIZE <= len(dmx_data):
+            header = np.frombuffer(
+                dmx_data, DMX_HEADER_DTYPE, count=1, offset=offset
+            )[0]
+            if magic is not None and header['magic'] != magic:
+                logger.warning(
+                    f"Ignoring {len(dmx_data) - offset} bytes after the last "
+                    f"DMX universe in {dmx_filename}"
+                )
+                break
+            magic = header['magic']
+            universe, frames, offset = cls._read_dmx_data(dmx_data, offset)
+            if universe in universes:
+                universes[universe].extend(frames)
+                universes[universe].sort(key=lambda frame: frame.timestamp)
+            else:
+                universes[universe] = frames
+        return universes
+
+    def __init__(
+        self, timeline: DmxTimeline, clock: ShowClock = None,
+        universe: int = UNIVERSE, output: str = None
+    ):
+        self._interface = self.interface_for(universe, output)
+        self._universe = universe
+        self._timeline = timeline
+        self._timestamps = timeline.timestamps.tolist()
+        self._pending_state = None
+        super().__init__(clock)
 
     def __del__(self):
         self._interface.destroy()
 
-    def _read_dmx_data(self, dmx_data: bytes):
-        header = DmxHeader.from_buffer_copy(dmx_data[:self.HEADER_SIZE])
-        element_amount = header.elementAmount
-
-        self._items = []
-        offset = self.HEADER_SIZE
-        for _1 in range(element_amount):
-            dmx_element = DmxElement.from_buffer_copy(dmx_data[offset:offset + self.ELEMENT_SIZE])
-            offset += self.ELEMENT_SIZE
-            timestamp = dmx_element.timestamp / 1000.0
-            value_amount = dmx_element.valueAmount
-            values = []
-            
-            for _2 in range(value_amount):
-                dmx_value = DmxValue.from_buffer_copy(dmx_data[offset:offset + self.VALUE_SIZE])
-                offset += self.VALUE_SIZE
-                values.append((dmx_value.channel, dmx_value.value))
-            self._items.append(DmxFrame(timestamp, values))
+    @classmethod
+    def _read_dmx_data(
+        cls, dmx_data: bytes, offset: int = 0
+    ) -> Tuple[int, List[DmxFrame], int]:
+        header = np.frombuffer(
+            dmx_data, DMX_HEADER_DTYPE, count=1, offset=offset
+        )[0]
+        start = offset + cls.HEADER_SIZE
+        element_offsets, value_amounts, end = cls._index_elements(
+            dmx_data, start, int(header['elementAmount'])
+        )
+        if end > len(dmx_data):
+            raise ValueError(f"DMX data ends at {len(dmx_data)}, expected {end} bytes")
+
+        stream = np.frombuffer(
+            dmx_data, np.uint8, count=end - start, offset=start
+        )
+        element_bytes = (
+            np.array(element_offsets, dtype=np.int64)[:, np.newaxis] - start
+            + np.arange(cls.ELEMENT_SIZE)
+        )
+        elements = stream[element_bytes].reshape(-1).view(DMX_ELEMENT_DTYPE)
+        is_value = np.ones(len(stream), dtype=bool)
+        is_value[element_bytes] = False
+        values = stream[is_value].view(DMX_VALUE_DTYPE)
+
+        value_offsets = np.zeros(len(value_amounts) + 1, dtype=np.int64)
+        np.cumsum(value_amounts, out=value_offsets[1:])
+        value_offsets = value_offsets.tolist()
+        frames = [
+            DmxFrame(timestamp, values[value_offsets[i]:value_offsets[i + 1]])
+            for i, timestamp in enumerate((elements['timestamp'] / 1000.0).tolist())
+        ]
+        return int(header['universe']), frames, end
+
+    @classmethod
+    def _index_elements(
+        cls, dmx_data: bytes, offset: int, element_amount: int
+    ) -> Tuple[List[int], List[int], int]:
+        unpack_value_amount = cls.VALUE_AMOUNT_STRUCT.unpack_from
+        element_offsets = []
+        value_amounts = []
+        for _ in range(element_amount):
+            value_amount, = unpack_value_amount(
+                dmx_data, offset + cls.VALUE_AMOUNT_OFFSET
+            )
+            element_offsets.append(offset)
+            value_amounts.append(value_amount)
+            offset += cls.ELEMENT_SIZE + value_amount * cls.VALUE_SIZE
+        return element_offsets, value_amounts, offset
+
+    @property
+    def universe(self) -> int:
+        return self._universe
+
+    def output_state(self) -> Dict[str, Any]:
+        return self._interface.get_state()
 
     def _play_item(self):
-        frame = self._items[self._current_item_index]
-        for channel, value in frame.values:
-            self._interface.set_channel(channel, value)
+        first_channel, span = self._timeline.span(self._current_item_index)
+        if len(span):
+            self._interface.set_channels(first_channel, span)
+        self._interface.render()
+
+    def _set_state(self, state: np.ndarray):
+        first_channel = self._interface.CHANNEL_RANGE[0]
+        self._interface.set_channels(first_channel, state[first_channel:])
+
+    def _apply_state(self, state: np.ndarray):
+        self._set_state(state)
         self._interface.render()
 
+    def _skip_items(self, until_index: int):
+        self._set_state(self._timeline.state_at(until_index))
+
+    def _seek_item(self):
+        state = self._timeline.state_at(self._current_item_index)
+        if self._playing:
+            self._apply_state(state)
+        else:
+            self._pending_state = state
+
     def _start_playing(self):
         self._interface.initialize()
+        if self._pending_state is not None:
+            self._apply_state(self._pending_state)
+            self._pending_state = None
 
     def _end_playing(self):
         self._interface.blackout()
@@ -0,0 +1,132 @@
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+
+from backend.abstract_player import AbstractPlayerItem
+from backend.dmx.dmx import DMX_CHANNEL_AMOUNT, DMX_UNIVERSE_SIZE
+from backend.logger import logger
+
+
+@dataclass
+class DmxFrame(AbstractPlayerItem):
+    values: np.ndarray = None
+
+
+class DmxTimeline:
+
+    KEYFRAME_INTERVAL: int = 256
+
+    _timestamps: np.ndarray
+    _first_channels: np.ndarray
+    _span_offsets: np.ndarray
+    _spans: np.ndarray
+    _keyframes: np.ndarray
+    _keyframe_interval: int
+
+    @classmethod
+    def from_frames(cls, frames: List[DmxFrame]) -> 'DmxTimeline':
+        state = np.zeros(DMX_UNIVERSE_SIZE, dtype=np.uint8)
+        keyframes = []
+        first_channels = np.ones(len(frames), dtype=np.int64)
+        span_lengths = np.zeros(len(frames), dtype=np.int64)
+        spans = []
+        invalid_values = 0
+        for position, frame in enumerate(frames):
+            if position % cls.KEYFRAME_INTERVAL == 0:
+                keyframes.append(state.copy())
+            channels = frame.values['channel']
+            valid = (channels >= 1) & (channels <= DMX_CHANNEL_AMOUNT)
+            if not valid.all():
+                invalid_values += int((~valid).sum())
+                channels = channels[valid]
+            if not len(channels):
+                continue
+            state[channels] = frame.values['value'][valid]
+            first_channel = int(channels.min())
+            last_channel = int(channels.max())
+            first_channels[position] = first_channel
+            span_lengths[position] = last_channel - first_channel + 1
+            spans.append(state[first_channel:last_channel + 1].copy())
+        if len(frames) % cls.KEYFRAME_INTERVAL == 0:
+            keyframes.append(state.copy())
+        if invalid_values:
+            logger.warning(
+                f"Ignored {invalid_values} DMX values outside of the universe"
+            )
+
+        span_offsets = np.zeros(len(frames) + 1, dtype=np.int64)
+        np.cumsum(span_lengths, out=span_offsets[1:])
+        return cls(
+            np.array([frame.timestamp for frame in frames], dtype=np.float64),
+            first_channels,
+            span_offsets,
+            np.concatenate(spans) if spans else np.zeros(0, dtype=np.uint8),
+            np.stack(keyframes),
+            cls.KEYFRAME_INTERVAL
+        )
+
+    def __init__(
+        self, timestamps: np.ndarray, first_channels: np.ndarray,
+        span_offsets: np.ndarray, spans: np.ndarray, keyframes: np.ndarray,
+        keyframe_interval: int
+    ):
+        self._timestamps = timestamps
+        self._first_channels = first_channels
+        self._span_offsets = span_offsets
+        self._spans = spans
+        self._keyframes = keyframes
+        self._keyframe_interval = keyframe_interval
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def span(self, position: int) -> Tuple[int, np.ndarray]:
+        return (
+            int(self._first_channels[position]),
+            self._spans[
+                self._span_offsets[position]:self._span_offsets[position + 1]
+            ]
+        )
+
+    def state_at(self, position: int) -> np.ndarray:
+        keyframe_index = position // self._keyframe_interval
+        state = self._keyframes[keyframe_index].copy()
+        for delta_position in range(
+            keyframe_index * self._keyframe_interval, position
+        ):
+            first_channel, span = self.span(delta_position)
+            state[first_channel:first_channel + len(span)] = span
+        return state
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps
+
+    @property
+    def first_channels(self) -> np.ndarray:
+        return self._first_channels
+
+    @property
+    def span_offsets(self) -> np.ndarray:
+        return self._span_offsets
+
+    @property
+    def spans(self) -> np.ndarray:
+        return self._spans
+
+    @property
+    def keyframes(self) -> np.ndarray:
+        return self._keyframes
+
+    @property
+    def keyframe_interval(self) -> int:
+        return self._keyframe_interval
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            self._timestamps.nbytes + self._first_channels.nbytes
+            + self._span_offsets.nbytes + self._spans.nbytes
+            + self._keyframes.nbytes
+        )
@@ -1,9 +1,18 @@
+from collections import deque
 import ctypes
+import time
 from threading import Event, Lock, Thread
-from typing import List, Tuple
+from typing import Any, Callable, Deque, Dict, Tuple
 
+import numpy as np
 from pylibftdi import Device
 
+import backend.time_util as tu
+from backend.config import Config
+from backend.dmx.dmx_interface import DmxInterface
+from backend.logger import logger
+from backend.rl_exception import RlException
+
 
 class Timespec(ctypes.Structure):
     _fields_ = [
@@ -12,7 +21,10 @@ class Timespec(ctypes.Structure):
     ]
 
 
-class FtdiDmxInterface:
+class FtdiDmxInterface(DmxInterface):
+
+    class MissingSerial(RlException):
+        pass
 
     LIBC = ctypes.cdll.LoadLibrary("libc.so.6")
     MS_PER_S: int = 1_000_000  # ms/s
@@ -29,24 +41,56 @@ class FtdiDmxInterface:
     BREAK_OFF: int = 0
     BREAK_ON: int = 1
 
-    CHANNEL_RANGE: Tuple[int, int] = (1, 512)
-    VALUE_RANGE: Tuple[int, int] = (0, 255)
+    FRAME_LOG_SIZE: int = 256
 
-    @classmethod
-    def _wait_us(cls, microseconds: int):
-        sleep_time = Timespec(
-            seconds=microseconds // cls.MS_PER_S,
-            nanoseconds=(microseconds % cls.MS_PER_S) * cls.NS_PER_MS
-        )
-        cls.LIBC.nanosleep(ctypes.byref(sleep_time), ctypes.byref(Timespec()))
+    _interfaces: Dict[str, 'FtdiDmxInterface'] = {}
+    _interfaces_lock: Lock = Lock()
 
     @classmethod
-    def _wait_ms(cls, milliseconds: int):
-        cls._wait_us(milliseconds * cls.US_PER_MS)
+    def for_serial(cls, serial: str = None) -> 'FtdiDmxInterface':
+        with cls._interfaces_lock:
+            if serial not in cls._interfaces:
+                cls._interfaces[serial] = cls(serial)
+            return cls._interfaces[serial]
 
-    _ftdi_device: Device 
-    _dmx_channels: List[int] = [0] * (CHANNEL_RANGE[-1] + 1)
-    _highest_updated_channel: int = CHANNEL_RANGE[-1]
+    @classmethod
+    def for_universe(cls, universe: int) -> 'FtdiDmxInterface':
+        serials = [
+            serial.strip()
+            for serial in Config.get_value('dmx_serials').split(',')
+        ]
+        serial = serials[universe] if universe < len(serials) else ''
+        if not serial and universe > 0:
+            raise cls.MissingSerial(
+                f"No FTDI serial configured for DMX universe {universe}. "
+                "Set one serial per universe in 'dmx_serials'"
+            )
+        if serial and serials.count(serial) > 1:
+            raise cls.MissingSerial(
+                f"FTDI serial {serial} is configured for more than one "
+                "DMX universe"
+            )
+        if not serial and any(serials):
+            logger.warning(
+                f"No FTDI serial configured for DMX universe {universe}, "
+                "using the first device found"
+            )
+        return cls.for_serial(serial or None)
+
+    _serial: str
+    _sleep_time: Timespec
+    _remaining_time: Timespec
+
+    _ftdi_device: Device
+    _dmx_channels: bytearray
+    _dmx_view: memoryview
+    _bus_channels: bytearray
+    _bus_buffer: ctypes.Array
+    _highest_updated_channel: int
+    _refresh_rate: float
+    _keepalive_rate: float
+    _write_data: Callable[..., int]
+    _set_line_property2: Callable[..., int]
 
     _stopped: bool
 
@@ -56,124 +100,220 @@ class FtdiDmxInterface:
     _ready_event: Event
     _stop_event: Event
 
-    _initialized: bool = False
+    _initialized: bool
+
+    _started_at: float
+    _frame_starts: Deque[float]
+    _frames_written: int
+    _keepalives_written: int
+    _bus_seconds: float
+    _thread_cpu_seconds: float
+
+    def __init__(self, serial: str = None):
+        self._serial = serial
+        self._sleep_time = Timespec()
+        self._remaining_time = Timespec()
+        self._dmx_channels = bytearray(self.UNIVERSE_SIZE)
+        self._dmx_view = memoryview(self._dmx_channels)
+        self._bus_channels = bytearray(self.UNIVERSE_SIZE)
+        self._bus_buffer = (ctypes.c_ubyte * self.UNIVERSE_SIZE).from_buffer(
+            self._bus_channels
+        )
+        self._highest_updated_channel = self.CHANNEL_RANGE[-1]
+        self._lock = Lock()
+        self._initialized = False
+        self._reset_metrics()
+
+    def _reset_metrics(self):
+        self._started_at = tu.monotonic_now()
+        self._frame_starts = deque(maxlen=self.FRAME_LOG_SIZE)
+        self._frames_written = 0
+        self._keepalives_written = 0
+        self._bus_seconds = 0.0
+        self._thread_cpu_seconds = 0.0
+
+    def _wait_us(self, microseconds: int):
+        self._sleep_time.seconds = microseconds // self.MS_PER_S
+        self._sleep_time.nanoseconds = (
+            (microseconds % self.MS_PER_S) * self.NS_PER_MS
+        )
+        self.LIBC.nanosleep(
+            ctypes.byref(self._sleep_time), ctypes.byref(self._remaining_time)
+        )
 
-    @classmethod
-    def initialize(cls):
-        if cls._initialized:
+    def _wait_ms(self, milliseconds: int):
+        self._wait_us(milliseconds * self.US_PER_MS)
+
+    def initialize(self):
+        if self._initialized:
             return
-        
-        cls._ftdi_device = Device()
-        cls._ftdi_device.ftdi_fn.ftdi_set_baudrate(cls.BAUDRATE)
-        cls._ftdi_device.ftdi_fn.ftdi_set_line_property(
-            cls.BITS_8, cls.STOP_BITS_2, cls.PARITY_NONE
+
+        self._ftdi_device = Device(self._serial)
+        self._ftdi_device.ftdi_fn.ftdi_set_baudrate(self.BAUDRATE)
+        self._ftdi_device.ftdi_fn.ftdi_set_line_property(
+            self.BITS_8, self.STOP_BITS_2, self.PARITY_NONE
         )
 
-        cls._dmx_channels = [0] * (cls.CHANNEL_RANGE[-1] + 1)
-        cls._highest_updated_channel = cls.CHANNEL_RANGE[-1]
+        self._write_data = self._ftdi_device.ftdi_fn.ftdi_write_data
+        self._set_line_property2 = (
+            self._ftdi_device.ftdi_fn.ftdi_set_line_property2
+        )
 
-        cls._stopped = False
+        self._dmx_channels[:] = self.BLACKOUT
+        self._highest_updated_channel = self.CHANNEL_RANGE[-1]
+        self._refresh_rate = Config.get_constant('dmx_refresh_rate')
+        self._keepalive_rate = Config.get_constant('dmx_keepalive_rate')
+        self._reset_metrics()
 
-        cls._thread: Thread = Thread(
-            target=cls._thread_target,
-            name="ftdi_dmx_thread"
+        self._stopped = False
+
+        self._thread = Thread(
+            target=self._thread_target,
+            name=f"ftdi_dmx_thread_{self._serial or 'default'}"
         )
-        
-        cls._lock = Lock()
-        cls._render_event = Event()
-        cls._ready_event = Event()
-        cls._stop_event = Event()
 
-        cls._thread.start()
-        cls.blackout()
-        cls._ready_event.set()
+        self._render_event = Event()
+        self._ready_event = Event()
+        self._stop_event = Event()
 
-        cls._initialized = True
+        self._thread.start()
+        self.blackout()
+        self._ready_event.set()
 
-    @classmethod
-    def destroy(cls):
-        if not cls._initialized:
-            return
-        if not cls._stopped:
-            cls.stop()
-        cls._ftdi_device.close()
-        cls._initialized = False
+        self._initialized = True
 
-    @classmethod
-    def stop(cls):
-        cls.blackout()
-        cls._stop_event.set()
-        cls._thread.join()
-        cls._stopped = True
-
-    @classmethod
-    def set_channel(cls, channel: int, value: int):
-        if not (cls.CHANNEL_RANGE[0] <= channel <= cls.CHANNEL_RANGE[-1]):
+    def destroy(self):
+        if not self._initialized:
+            return
+        if not self._stopped:
+            self.stop()
+        self._ftdi_device.close()
+        self._initialized = False
+
+    def stop(self):
+        self.blackout()
+        self._stop_event.set()
+        self.render()
+        self._thread.join()
+        self._stopped = True
+
+    def set_channel(self, channel: int, value: int):
+        if not (self.CHANNEL_RANGE[0] <= channel <= self.CHANNEL_RANGE[-1]):
             raise ValueError(f"Channel {channel} out of range.")
-        if not (cls.VALUE_RANGE[0] <= value <= cls.VALUE_RANGE[-1]):
+        if not (self.VALUE_RANGE[0] <= value <= self.VALUE_RANGE[-1]):
             raise ValueError(f"Value {value} out of range.")
 
-        with cls._lock:
-            cls._dmx_channels[channel] = value
-            cls._highest_updated_channel = max(
-                cls._highest_updated_channel, channel
+        with self._lock:
+            self._dmx_channels[channel] = value
+            self._highest_updated_channel = max(
+                self._highest_updated_channel, channel
             )
 
-    @classmethod
-    def get_channel(cls, channel: int) -> int:
-        if not (cls.CHANNEL_RANGE[0] <= channel <= cls.CHANNEL_RANGE[-1]):
-            raise ValueError(f"Channel {channel} out of range.")
+    def set_channels(self, first_channel: int, values: bytes):
+        last_channel = first_channel + len(values) - 1
+        self._raise_for_channels(first_channel, last_channel)
 
-        with cls._lock:
-            return cls._dmx_channels[channel]
-
-    @classmethod
-    def blackout(cls):
-        with cls._lock:
-            cls._dmx_channels = [0] * (cls.CHANNEL_RANGE[-1] + 1)
-            cls._highest_updated_channel = cls.CHANNEL_RANGE[-1]
-        cls.render()
-
-    @classmethod
-    def render(cls):
-        with cls._lock:
-            cls._render_event.set()
+        with self._lock:
+            self._dmx_view[first_channel:last_channel + 1] = values
+            self._highest_updated_channel = max(
+                self._highest_updated_channel, last_channel
+            )
 
-    @classmethod
-    def _write_to_bus(cls):
-        data = bytes(cls._dmx_channels[:cls._highest_updated_channel + 1])
+    def get_channel(self, channel: int) -> int:
+        if not (self.CHANNEL_RANGE[0] <= channel <= self.CHANNEL_RANGE[-1]):
+            raise ValueError(f"Channel {channel} out of range.")
 
-        cls._ftdi_device.ftdi_fn.ftdi_set_line_property2(
-            cls.BITS_8, cls.STOP_BITS_2, cls.PARITY_NONE, cls.BREAK_ON
+        with self._lock:
+            return self._dmx_channels[channel]
+
+    def blackout(self):
+        with self._lock:
+            self._dmx_channels[:] = self.BLACKOUT
+            self._highest_updated_channel = self.CHANNEL_RANGE[-1]
+        self.render()
+
+    def render(self):
+        with self._lock:
+            self._render_event.set()
+
+    @property
+    def serial(self) -> str:
+        return self._serial
+
+    def get_state(self) -> Dict[str, Any]:
+        with self._lock:
+            frame_starts = list(self._frame_starts)
+        frame_intervals = np.diff(np.array(frame_starts)) * 1e3
+        elapsed = max(tu.monotonic_now() - self._started_at, 1e-9)
+        return {
+            'serial': self._serial,
+            'refresh_rate': self._refresh_rate if self._initialized else None,
+            'keepalive_rate': (
+                self._keepalive_rate if self._initialized else None
+            ),
+            'frames_written': self._frames_written,
+            'keepalives_written': self._keepalives_written,
+            'bus_seconds': self._bus_seconds,
+            'thread_cpu_percent': self._thread_cpu_seconds / elapsed * 100,
+            'frame_interval_ms': {
+                'p50': float(np.percentile(frame_intervals, 50)),
+                'p99': float(np.percentile(frame_intervals, 99)),
+                'max': float(frame_intervals.max())
+            } if len(frame_intervals) else None
+        }
+
+    def _write_to_bus(self, length: int):
+        self._set_line_property2(
+            self.BITS_8, self.STOP_BITS_2, self.PARITY_NONE, self.BREAK_ON
         )
-        cls._wait_us(cls.BUS_TIMINGS[0])
-        cls._ftdi_device.ftdi_fn.ftdi_set_line_property2(
-            cls.BITS_8, cls.STOP_BITS_2, cls.PARITY_NONE, cls.BREAK_OFF
+        self._wait_us(self.BUS_TIMINGS[0])
+        self._set_line_property2(
+            self.BITS_8, self.STOP_BITS_2, self.PARITY_NONE, self.BREAK_OFF
         )
-        cls._wait_us(cls.BUS_TIMINGS[1])
-        cls._ftdi_device.write(data)
-        cls._wait_ms(cls.BUS_TIMINGS[2])
-
-        cls._highest_updated_channel = 0
-
-    @classmethod
-    def _thread_target(cls):
-        while not cls._ready_event.is_set():
-            cls._wait_ms(cls.TIME_RESOLUTION)
-
+        self._wait_us(self.BUS_TIMINGS[1])
+        self._write_data(self._bus_buffer, length)
+        self._wait_ms(self.BUS_TIMINGS[2])
+
+    def _thread_target(self):
+        while not self._ready_event.is_set():
+            self._wait_ms(self.TIME_RESOLUTION)
+
+        cpu_start = time.thread_time()
+        refresh_interval = 1.0 / self._refresh_rate
+        keepalive_interval = 1.0 / self._keepalive_rate
+        next_frame_at = tu.monotonic_now()
+        last_frame_at = next_frame_at
         while True:
-            if cls._render_event.is_set():
-                with cls._lock:
-                    cls._write_to_bus()
-                    cls._render_event.clear()
+            now = tu.monotonic_now()
+            if now < next_frame_at:
+                self._wait_us(int((next_frame_at - now) * self.MS_PER_S))
+            self._render_event.wait(
+                max(last_frame_at + keepalive_interval - tu.monotonic_now(), 0.0)
+            )
 
-            elif cls._stop_event.is_set():
+            with self._lock:
+                changed = self._render_event.is_set()
+                self._render_event.clear()
+                stopping = self._stop_event.is_set()
+                self._bus_channels[:] = self._dmx_channels
+                length = (
+                    self._highest_updated_channel + 1
+                    if changed else self.UNIVERSE_SIZE
+                )
+                self._highest_updated_channel = 0
+
+            frame_at = tu.monotonic_now()
+            self._write_to_bus(length)
+            bus_seconds = tu.monotonic_now() - frame_at
+
+            with self._lock:
+                self._bus_seconds += bus_seconds
+                self._frame_starts.append(frame_at)
+                self._frames_written += 1
+                self._keepalives_written += not changed
+                self._thread_cpu_seconds = time.thread_time() - cpu_start
+            next_frame_at = frame_at + refresh_interval
+            last_frame_at = frame_at
+
+            if stopping:
                 break
-
-            else:
-                with cls._lock:
-                    tmp_highest_updated_channel = cls._highest_updated_channel
-                    cls._highest_updated_channel = 0
-                    cls._write_to_bus()
-                    cls._highest_updated_channel = tmp_highest_updated_channel
-                cls._wait_ms(cls.TIME_RESOLUTION)
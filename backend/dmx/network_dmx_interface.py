@@ -0,0 +1,354 @@
+from abc import ABC, abstractmethod
+import socket
+import struct
+import uuid
+from threading import Event, Lock, Thread
+from typing import Any, Dict, Set, Tuple, Type
+
+import backend.time_util as tu
+from backend.config import Config
+from backend.dmx.dmx_interface import DmxInterface
+from backend.logger import logger
+from backend.rl_exception import RlException
+
+
+class DmxPacket(ABC):
+
+    PORT: int
+    HEADER_SIZE: int
+    SEQUENCE_OFFSET: int
+    SLOT_AMOUNT: int = DmxInterface.CHANNEL_RANGE[-1]
+
+    _buffer: bytearray
+    _slots: memoryview
+    _sequence: int
+
+    def __init__(self, universe: int, source_name: str):
+        self._buffer = bytearray(self.HEADER_SIZE + self.SLOT_AMOUNT)
+        self._slots = memoryview(self._buffer)[self.HEADER_SIZE:]
+        self._sequence = 0
+        self._write_header(universe, source_name)
+
+    @abstractmethod
+    def _write_header(self, universe: int, source_name: str):
+        raise NotImplementedError("@abstractmethod")
+
+    @abstractmethod
+    def _next_sequence(self) -> int:
+        raise NotImplementedError("@abstractmethod")
+
+    @classmethod
+    @abstractmethod
+    def default_host(cls, universe: int) -> str:
+        raise NotImplementedError("@abstractmethod")
+
+    def advance_sequence(self):
+        self._sequence = self._next_sequence()
+        self._buffer[self.SEQUENCE_OFFSET] = self._sequence
+
+    @property
+    def buffer(self) -> bytearray:
+        return self._buffer
+
+    @property
+    def slots(self) -> memoryview:
+        return self._slots
+
+
+class ArtNetPacket(DmxPacket):
+
+    PORT: int = 6454
+    HEADER_SIZE: int = 18
+    SEQUENCE_OFFSET: int = 12
+    ID: bytes = b"Art-Net\x00"
+    OP_DMX: int = 0x5000
+    PROTOCOL_VERSION: int = 14
+    PORT_ADDRESS_MASK: int = 0x7FFF
+    BROADCAST_HOST: str = "255.255.255.255"
+
+    def _write_header(self, universe: int, source_name: str):
+        struct.pack_into('<8sH', self._buffer, 0, self.ID, self.OP_DMX)
+        struct.pack_into('>H', self._buffer, 10, self.PROTOCOL_VERSION)
+        struct.pack_into(
+            '<H', self._buffer, 14, universe & self.PORT_ADDRESS_MASK
+        )
+        struct.pack_into('>H', self._buffer, 16, self.SLOT_AMOUNT)
+
+    def _next_sequence(self) -> int:
+        return self._sequence % 255 + 1
+
+    @classmethod
+    def default_host(cls, universe: int) -> str:
+        return cls.BROADCAST_HOST
+
+
+class SacnPacket(DmxPacket):
+
+    PORT: int = 5568
+    HEADER_SIZE: int = 126
+    SEQUENCE_OFFSET: int = 111
+    ACN_ID: bytes = b"ASC-E1.17\x00\x00\x00"
+    FLAGS: int = 0x7000
+    VECTOR_ROOT_DATA: int = 0x00000004
+    VECTOR_FRAMING_DATA: int = 0x00000002
+    VECTOR_DMP_SET_PROPERTY: int = 0x02
+    ADDRESS_TYPE: int = 0xA1
+    PRIORITY: int = 100
+    ROOT_OFFSET: int = 16
+    FRAMING_OFFSET: int = 38
+    DMP_OFFSET: int = 115
+
+    def _write_header(self, universe: int, source_name: str):
+        length = len(self._buffer)
+        cid = uuid.uuid5(uuid.NAMESPACE_OID, source_name).bytes
+        struct.pack_into(
+            '>HH12sHI16s', self._buffer, 0,
+            0x0010, 0x0000, self.ACN_ID,
+            self.FLAGS | (length - self.ROOT_OFFSET),
+            self.VECTOR_ROOT_DATA, cid
+        )
+        struct.pack_into(
+            '>HI64sBHBBH', self._buffer, self.FRAMING_OFFSET,
+            self.FLAGS | (length - self.FRAMING_OFFSET),
+            self.VECTOR_FRAMING_DATA, source_name.encode('utf-8')[:63],
+            self.PRIORITY, 0, 0, 0, self.sacn_universe(universe)
+        )
+        struct.pack_into(
+            '>HBBHHHB', self._buffer, self.DMP_OFFSET,
+            self.FLAGS | (length - self.DMP_OFFSET),
+            self.VECTOR_DMP_SET_PROPERTY, self.ADDRESS_TYPE,
+            0x0000, 0x0001, self.SLOT_AMOUNT + 1, 0
+        )
+
+    def _next_sequence(self) -> int:
+        return (self._sequence + 1) % 256
+
+    @staticmethod
+    def sacn_universe(universe: int) -> int:
+        return universe + 1
+
+    @classmethod
+    def default_host(cls, universe: int) -> str:
+        sacn_universe = cls.sacn_universe(universe)
+        return f"239.255.{sacn_universe >> 8}.{sacn_universe & 0xFF}"
+
+
+class NetworkDmxSender:
+
+    class InvalidProtocol(RlException):
+        pass
+
+    PACKET_TYPES: Dict[str, Type[DmxPacket]] = {
+        'artnet': ArtNetPacket,
+        'sacn': SacnPacket
+    }
+    KEEPALIVE_INTERVAL: float = 1.0
+    MULTICAST_TTL: int = 8
+
+    _senders: Dict[Tuple[str, str], 'NetworkDmxSender'] = {}
+    _senders_lock: Lock = Lock()
+
+    @classmethod
+    def for_target(
+        cls, protocol: str, target: str = ""
+    ) -> 'NetworkDmxSender':
+        if protocol not in cls.PACKET_TYPES:
+            raise cls.InvalidProtocol(
+                f"Unknown DMX network protocol '{protocol}'"
+            )
+        with cls._senders_lock:
+            if (protocol, target) not in cls._senders:
+                cls._senders[(protocol, target)] = cls(protocol, target)
+            return cls._senders[(protocol, target)]
+
+    _key: Tuple[str, str]
+    _packet_type: Type[DmxPacket]
+    _host: str
+    _port: int
+    _source_name: str
+    _packets: Dict[int, DmxPacket]
+    _destinations: Dict[int, Tuple[str, int]]
+    _open_universes: Set[int]
+    _dirty_universes: Set[int]
+
+    _socket: socket.socket
+    _thread: Thread
+    _lock: Lock
+    _render_event: Event
+    _stop_event: Event
+
+    _packets_sent: int
+    _send_errors: int
+
+    def __init__(self, protocol: str, target: str = ""):
+        self._key = (protocol, target)
+        self._packet_type = self.PACKET_TYPES[protocol]
+        host, _, port = target.partition(':')
+        self._host = host or None
+        self._port = int(port) if port else self._packet_type.PORT
+        self._source_name = Config.get_value('device_id')
+        self._packets = {}
+        self._destinations = {}
+        self._open_universes = set()
+        self._dirty_universes = set()
+        self._socket = None
+        self._thread = None
+        self._lock = Lock()
+        self._render_event = Event()
+        self._stop_event = Event()
+        self._packets_sent = 0
+        self._send_errors = 0
+
+    def _packet(self, universe: int) -> DmxPacket:
+        if universe not in self._packets:
+            self._packets[universe] = self._packet_type(
+                universe, self._source_name
+            )
+            self._destinations[universe] = (
+                self._host or self._packet_type.default_host(universe),
+                self._port
+            )
+        return self._packets[universe]
+
+    def open(self, universe: int):
+        with self._lock:
+            self._packet(universe)
+            self._open_universes.add(universe)
+            if self._socket is not None:
+                return
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            self._socket.setsockopt(
+                socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, self.MULTICAST_TTL
+            )
+            self._stop_event.clear()
+            self._thread = Thread(
+                target=self._thread_target, name="network_dmx_thread"
+            )
+            self._thread.start()
+
+    def close(self, universe: int):
+        with self._senders_lock, self._lock:
+            self._open_universes.discard(universe)
+            if self._open_universes or self._socket is None:
+                return
+            if self._senders.get(self._key) is self:
+                del self._senders[self._key]
+            self._stop_event.set()
+            self._render_event.set()
+        self._thread.join()
+        with self._lock:
+            self._socket.close()
+            self._socket = None
+            self._thread = None
+
+    def set_channels(self, universe: int, first_channel: int, values: bytes):
+        with self._lock:
+            self._packet(universe).slots[
+                first_channel - 1:first_channel - 1 + len(values)
+            ] = values
+
+    def blackout(self, universe: int):
+        with self._lock:
+            self._packet(universe).slots[:] = bytes(DmxPacket.SLOT_AMOUNT)
+        self.render(universe)
+
+    def render(self, universe: int):
+        with self._lock:
+            self._dirty_universes.add(universe)
+            self._render_event.set()
+
+    def get_state(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'universes': sorted(self._open_universes),
+                'packets_sent': self._packets_sent,
+                'send_errors': self._send_errors
+            }
+
+    def _send(self, universes: Set[int]):
+        for universe in sorted(universes):
+            packet = self._packets[universe]
+            packet.advance_sequence()
+            try:
+                self._socket.sendto(
+                    packet.buffer, self._destinations[universe]
+                )
+                self._packets_sent += 1
+            except OSError:
+                if not self._send_errors:
+                    logger.exception(
+                        f"Error sending DMX universe {universe} to "
+                        f"{self._destinations[universe]}"
+                    )
+                self._send_errors += 1
+
+    def _thread_target(self):
+        next_keepalive = tu.monotonic_now() + self.KEEPALIVE_INTERVAL
+        while True:
+            self._render_event.wait(
+                max(next_keepalive - tu.monotonic_now(), 0.0)
+            )
+            with self._lock:
+                self._render_event.clear()
+                if self._stop_event.is_set():
+                    self._send(self._open_universes | self._dirty_universes)
+                    self._dirty_universes.clear()
+                    break
+                now = tu.monotonic_now()
+                if now >= next_keepalive:
+                    universes = set(self._open_universes)
+                    next_keepalive = now + self.KEEPALIVE_INTERVAL
+                else:
+                    universes = self._dirty_universes & self._open_universes
+                self._dirty_universes.clear()
+                self._send(universes)
+
+
+class NetworkDmxInterface(DmxInterface):
+
+    @classmethod
+    def for_universe(
+        cls, protocol: str, universe: int
+    ) -> 'NetworkDmxInterface':
+        return cls(
+            NetworkDmxSender.for_target(
+                protocol, Config.get_value('dmx_target')
+            ),
+            universe
+        )
+
+    _sender: NetworkDmxSender
+    _universe: int
+    _initialized: bool
+
+    def __init__(self, sender: NetworkDmxSender, universe: int):
+        self._sender = sender
+        self._universe = universe
+        self._initialized = False
+
+    def initialize(self):
+        if self._initialized:
+            return
+        self._sender.open(self._universe)
+        self._initialized = True
+
+    def destroy(self):
+        if not self._initialized:
+            return
+        self.blackout()
+        self._sender.close(self._universe)
+        self._initialized = False
+
+    def set_channels(self, first_channel: int, values: bytes):
+        self._raise_for_channels(first_channel, first_channel + len(values) - 1)
+        self._sender.set_channels(self._universe, first_channel, values)
+
+    def blackout(self):
+        self._sender.blackout(self._universe)
+
+    def render(self):
+        self._sender.render(self._universe)
+
+    def get_state(self) -> Dict[str, Any]:
+        return self._sender.get_state()
@@ -4,6 +4,7 @@ from flask_cors import CORS
 
 from backend.config import Config
 from backend.endpoints.util import handle_exceptions, log_request
+from backend.hardware import Hardware
 from backend.system import System
 
 device_bp = Blueprint('device_blueprint', __name__)
@@ -22,6 +23,18 @@ def route_discover():
     ))
 
 
+@device_bp.route(
+    "/hardware/registers", methods=['GET'], endpoint='hardware_registers'
+)
+@handle_exceptions
+@log_request
+def route_hardware_registers():
+    return make_response((
+        Hardware.register_snapshot(),
+        status.HTTP_200_OK
+    ))
+
+
 @device_bp.route(
     "/shutdown", methods=['POST'], endpoint='shutdown'
 )
@@ -105,7 +105,8 @@ def route_program_local():
 def route_program_control():
     action = request.get_json(force=True)['action']
     if action == 'run':
-        Controller.run_program()
+        offset = float(request.get_json(force=True).get('offset', 0.0))
+        Controller.run_program(offset)
     elif action == 'pause':
         Controller.pause_program()
     elif action == 'continue':
@@ -0,0 +1,212 @@
+from operator import itemgetter
+from string import ascii_lowercase
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from backend.address import Address
+
+
+class FuseTable:
+
+    KEYS: Tuple[str, ...] = (
+        'name', 'device_id', 'letter', 'number', 'timestamp'
+    )
+
+    _indices: np.ndarray
+    _names: List[str]
+    _device_ids: np.ndarray
+    _letters: np.ndarray
+    _numbers: np.ndarray
+    _timestamps: np.ndarray
+    _errors: List[Tuple[int, str]]
+    _groups: Dict[str, np.ndarray]
+
+    @classmethod
+    def from_json(cls, json_data: List[Dict[str, Any]]) -> 'FuseTable':
+        table = cls()
+        get_columns = itemgetter(*cls.KEYS)
+        try:
+            if set(map(type, json_data)) - {dict}:
+                raise TypeError()
+            rows = list(map(get_columns, json_data))
+            indices = range(len(rows))
+        except (TypeError, KeyError):
+            rows, indices = table._checked_rows(json_data)
+
+        table._indices = np.array(indices, dtype=np.int64)
+        if rows:
+            names, device_ids, letters, numbers, timestamps = zip(*rows)
+        else:
+            names = device_ids = letters = numbers = timestamps = ()
+
+        table._names = list(names)
+        table._string_column('name', names)
+        table._device_ids, _ = table._string_column(
+            'device_id', device_ids, lower=True
+        )
+        table._letters, letter_is_string = table._string_column(
+            'letter', letters, lower=True
+        )
+        table._validate_letters(letter_is_string)
+        table._numbers = table._numeric_column(
+            'number', numbers, np.int64, "an integer"
+        )
+        table._validate_numbers()
+        table._timestamps = table._numeric_column(
+            'timestamp', timestamps, np.float64, "a float"
+        )
+        table._validate_timestamps()
+        table._errors.sort(key=itemgetter(0))
+        return table
+
+    def _checked_rows(
+        self, json_data: List[Dict[str, Any]]
+    ) -> Tuple[List[Tuple], List[int]]:
+        get_columns = itemgetter(*self.KEYS)
+        required_keys = set(self.KEYS)
+        rows = []
+        indices = []
+        for idx, event in enumerate(json_data):
+            if not isinstance(event, dict):
+                self._errors.append((idx, "has to be a dict!"))
+            elif not required_keys <= event.keys():
+                self._errors.extend(
+                    (idx, f"Key '{key}' missing!")
+                    for key in self.KEYS if key not in event
+                )
+            else:
+                indices.append(idx)
+                rows.append(get_columns(event))
+        return rows, indices
+
+    def __init__(self):
+        self._indices = np.zeros(0, dtype=np.int64)
+        self._names = []
+        self._device_ids = np.zeros(0, dtype=str)
+        self._letters = np.zeros(0, dtype=str)
+        self._numbers = np.zeros(0, dtype=np.int64)
+        self._timestamps = np.zeros(0, dtype=np.float64)
+        self._errors = []
+        self._groups = None
+
+    def _add_errors(self, invalid: np.ndarray, message: str):
+        self._errors.extend(
+            (idx, message) for idx in self._indices[invalid].tolist()
+        )
+
+    def _string_column(
+        self, key: str, column: Tuple, lower: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        is_string = np.ones(len(column), dtype=bool)
+        if set(map(type, column)) - {str}:
+            is_string = np.fromiter(
+                (isinstance(value, str) for value in column),
+                dtype=bool, count=len(column)
+            )
+            self._add_errors(~is_string, f"'{key}' has to be a string!")
+            column = [
+                value if valid else ""
+                for value, valid in zip(column, is_string)
+            ]
+        if lower:
+            column = list(map(str.lower, column))
+        return np.array(column, dtype=str), is_string
+
+    def _numeric_column(
+        self, key: str, column: Tuple, dtype: type, type_name: str
+    ) -> np.ndarray:
+        try:
+            floats = np.array(column, dtype=np.float64)
+            if floats.ndim != 1:
+                raise ValueError()
+        except (TypeError, ValueError, OverflowError):
+            floats = np.fromiter(
+                map(self._to_float, column),
+                dtype=np.float64, count=len(column)
+            )
+        is_valid = np.isfinite(floats)
+        if dtype is np.int64:
+            is_valid &= floats == np.floor(floats)
+        self._add_errors(~is_valid, f"'{key}' has to be {type_name}!")
+        return np.where(is_valid, floats, 0.0).astype(dtype)
+
+    @staticmethod
+    def _to_float(value: Any) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError, OverflowError):
+            return np.nan
+
+    def _validate_letters(self, is_string: np.ndarray):
+        invalid = ~np.isin(self._letters, list(ascii_lowercase))
+        invalid &= is_string
+        self._add_errors(invalid, "'letter' has to be an ascii letter!")
+
+    def _validate_numbers(self):
+        invalid = (
+            (self._numbers < 0)
+            | (self._numbers >= Address.NUMBERS_PER_LETTER)
+        )
+        for idx, number in zip(
+            self._indices[invalid].tolist(), self._numbers[invalid].tolist()
+        ):
+            self._errors.append((idx, f"'number' {number} out of range!"))
+
+    def _validate_timestamps(self):
+        invalid = self._timestamps < 0.0
+        for idx, timestamp in zip(
+            self._indices[invalid].tolist(),
+            self._timestamps[invalid].tolist()
+        ):
+            self._errors.append(
+                (idx, f"'timestamp' {timestamp} is negative!")
+            )
+
+    def group_by_device_id(self) -> Dict[str, np.ndarray]:
+        if self._groups is None:
+            device_ids, inverse = np.unique(
+                self._device_ids, return_inverse=True
+            )
+            order = np.argsort(inverse, kind='stable')
+            bounds = np.cumsum(
+                np.bincount(inverse, minlength=len(device_ids))
+            )[:-1]
+            self._groups = dict(
+                zip(device_ids.tolist(), np.split(order, bounds))
+            )
+        return self._groups
+
+    def rows_for(self, device_id: str) -> np.ndarray:
+        rows = self.group_by_device_id().get(
+            device_id.lower(), np.zeros(0, dtype=np.int64)
+        )
+        return rows[np.argsort(self._timestamps[rows], kind='stable')]
+
+    def events_for(
+        self, device_id: str
+    ) -> List[Tuple[str, str, int, float]]:
+        rows = self.rows_for(device_id)
+        return list(zip(
+            [self._names[row] for row in rows.tolist()],
+            self._letters[rows].tolist(),
+            self._numbers[rows].tolist(),
+            self._timestamps[rows].tolist()
+        ))
+
+    def split_json(
+        self, json_data: List[Dict[str, Any]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        return {
+            device_id: [
+                json_data[idx] for idx in self._indices[rows].tolist()
+            ]
+            for device_id, rows in self.group_by_device_id().items()
+        }
+
+    @property
+    def errors(self) -> List[str]:
+        return [f"Element {idx}: {message}" for idx, message in self._errors]
+
+    def __len__(self) -> int:
+        return len(self._indices)
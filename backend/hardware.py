@@ -1,9 +1,10 @@
 from functools import wraps
-from threading import Lock
-from typing import Dict
+from threading import Lock, Thread
+from typing import Dict, List, Tuple
 
 from smbus2 import SMBus
 
+import backend.time_util as tu
 from backend.address import Address
 from backend.config import Config
 from backend.instance import Instance
@@ -13,27 +14,51 @@ from backend.rl_exception import RlException
 
 class DummySMBus:
 
+    REGISTER_AMOUNT: int = 0x1f
+    REGISTER_ADDRESS_MASK: int = 0x1f
+    INITIAL_LOCK_VALUE: int = 0x10
+
     _chip_count = Config.get_value('chip_amount')
-    _locked: Dict[int, bool]
+    _registers: List[List[int]]
 
     def __init__(self, _):
-        self._locked = [True for _ in range(self._chip_count)]
+        self._registers = [
+            [0x00] * self.REGISTER_AMOUNT for _ in range(self._chip_count)
+        ]
+        for registers in self._registers:
+            registers[Address.LOCK_ADDRESS] = self.INITIAL_LOCK_VALUE
+
+    def _chip_registers(self, chip_address: int) -> List[int]:
+        return self._registers[chip_address - Address.BASE_CHIP_ADDRESS]
+
+    def _register_index(self, register_address: int, offset: int) -> int:
+        return (
+            (register_address & self.REGISTER_ADDRESS_MASK) + offset
+        ) % self.REGISTER_AMOUNT
 
     def write_byte_data(
         self, chip_address: int, register_address: int, value: int
     ):
-        if register_address == 0x00:
-            self._locked[chip_address - Address.BASE_CHIP_ADDRESS] = \
-                value & Hardware.LOCK_VALUE
+        self.write_i2c_block_data(chip_address, register_address, [value])
 
     def read_byte_data(self, chip_address: int, register_address: int) -> int:
-        if register_address == 0x00:
-            return (
-                Hardware.LOCK_VALUE
-                if self._locked[chip_address - Address.BASE_CHIP_ADDRESS]
-                else 0x00
-            )
-        return 0x00
+        return self.read_i2c_block_data(chip_address, register_address, 1)[0]
+
+    def write_i2c_block_data(
+        self, chip_address: int, register_address: int, data: List[int]
+    ):
+        registers = self._chip_registers(chip_address)
+        for offset, value in enumerate(data):
+            registers[self._register_index(register_address, offset)] = value
+
+    def read_i2c_block_data(
+        self, chip_address: int, register_address: int, length: int
+    ) -> List[int]:
+        registers = self._chip_registers(chip_address)
+        return [
+            registers[self._register_index(register_address, offset)]
+            for offset in range(length)
+        ]
 
 
 def lock_bus(func):
@@ -41,10 +66,11 @@ def lock_bus(func):
     def wrapper(*args, **kwargs):
         Hardware._lock.acquire(blocking=True)
         logger.debug("Bus locked")
-        result = func(*args, **kwargs)
-        Hardware._lock.release()
-        logger.debug("Bus unlocked")
-        return result
+        try:
+            return func(*args, **kwargs)
+        finally:
+            Hardware._lock.release()
+            logger.debug("Bus unlocked")
     return wrapper
 
 
@@ -56,8 +82,18 @@ class Hardware:
     BUS_ADDRESS: int = Config.get_constant('bus_address')
     LOCK_VALUE: int = 0x10
     UNLOCK_VALUE: int = 0x00
+    AUTO_INCREMENT_FLAG: int = 0x80
+    REGISTER_AMOUNT: int = 0x1f
+    VERIFICATION_PERIOD: float = Config.get_constant(
+        'hardware_verification_period'
+    )
 
     _lock: Lock = Lock()
+    _shadow: Dict[int, List[int]] = None
+    _in_flight: Dict[int, List[int]] = {}
+    _locked: bool = None
+    _locked_known: bool = False
+    _verification_thread: Thread = None
 
     if Instance.on_pi():
         BUS: SMBus = SMBus(BUS_ADDRESS)
@@ -77,24 +113,113 @@ class Hardware:
         logger.debug(f"Read from {chip_address:02x}::{register_address:02x}")
         return cls.BUS.read_byte_data(chip_address, register_address)
 
+    @classmethod
+    def _write_block(
+        cls, chip_address: int, register_address: int, values: List[int]
+    ):
+        logger.debug(
+            f"Write values {bytes(values).hex()} to "
+            f"{chip_address:02x}::{register_address:02x}+"
+        )
+        cls.BUS.write_i2c_block_data(
+            chip_address, register_address | cls.AUTO_INCREMENT_FLAG, values
+        )
+
+    @classmethod
+    def _read_block(
+        cls, chip_address: int, register_address: int, length: int
+    ) -> List[int]:
+        logger.debug(
+            f"Read {length} bytes from "
+            f"{chip_address:02x}::{register_address:02x}+"
+        )
+        return list(cls.BUS.read_i2c_block_data(
+            chip_address, register_address | cls.AUTO_INCREMENT_FLAG, length
+        ))
+
+    @classmethod
+    def _read_fuse_registers(cls, chip_address: int) -> List[int]:
+        return cls._read_block(
+            chip_address, Address.FUSE_ADDRESSES[0],
+            len(Address.FUSE_ADDRESSES)
+        )
+
+    @classmethod
+    def _load_shadow(cls):
+        if cls._shadow is not None:
+            return
+        logger.debug("Load shadow registers")
+        cls._shadow = {
+            chip_address: cls._read_fuse_registers(chip_address)
+            for chip_address in Address.all_chip_addresses()
+        }
+
+    @classmethod
+    def _flush_shadow(cls, chip_address: int, first: int, last: int):
+        registers = cls._shadow[chip_address]
+        if first == last:
+            cls._write(
+                chip_address, Address.FUSE_ADDRESSES[first], registers[first]
+            )
+        else:
+            cls._write_block(
+                chip_address, Address.FUSE_ADDRESSES[first],
+                registers[first:last + 1]
+            )
+
+    @classmethod
+    def _apply_masks(cls, addresses: List[Address], set_bits: bool) -> float:
+        cls._load_shadow()
+        changed_registers: Dict[int, List[int]] = {}
+        for (chip_address, register_address), mask in (
+            cls._register_masks(addresses).items()
+        ):
+            index = Address.FUSE_ADDRESSES.index(register_address)
+            in_flight = cls._in_flight.setdefault(
+                chip_address, [0x00] * len(Address.FUSE_ADDRESSES)
+            )
+            if set_bits:
+                cls._shadow[chip_address][index] |= mask
+                in_flight[index] |= mask
+            else:
+                cls._shadow[chip_address][index] &= 0xff - mask
+                in_flight[index] &= 0xff - mask
+            changed_registers.setdefault(chip_address, []).append(index)
+
+        write_timestamps = []
+        try:
+            for chip_address, indices in changed_registers.items():
+                cls._flush_shadow(chip_address, min(indices), max(indices))
+                write_timestamps.append(tu.monotonic_now())
+        except Exception:
+            cls._shadow = None
+            raise
+        if not write_timestamps:
+            return 0.0
+        return write_timestamps[-1] - write_timestamps[0]
+
     @classmethod
     @lock_bus
     def lock(cls):
         logger.debug("Lock Hardware")
+        cls._locked_known = False
         for chip_address in Address.all_chip_addresses():
             cls._write(chip_address, Address.LOCK_ADDRESS, cls.LOCK_VALUE)
+        cls._locked = True
+        cls._locked_known = True
 
     @classmethod
     @lock_bus
     def unlock(cls):
         logger.debug("Unlock Hardware")
+        cls._locked_known = False
         for chip_address in Address.all_chip_addresses():
             cls._write(chip_address, Address.LOCK_ADDRESS, cls.UNLOCK_VALUE)
+        cls._locked = False
+        cls._locked_known = True
 
     @classmethod
-    @lock_bus
-    def is_locked(cls) -> bool:
-        logger.debug("Check Lock Status")
+    def _read_locked_state(cls) -> bool:
         locked_states = []
         for chip_address in Address.all_chip_addresses():
             register_value = cls._read(chip_address, Address.LOCK_ADDRESS)
@@ -105,22 +230,122 @@ class Hardware:
             return False
         return None
 
+    @classmethod
+    def is_locked(cls) -> bool:
+        cls._ensure_verification()
+        if not cls._locked_known:
+            return cls.verify_lock()
+        return cls._locked
+
     @classmethod
     @lock_bus
-    def light(cls, address: Address):
-        logger.debug(f"Light {address}")
-        value = cls._read(address.chip_address, address.register_address)
-        value &= address.rev_register_mask
-        value |= address.register_mask
-        cls._write(address.chip_address, address.register_address, value)
+    def verify_lock(cls) -> bool:
+        logger.debug("Check Lock Status")
+        locked = cls._read_locked_state()
+        if cls._locked_known and locked != cls._locked:
+            logger.warning(
+                f"Cached lock state {cls._locked} differs "
+                f"from hardware lock state {locked}"
+            )
+        cls._locked = locked
+        cls._locked_known = True
+        return locked
+
+    @classmethod
+    def _ensure_verification(cls):
+        if cls._verification_thread is not None:
+            return
+        with cls._lock:
+            if cls._verification_thread is not None:
+                return
+            cls._verification_thread = Thread(
+                target=cls._verification_handler,
+                name="hardware_verification",
+                daemon=True
+            )
+            cls._verification_thread.start()
+
+    @classmethod
+    def _verification_handler(cls):
+        while True:
+            tu.sleep(cls.VERIFICATION_PERIOD)
+            try:
+                cls.verify_lock()
+                cls.reconcile()
+            except Exception:
+                logger.exception("Exception while verifying hardware")
 
     @classmethod
     @lock_bus
+    def register_snapshot(cls) -> Dict[str, List[int]]:
+        logger.debug("Read register snapshot")
+        return {
+            f"{chip_address:02x}": cls._read_block(
+                chip_address, 0x00, cls.REGISTER_AMOUNT
+            )
+            for chip_address in Address.all_chip_addresses()
+        }
+
+    @staticmethod
+    def _register_masks(
+        addresses: List[Address]
+    ) -> Dict[Tuple[int, int], int]:
+        masks = {}
+        for address in addresses:
+            key = (address.chip_address, address.register_address)
+            masks[key] = masks.get(key, 0) | address.register_mask
+        return masks
+
+    @classmethod
+    def light(cls, address: Address):
+        cls.light_many([address])
+
+    @classmethod
     def unlight(cls, address: Address):
-        logger.debug(f"Unlight {address}")
-        value = cls._read(address.chip_address, address.register_address)
-        value &= address.rev_register_mask
-        cls._write(address.chip_address, address.register_address, value)
+        cls.unlight_many([address])
+
+    @classmethod
+    @lock_bus
+    def light_many(cls, addresses: List[Address]) -> float:
+        logger.debug(f"Light {', '.join(str(a) for a in addresses)}")
+        return cls._apply_masks(addresses, set_bits=True)
+
+    @classmethod
+    @lock_bus
+    def unlight_many(cls, addresses: List[Address]):
+        logger.debug(f"Unlight {', '.join(str(a) for a in addresses)}")
+        cls._apply_masks(addresses, set_bits=False)
+
+    @classmethod
+    @lock_bus
+    def reconcile(cls) -> bool:
+        logger.debug("Reconcile shadow registers")
+        if cls._shadow is None:
+            cls._load_shadow()
+            return True
+        in_sync = True
+        for chip_address, registers in cls._shadow.items():
+            chip_registers = cls._read_fuse_registers(chip_address)
+            in_flight = cls._in_flight.get(
+                chip_address, [0x00] * len(registers)
+            )
+            out_of_sync = [
+                index for index, (chip_value, value, owned) in enumerate(
+                    zip(chip_registers, registers, in_flight)
+                )
+                if chip_value != value and not owned
+            ]
+            if not out_of_sync:
+                continue
+            logger.warning(
+                f"Shadow registers of chip {chip_address:02x} out of "
+                f"sync: {bytes(chip_registers).hex()} on chip, "
+                f"{bytes(registers).hex()} expected"
+            )
+            for index in out_of_sync:
+                cls._flush_shadow(chip_address, index, index)
+            in_sync = False
+        return in_sync
 
     @classmethod
     def get_state(cls):
@@ -0,0 +1,132 @@
+import atexit
+import heapq
+from itertools import count
+from queue import Empty, Queue
+from threading import Lock, Thread
+from typing import Callable, List, Tuple
+
+import backend.time_util as tu
+from backend.command import Command
+from backend.config import Config
+from backend.hardware import Hardware
+from backend.logger import logger
+
+
+class IgnitionEngine:
+
+    IGNITION_DURATION: float = Config.get_constant('ignition_duration')
+
+    _STOP: object = object()
+
+    _queue: Queue = Queue()
+    _pending: List[Tuple[float, int, List[Command]]] = []
+    _sequence: count = count()
+    _thread: Thread = None
+    _thread_lock: Lock = Lock()
+
+    @classmethod
+    def _ensure_running(cls):
+        with cls._thread_lock:
+            if cls._thread is not None and cls._thread.is_alive():
+                return
+            cls._thread = Thread(
+                target=cls._thread_handler,
+                name="ignition_engine",
+                daemon=True
+            )
+            cls._thread.start()
+
+    @classmethod
+    def light(
+        cls, commands: List[Command],
+        on_lit: Callable[[float], None] = None
+    ):
+        cls._ensure_running()
+        cls._queue.put((commands, on_lit))
+
+    @classmethod
+    def shutdown(cls):
+        with cls._thread_lock:
+            if cls._thread is None or not cls._thread.is_alive():
+                return
+            cls._queue.put(cls._STOP)
+            cls._thread.join()
+            cls._thread = None
+
+    @classmethod
+    def drain(cls):
+        cls._queue.join()
+
+    @classmethod
+    def pending_amount(cls) -> int:
+        return len(cls._pending)
+
+    @classmethod
+    def _ignite(
+        cls, commands: List[Command], on_lit: Callable[[float], None]
+    ):
+        try:
+            spread = Hardware.light_many(
+                [command.address for command in commands]
+            )
+        except Exception:
+            logger.exception("Exception while lighting")
+            for command in commands:
+                command.mark_faulty(f"Error lighting {command}")
+            return
+        for command in commands:
+            command.mark_fireing()
+        heapq.heappush(cls._pending, (
+            tu.monotonic_now() + cls.IGNITION_DURATION,
+            next(cls._sequence),
+            commands
+        ))
+        if on_lit is not None:
+            on_lit(spread)
+
+    @classmethod
+    def _extinguish(cls, commands: List[Command]):
+        try:
+            Hardware.unlight_many([command.address for command in commands])
+        except Exception:
+            logger.exception("Exception while unlighting")
+            for command in commands:
+                command.mark_faulty(f"Error unlighting {command}")
+            return
+        for command in commands:
+            command.mark_fired()
+
+    @classmethod
+    def _extinguish_due(cls, deadline: float):
+        due_commands = []
+        while cls._pending and cls._pending[0][0] <= deadline:
+            due_commands.extend(heapq.heappop(cls._pending)[2])
+        if due_commands:
+            cls._extinguish(due_commands)
+
+    @classmethod
+    def _thread_handler(cls):
+        while True:
+            if cls._pending:
+                timeout = max(0.0, cls._pending[0][0] - tu.monotonic_now())
+            else:
+                timeout = None
+            try:
+                request = cls._queue.get(timeout=timeout)
+            except Empty:
+                request = None
+
+            if request is cls._STOP:
+                cls._extinguish_due(float('inf'))
+                cls._queue.task_done()
+                break
+            if request is not None:
+                try:
+                    cls._ignite(*request)
+                finally:
+                    cls._queue.task_done()
+
+            cls._extinguish_due(tu.monotonic_now())
+
+
+atexit.register(IgnitionEngine.shutdown)
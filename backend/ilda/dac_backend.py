@@ -0,0 +1,67 @@
+from abc import ABC, abstractmethod
+import ctypes
+
+from backend.ilda.ilda import HeliosPointPointer, load_helios_library
+
+
+class DacBackend(ABC):
+
+    STATUS_READY: int = 1
+
+    @abstractmethod
+    def open_devices(self) -> int:
+        raise NotImplementedError("@abstractmethod")
+
+    @abstractmethod
+    def close_devices(self):
+        raise NotImplementedError("@abstractmethod")
+
+    @abstractmethod
+    def get_status(self, dac_index: int) -> int:
+        raise NotImplementedError("@abstractmethod")
+
+    @abstractmethod
+    def write_frame(
+        self, dac_index: int, points_per_second: int, flags: int,
+        points: HeliosPointPointer, point_amount: int
+    ) -> int:
+        raise NotImplementedError("@abstractmethod")
+
+    @abstractmethod
+    def set_shutter(self, dac_index: int, closed: bool):
+        raise NotImplementedError("@abstractmethod")
+
+    @abstractmethod
+    def stop(self, dac_index: int):
+        raise NotImplementedError("@abstractmethod")
+
+
+class HeliosDacBackend(DacBackend):
+
+    _library: ctypes.CDLL
+
+    def __init__(self):
+        self._library = load_helios_library()
+
+    def open_devices(self) -> int:
+        return self._library.OpenDevices()
+
+    def close_devices(self):
+        self._library.CloseDevices()
+
+    def get_status(self, dac_index: int) -> int:
+        return self._library.GetStatus(dac_index)
+
+    def write_frame(
+        self, dac_index: int, points_per_second: int, flags: int,
+        points: HeliosPointPointer, point_amount: int
+    ) -> int:
+        return self._library.WriteFrame(
+            dac_index, points_per_second, flags, points, point_amount
+        )
+
+    def set_shutter(self, dac_index: int, closed: bool):
+        self._library.SetShutter(dac_index, 1 if closed else 0)
+
+    def stop(self, dac_index: int):
+        self._library.Stop(dac_index)
@@ -0,0 +1,216 @@
+from collections import deque
+from threading import Condition, Lock, Thread
+from typing import Any, Deque, Dict, Tuple
+
+import backend.time_util as tu
+from backend.ilda.dac_backend import DacBackend, HeliosDacBackend
+from backend.ilda.ilda_timeline import DacBuffer
+from backend.logger import logger
+from backend.show_clock import ShowClock
+
+
+class DacFeeder:
+
+    OUTPUT_IMMEADIATELY: int = 0b01
+    PLAY_ONLY_ONCE: int = 0b10
+    WRITE_FLAGS: int = OUTPUT_IMMEADIATELY | PLAY_ONLY_ONCE
+
+    RING_SIZE: int = 8
+    WRITE_AHEAD: float = 0.02
+    POLL_INTERVAL: float = 0.0005
+    READY_TIMEOUT: float = 0.1
+    LATE_THRESHOLD: float = 0.005
+
+    _backend: DacBackend = None
+    _device_amount: int = 0
+    _open_feeders: int = 0
+    _devices_lock: Lock = Lock()
+
+    _dac_index: int
+    _clock: ShowClock
+    _ring: Deque[Tuple[float, DacBuffer]]
+    _condition: Condition
+    _dac_lock: Lock
+    _thread: Thread
+    _stop_requested: bool
+
+    _frames_written: int
+    _points_written: int
+    _started_at: float
+    _frames_late: int
+    _frames_dropped: int
+    _dac_wait_total: float
+    _dac_wait_max: float
+
+    @classmethod
+    def use_backend(cls, backend: DacBackend):
+        with cls._devices_lock:
+            if cls._open_feeders > 0:
+                raise RuntimeError("ILDA devices are in use")
+            cls._backend = backend
+
+    @classmethod
+    def _open_devices(cls) -> int:
+        with cls._devices_lock:
+            if cls._backend is None:
+                cls._backend = HeliosDacBackend()
+            if cls._open_feeders == 0:
+                logger.info("Reading ILDA devices")
+                cls._device_amount = cls._backend.open_devices()
+            cls._open_feeders += 1
+            return cls._device_amount
+
+    @classmethod
+    def _close_devices(cls):
+        with cls._devices_lock:
+            cls._open_feeders -= 1
+            if cls._open_feeders == 0:
+                cls._backend.close_devices()
+                cls._device_amount = 0
+
+    def __init__(self, dac_index: int, clock: ShowClock):
+        device_amount = self._open_devices()
+        if dac_index >= device_amount:
+            self._close_devices()
+            if device_amount < 1:
+                raise RuntimeError("No ILDA devices found")
+            raise RuntimeError(
+                f"ILDA device {dac_index} not found, "
+                f"only {device_amount} devices attached"
+            )
+
+        self._dac_index = dac_index
+        self._clock = clock
+        self._ring = deque()
+        self._condition = Condition()
+        self._dac_lock = Lock()
+        self._thread = None
+        self._stop_requested = False
+
+        self._frames_written = 0
+        self._points_written = 0
+        self._started_at = None
+        self._frames_late = 0
+        self._frames_dropped = 0
+        self._dac_wait_total = 0.0
+        self._dac_wait_max = 0.0
+
+        self.set_shutter(True)
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_requested = False
+        self._started_at = tu.monotonic_now()
+        self._thread = Thread(
+            target=self._thread_handler,
+            name=f"ilda_dac_feeder_{self._dac_index}",
+            daemon=True
+        )
+        self._thread.start()
+
+    def close(self):
+        with self._condition:
+            self._stop_requested = True
+            self._ring.clear()
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        self._thread = None
+        with self._dac_lock:
+            self._backend.set_shutter(self._dac_index, True)
+        self._close_devices()
+
+    def submit(self, timestamp: float, dac_buffer: DacBuffer):
+        with self._condition:
+            while (
+                not self._stop_requested
+                and len(self._ring) >= self.RING_SIZE
+            ):
+                self._condition.wait()
+            if self._stop_requested:
+                return
+            self._ring.append((timestamp, dac_buffer))
+            self._condition.notify_all()
+
+    def set_shutter(self, closed: bool):
+        with self._dac_lock:
+            self._backend.set_shutter(self._dac_index, closed)
+
+    def stop_output(self):
+        with self._condition:
+            self._ring.clear()
+            self._condition.notify_all()
+        with self._dac_lock:
+            self._backend.stop(self._dac_index)
+            self._backend.set_shutter(self._dac_index, True)
+
+    def _wait_until_ready(self):
+        start = tu.monotonic_now()
+        now = start
+        while not self._stop_requested:
+            with self._dac_lock:
+                status = self._backend.get_status(self._dac_index)
+            now = tu.monotonic_now()
+            if status == DacBackend.STATUS_READY or now - start >= self.READY_TIMEOUT:
+                break
+            tu.sleep(self.POLL_INTERVAL)
+        waited = now - start
+        self._dac_wait_total += waited
+        self._dac_wait_max = max(self._dac_wait_max, waited)
+
+    def _thread_handler(self):
+        while True:
+            with self._condition:
+                while not self._stop_requested and not self._ring:
+                    self._condition.wait()
+                if self._stop_requested:
+                    return
+
+            self._wait_until_ready()
+
+            with self._condition:
+                if not self._ring:
+                    continue
+                now = self._clock.now()
+                while len(self._ring) > 1 and self._ring[1][0] <= now:
+                    self._ring.popleft()
+                    self._frames_dropped += 1
+                timestamp, dac_buffer = self._ring.popleft()
+                self._condition.notify_all()
+
+            points_per_second, points, point_amount, _ = dac_buffer
+            with self._dac_lock:
+                self._backend.write_frame(
+                    self._dac_index,
+                    points_per_second,
+                    self.WRITE_FLAGS,
+                    points,
+                    point_amount
+                )
+            self._frames_written += 1
+            self._points_written += point_amount
+            if self._clock.now() - timestamp > self.LATE_THRESHOLD:
+                self._frames_late += 1
+
+    def get_state(self) -> Dict[str, Any]:
+        elapsed = (
+            tu.monotonic_now() - self._started_at
+            if self._started_at is not None else 0.0
+        )
+        return {
+            'dac_index': self._dac_index,
+            'frames_written': self._frames_written,
+            'points_written': self._points_written,
+            'frames_per_second': (
+                self._frames_written / elapsed if elapsed > 0.0 else 0.0
+            ),
+            'points_per_second': (
+                self._points_written / elapsed if elapsed > 0.0 else 0.0
+            ),
+            'frames_late': self._frames_late,
+            'frames_dropped': self._frames_dropped,
+            'dac_wait_total': self._dac_wait_total,
+            'dac_wait_max': self._dac_wait_max,
+            'pending_frames': len(self._ring)
+        }
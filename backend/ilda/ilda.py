@@ -1,4 +1,7 @@
 import ctypes
+
+import numpy as np
+
 from backend.instance import Instance
 
 
@@ -12,36 +15,53 @@ class HeliosPoint(ctypes.Structure):
         ('i', ctypes.c_uint8)
     ]
 
-if Instance.on_pi():
-    helios_lib = ctypes.CDLL("backend/ilda/libHeliosDacAPI_arm.so")
-else:
-    helios_lib = ctypes.CDLL("backend/ilda/libHeliosDacAPI.so")
 
-helios_lib.OpenDevices.argtypes = []
-helios_lib.OpenDevices.restype = ctypes.c_int
+HeliosPointPointer = ctypes.POINTER(HeliosPoint)
+
+HELIOS_POINT_DTYPE: np.dtype = np.dtype([
+    ('x', np.uint16),
+    ('y', np.uint16),
+    ('r', np.uint8),
+    ('g', np.uint8),
+    ('b', np.uint8),
+    ('i', np.uint8)
+])
+
+HELIOS_LIBRARY_PATH: str = "backend/ilda/libHeliosDacAPI.so"
+HELIOS_ARM_LIBRARY_PATH: str = "backend/ilda/libHeliosDacAPI_arm.so"
+
+
+def load_helios_library() -> ctypes.CDLL:
+    if Instance.on_pi():
+        helios_lib = ctypes.CDLL(HELIOS_ARM_LIBRARY_PATH)
+    else:
+        helios_lib = ctypes.CDLL(HELIOS_LIBRARY_PATH)
+
+    helios_lib.OpenDevices.argtypes = []
+    helios_lib.OpenDevices.restype = ctypes.c_int
 
-helios_lib.GetStatus.argtypes = [ctypes.c_uint]
-helios_lib.GetStatus.restype = ctypes.c_int
+    helios_lib.GetStatus.argtypes = [ctypes.c_uint]
+    helios_lib.GetStatus.restype = ctypes.c_int
 
-helios_lib.WriteFrame.argtypes = [ctypes.c_uint, ctypes.c_int, ctypes.c_uint8, ctypes.POINTER(HeliosPoint), ctypes.c_int]
-helios_lib.WriteFrame.restype = ctypes.c_int
+    helios_lib.WriteFrame.argtypes = [ctypes.c_uint, ctypes.c_int, ctypes.c_uint8, ctypes.POINTER(HeliosPoint), ctypes.c_int]
+    helios_lib.WriteFrame.restype = ctypes.c_int
 
-helios_lib.SetShutter.argtypes = [ctypes.c_uint, ctypes.c_bool]
-helios_lib.SetShutter.restype = ctypes.c_int
+    helios_lib.SetShutter.argtypes = [ctypes.c_uint, ctypes.c_bool]
+    helios_lib.SetShutter.restype = ctypes.c_int
 
-helios_lib.GetFirmwareVersion.argtypes = [ctypes.c_uint]
-helios_lib.GetFirmwareVersion.restype = ctypes.c_int
+    helios_lib.GetFirmwareVersion.argtypes = [ctypes.c_uint]
+    helios_lib.GetFirmwareVersion.restype = ctypes.c_int
 
-helios_lib.GetName.argtypes = [ctypes.c_uint, ctypes.c_char_p]
-helios_lib.GetName.restype = ctypes.c_int
+    helios_lib.GetName.argtypes = [ctypes.c_uint, ctypes.c_char_p]
+    helios_lib.GetName.restype = ctypes.c_int
 
-helios_lib.SetName.argtypes = [ctypes.c_uint, ctypes.c_char_p]
-helios_lib.SetName.restype = ctypes.c_int
+    helios_lib.SetName.argtypes = [ctypes.c_uint, ctypes.c_char_p]
+    helios_lib.SetName.restype = ctypes.c_int
 
-helios_lib.Stop.argtypes = [ctypes.c_uint]
-helios_lib.Stop.restype = ctypes.c_int
+    helios_lib.Stop.argtypes = [ctypes.c_uint]
+    helios_lib.Stop.restype = ctypes.c_int
 
-helios_lib.CloseDevices.argtypes = []
-helios_lib.CloseDevices.restype = ctypes.c_int
+    helios_lib.CloseDevices.argtypes = []
+    helios_lib.CloseDevices.restype = ctypes.c_int
 
-IldaInterface = helios_lib
+    return helios_lib
@@ -0,0 +1,292 @@
+from threading import Condition, Thread
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+import mmap
+
+import numpy as np
+
+from backend.config import Config
+from backend.ilda.ilda import HeliosPointPointer
+from backend.ilda.ildx_decoder import IldxDecoder, IldxFrameIndex
+from backend.ilda.point_optimizer import PointOptimizer
+from backend.logger import logger
+
+
+DacBuffer = Tuple[int, HeliosPointPointer, int, np.ndarray]
+FrameLoader = Callable[[Sequence[int]], List[np.ndarray]]
+
+
+class IldaTimeline:
+
+    READ_AHEAD_FRAMES: int = int(Config.get_constant('ilda_read_ahead_frames'))
+    READ_AHEAD_BATCH: int = 16
+
+    SCAN_RATE_DTYPE: np.dtype = np.dtype([
+        ('requested', '<i8'),
+        ('output', '<i8')
+    ])
+
+    _timestamps: np.ndarray
+    _frame_rates: np.ndarray
+    _point_keys: List[int]
+    _last_frames: np.ndarray
+    _loader: FrameLoader
+    _index_nbytes: int
+    _source: Any
+    _optimizer: PointOptimizer
+    _source_point_amounts: Dict[int, int]
+    _point_amounts: Dict[int, int]
+
+    _window: Dict[int, DacBuffer]
+    _window_nbytes: int
+    _cursor: int
+    _loaded_until: int
+    _misses: int
+    _condition: Condition
+    _thread: Thread
+    _stop_requested: bool
+
+    @classmethod
+    def from_ildx(
+        cls, ildx_filename: str, optimizer: PointOptimizer = None
+    ) -> 'IldaTimeline':
+        decoder = cls._open_ildx(ildx_filename)
+        return cls._from_index(decoder, decoder.index(), optimizer)
+
+    @classmethod
+    def from_ildx_by_projector(
+        cls, ildx_filename: str, optimizer: PointOptimizer = None
+    ) -> Dict[int, 'IldaTimeline']:
+        decoder = cls._open_ildx(ildx_filename)
+        index = decoder.index()
+        return {
+            projector_number: cls._from_index(
+                decoder, index.for_projector(projector_number), optimizer
+            )
+            for projector_number in index.projectors()
+        }
+
+    @staticmethod
+    def _open_ildx(ildx_filename: str) -> IldxDecoder:
+        logger.info(f"Indexing ILDA file {ildx_filename}")
+        with open(ildx_filename, 'rb') as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return IldxDecoder(data)
+
+    @classmethod
+    def _from_index(
+        cls, decoder: IldxDecoder, index: IldxFrameIndex,
+        optimizer: PointOptimizer
+    ) -> 'IldaTimeline':
+        return cls(
+            index.timestamps, index.frame_rates, index.record_offsets,
+            index.last_frames,
+            lambda positions: decoder.decode_frames(index, positions),
+            index.nbytes, decoder,
+            optimizer=optimizer or PointOptimizer.default()
+        )
+
+    def __init__(
+        self, timestamps: np.ndarray, frame_rates: np.ndarray,
+        point_keys: np.ndarray, last_frames: np.ndarray,
+        loader: FrameLoader, index_nbytes: int = 0, source: Any = None,
+        source_point_amounts: np.ndarray = None,
+        optimizer: PointOptimizer = None
+    ):
+        self._timestamps = timestamps
+        self._frame_rates = frame_rates
+        self._point_keys = point_keys.tolist()
+        self._last_frames = last_frames
+        self._loader = loader
+        self._index_nbytes = index_nbytes
+        self._source = source
+        self._optimizer = optimizer
+        self._source_point_amounts = {}
+        self._point_amounts = {}
+        if source_point_amounts is not None:
+            self._source_point_amounts = dict(
+                zip(self._point_keys, source_point_amounts.tolist())
+            )
+
+        self._window = {}
+        self._window_nbytes = 0
+        self._cursor = 0
+        self._loaded_until = 0
+        self._misses = 0
+        self._condition = Condition()
+        self._thread = None
+        self._stop_requested = False
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_requested = False
+        self._thread = Thread(
+            target=self._thread_handler,
+            name="ilda_read_ahead",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        with self._condition:
+            self._stop_requested = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+        self._thread = None
+
+    def advance(self, position: int):
+        if position == self._cursor:
+            return
+        with self._condition:
+            if position < self._cursor or position > self._loaded_until:
+                self._loaded_until = position
+            self._cursor = position
+            if self._needs_loading():
+                self._condition.notify()
+
+    def dac_buffer(self, position: int) -> DacBuffer:
+        dac_buffer = self._window.get(self._point_keys[position])
+        if dac_buffer is None:
+            self._misses += 1
+            points = self._load([position])[0]
+            with self._condition:
+                dac_buffer = self._insert(position, points)
+        return dac_buffer
+
+    def frame_points(self, positions: Sequence[int]) -> List[np.ndarray]:
+        return self._load(positions)
+
+    def _load(self, positions: Sequence[int]) -> List[np.ndarray]:
+        frames = self._loader(positions)
+        for position, points in zip(positions, frames):
+            self._source_point_amounts.setdefault(
+                self._point_keys[position], len(points)
+            )
+        if self._optimizer is not None:
+            frame_rates = self._frame_rates[list(positions)].tolist()
+            frames = [
+                self._optimizer.optimize(points, frame_rate)
+                for points, frame_rate in zip(frames, frame_rates)
+            ]
+        for position, points in zip(positions, frames):
+            self._point_amounts[self._point_keys[position]] = len(points)
+        return frames
+
+    def _needs_loading(self) -> bool:
+        return self._loaded_until < min(
+            self._cursor + self.READ_AHEAD_FRAMES, len(self)
+        )
+
+    def _insert(self, position: int, points: np.ndarray) -> DacBuffer:
+        key = self._point_keys[position]
+        dac_buffer = self._window.get(key)
+        if dac_buffer is None:
+            dac_buffer = (
+                int(self._frame_rates[position]) * len(points),
+                points.ctypes.data_as(HeliosPointPointer),
+                len(points),
+                points
+            )
+            self._window[key] = dac_buffer
+            self._window_nbytes += points.nbytes
+        return dac_buffer
+
+    def _evict(self):
+        needed_keys = set(self._point_keys[self._cursor:self._loaded_until])
+        for key in [key for key in self._window if key not in needed_keys]:
+            self._window_nbytes -= self._window.pop(key)[3].nbytes
+
+    def _thread_handler(self):
+        while True:
+            with self._condition:
+                while not self._stop_requested and not self._needs_loading():
+                    self._condition.wait()
+                if self._stop_requested:
+                    return
+                start = self._loaded_until
+                end = min(
+                    start + self.READ_AHEAD_BATCH,
+                    self._cursor + self.READ_AHEAD_FRAMES,
+                    len(self)
+                )
+                positions = [
+                    position for position in range(start, end)
+                    if self._point_keys[position] not in self._window
+                ]
+
+            try:
+                points = self._load(positions) if positions else []
+            except Exception:
+                logger.exception("Exception while reading ahead ILDA frames")
+                return
+
+            with self._condition:
+                if self._loaded_until != start:
+                    continue
+                for position, frame_points in zip(positions, points):
+                    self._insert(position, frame_points)
+                self._loaded_until = end
+                self._evict()
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps
+
+    @property
+    def frame_rates(self) -> np.ndarray:
+        return self._frame_rates
+
+    @property
+    def point_keys(self) -> List[int]:
+        return self._point_keys
+
+    @property
+    def last_frames(self) -> np.ndarray:
+        return self._last_frames
+
+    @property
+    def source_point_amounts(self) -> Dict[int, int]:
+        return self._source_point_amounts
+
+    def scan_rates(self) -> np.ndarray:
+        scan_rates = np.full(len(self), -1, dtype=self.SCAN_RATE_DTYPE)
+        frame_rates = self._frame_rates.tolist()
+        for position, key in enumerate(self._point_keys):
+            if key in self._point_amounts:
+                scan_rates[position] = (
+                    frame_rates[position] * self._source_point_amounts[key],
+                    frame_rates[position] * self._point_amounts[key]
+                )
+        return scan_rates
+
+    def scan_rate_statistics(self) -> Dict[str, Any]:
+        scan_rates = self.scan_rates()
+        scan_rates = scan_rates[scan_rates['output'] >= 0]
+        requested = scan_rates['requested']
+        output = scan_rates['output']
+        max_points_per_second = (
+            self._optimizer.max_points_per_second
+            if self._optimizer is not None else None
+        )
+        return {
+            'frames': len(scan_rates),
+            'max_points_per_second': max_points_per_second,
+            'requested_mean': float(requested.mean()) if len(requested) else 0.0,
+            'requested_max': int(requested.max(initial=0)),
+            'output_mean': float(output.mean()) if len(output) else 0.0,
+            'output_max': int(output.max(initial=0)),
+            'limited_frames': int((output < requested).sum())
+        }
+
+    def memory_usage(self) -> Dict[str, int]:
+        return {
+            'index_bytes': self._index_nbytes,
+            'window_bytes': self._window_nbytes,
+            'window_frames': len(self._window),
+            'read_ahead_frames': self.READ_AHEAD_FRAMES,
+            'misses': self._misses
+        }
@@ -1,5 +1,8 @@
 import ctypes
 import enum
+from typing import Dict
+
+import numpy as np
 
 
 class IldxFormatCode(enum.IntEnum):
@@ -80,6 +83,46 @@ class Ildx2dTrueColorRecord(ctypes.BigEndianStructure):
     ]
 
 
+ILDX_RECORD_DTYPES: Dict[IldxFormatCode, np.dtype] = {
+    IldxFormatCode.ILDX_FORMAT_CODE_3D_INDEXED: np.dtype([
+        ('x', '>i2'),
+        ('y', '>i2'),
+        ('z', '>i2'),
+        ('statusCode', 'u1'),
+        ('colorIndex', 'u1')
+    ]),
+    IldxFormatCode.ILDX_FORMAT_CODE_2D_INDEXED: np.dtype([
+        ('x', '>i2'),
+        ('y', '>i2'),
+        ('statusCode', 'u1'),
+        ('colorIndex', 'u1')
+    ]),
+    IldxFormatCode.ILDX_FORMAT_CODE_3D_TRUE_COLOR: np.dtype([
+        ('x', '>i2'),
+        ('y', '>i2'),
+        ('z', '>i2'),
+        ('statusCode', 'u1'),
+        ('r', 'u1'),
+        ('g', 'u1'),
+        ('b', 'u1')
+    ]),
+    IldxFormatCode.ILDX_FORMAT_CODE_2D_TRUE_COLOR: np.dtype([
+        ('x', '>i2'),
+        ('y', '>i2'),
+        ('statusCode', 'u1'),
+        ('r', 'u1'),
+        ('g', 'u1'),
+        ('b', 'u1')
+    ])
+}
+
+ILDX_COLOR_PALETTE_DTYPE: np.dtype = np.dtype([
+    ('r', 'u1'),
+    ('g', 'u1'),
+    ('b', 'u1')
+])
+
+
 def decode_start_timestamp(header: IldxHeader) -> int:
     return (
         (header.startTimestamp[0] << 16) 
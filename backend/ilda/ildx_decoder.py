@@ -0,0 +1,333 @@
+from dataclasses import dataclass, fields
+from typing import Dict, List, Sequence, Tuple
+import ctypes
+
+import numpy as np
+
+from backend.abstract_player import AbstractPlayerItem
+from backend.ilda.ilda import HELIOS_POINT_DTYPE
+from backend.ilda.ildx import (
+    IldxFormatCode, ILDX_STATUS_CODE_BLANKING_MASK, ILDX_RECORD_DTYPES,
+    ILDX_COLOR_PALETTE_DTYPE, IldxHeader, decode_start_timestamp
+)
+from backend.logger import logger
+
+
+@dataclass
+class IldaFrame(AbstractPlayerItem):
+    points: np.ndarray = None
+    last_frame: bool = False
+    timestamp: float = None
+    points_per_second: int = None
+
+
+@dataclass
+class IldxFrameIndex:
+    timestamps: np.ndarray
+    record_offsets: np.ndarray
+    record_amounts: np.ndarray
+    format_codes: np.ndarray
+    palette_indices: np.ndarray
+    frame_rates: np.ndarray
+    last_frames: np.ndarray
+    projector_numbers: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def projectors(self) -> List[int]:
+        return np.unique(self.projector_numbers).tolist()
+
+    def for_projector(self, projector_number: int) -> 'IldxFrameIndex':
+        selected = self.projector_numbers == projector_number
+        return IldxFrameIndex(*(
+            getattr(self, field.name)[selected] for field in fields(self)
+        ))
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, field.name).nbytes for field in fields(self))
+
+
+ColorPalette = List[Tuple[int, int, int]]
+
+
+class IldxDecoder:
+    HEADER_SIZE: int = ctypes.sizeof(IldxHeader)
+
+    DEFAULT_FPS: int = 30
+    DEFAULT_COLOR_PALETTE: ColorPalette = [
+        (255, 0, 0),
+        (255, 16, 0),
+        (255, 32, 0),
+        (255, 48, 0),
+        (255, 64, 0),
+        (255, 80, 0),
+        (255, 96, 0),
+        (255, 112, 0),
+        (255, 128, 0),
+        (255, 144, 0),
+        (255, 160, 0),
+        (255, 176, 0),
+        (255, 192, 0),
+        (255, 208, 0),
+        (255, 224, 0),
+        (255, 240, 0),
+        (255, 255, 0),
+        (224, 255, 0),
+        (192, 255, 0),
+        (160, 255, 0),
+        (128, 255, 0),
+        (96, 255, 0),
+        (64, 255, 0),
+        (32, 255, 0),
+        (0, 255, 0),
+        (0, 255, 36),
+        (0, 255, 73),
+        (0, 255, 109),
+        (0, 255, 146),
+        (0, 255, 182),
+        (0, 255, 219),
+        (0, 255, 255),
+        (0, 227, 255),
+        (0, 198, 255),
+        (0, 170, 255),
+        (0, 142, 255),
+        (0, 113, 255),
+        (0, 85, 255),
+        (0, 56, 255),
+        (0, 28, 255),
+        (0, 0, 255),
+        (32, 0, 255),
+        (64, 0, 255),
+        (96, 0, 255),
+        (128, 0, 255),
+        (160, 0, 255),
+        (192, 0, 255),
+        (224, 0, 255),
+        (255, 0, 255),
+        (255, 32, 255),
+        (255, 64, 255),
+        (255, 96, 255),
+        (255, 128, 255),
+        (255, 160, 255),
+        (255, 192, 255),
+        (255, 224, 255),
+        (255, 255, 255),
+        (255, 224, 224),
+        (255, 192, 192),
+        (255, 160, 160),
+        (255, 128, 128),
+        (255, 96, 96),
+        (255, 64, 64),
+        (255, 32, 32)
+    ]
+    DEFAULT_COLOR_PALETTE = DEFAULT_COLOR_PALETTE * (256 // len(DEFAULT_COLOR_PALETTE))
+
+    _data: bytes
+    _palettes: List[np.ndarray]
+
+    @classmethod
+    def read_file(cls, ildx_filename: str) -> List[IldaFrame]:
+        logger.info("Reading ILDA file")
+        with open(ildx_filename, 'rb') as file:
+            ildx_data = file.read()
+        return cls(ildx_data).decode()
+
+    def __init__(self, data: bytes):
+        self._data = data
+        self._palettes = [
+            np.array(self.DEFAULT_COLOR_PALETTE, dtype=np.uint8)
+        ]
+
+    def decode(self) -> List[IldaFrame]:
+        index = self.index()
+        logger.info("Decoding ILDA points")
+        points = self.decode_frames(index, range(len(index)))
+        return [
+            IldaFrame(timestamp, frame_points, last_frame, points_per_second)
+            for timestamp, frame_points, last_frame, points_per_second in zip(
+                index.timestamps.tolist(), points, index.last_frames.tolist(),
+                (index.frame_rates * index.record_amounts).tolist()
+            )
+        ]
+
+    def index(self) -> IldxFrameIndex:
+        logger.info("Indexing ILDA animations")
+        animations = {}
+        offset = 0
+        while True:
+            try:
+                header = IldxHeader.from_buffer_copy(self._data, offset)
+                animation_name = header.frameOrPaletteName.decode('utf-8').strip('\x00')
+            except ValueError:
+                break
+
+            format_code = IldxFormatCode(header.formatCode)
+            if format_code == IldxFormatCode.ILDX_FORMAT_CODE_COLOR_PALETTE:
+                offset = self._read_palette(offset)
+                continue
+
+            if header.totalFrames == 0:
+                break
+
+            logger.debug(f"Indexing ILDA animation {animation_name}")
+            fps = header.framesPerSecondOrFrameAmount or self.DEFAULT_FPS
+            frames, offset = self._index_frames(offset, header.totalFrames)
+            animations[(
+                decode_start_timestamp(header) / 1000.0,
+                header.projectorNumber
+            )] = (fps, frames)
+
+        return self._build_index(animations)
+
+    def _read_palette(self, offset: int) -> int:
+        header = IldxHeader.from_buffer_copy(self._data, offset)
+        offset += self.HEADER_SIZE
+
+        colors = np.frombuffer(
+            self._data, ILDX_COLOR_PALETTE_DTYPE,
+            count=header.numberOfRecords, offset=offset
+        )
+        self._palettes.append(
+            np.stack([colors['r'], colors['g'], colors['b']], axis=1)
+        )
+        return offset + colors.nbytes
+
+    def _index_frames(
+        self, offset: int, total_frames: int
+    ) -> Tuple[List[Tuple[int, int, int, int, int]], int]:
+        palette_index = len(self._palettes) - 1
+        frames = []
+        for i in range(total_frames):
+            try:
+                header = IldxHeader.from_buffer_copy(self._data, offset)
+            except ValueError:
+                offset += self.HEADER_SIZE
+                break
+            offset += self.HEADER_SIZE
+
+            record_size = ILDX_RECORD_DTYPES[
+                IldxFormatCode(header.formatCode)
+            ].itemsize
+            if offset + header.numberOfRecords * record_size > len(self._data):
+                break
+            repetitions = 1 if i == 0 else max(
+                1, header.framesPerSecondOrFrameAmount
+            )
+            frames.append((
+                offset, header.numberOfRecords, header.formatCode,
+                palette_index, repetitions
+            ))
+            offset += header.numberOfRecords * record_size
+        return frames, offset
+
+    def _build_index(
+        self, animations: Dict[Tuple[float, int], Tuple[int, List[Tuple]]]
+    ) -> IldxFrameIndex:
+        columns = [[] for _ in range(8)]
+        for (start_timestamp, projector_number), (fps, frames) in (
+            animations.items()
+        ):
+            if not frames:
+                continue
+            offsets, amounts, format_codes, palette_indices, repetitions = (
+                np.array(column, dtype=np.int64) for column in zip(*frames)
+            )
+            frame_amount = int(repetitions.sum())
+            ms_per_frame = 1000.0 / fps
+            last_frames = np.zeros(frame_amount, dtype=bool)
+            last_frames[-1] = True
+            expanded_amounts = np.repeat(amounts, repetitions)
+
+            columns[0].append(
+                start_timestamp + (np.arange(frame_amount) * ms_per_frame) / 1000.0
+            )
+            columns[1].append(np.repeat(offsets, repetitions))
+            columns[2].append(expanded_amounts)
+            columns[3].append(np.repeat(format_codes, repetitions))
+            columns[4].append(np.repeat(palette_indices, repetitions))
+            columns[5].append(np.full(frame_amount, fps))
+            columns[6].append(last_frames)
+            columns[7].append(np.full(frame_amount, projector_number))
+
+        dtypes = (
+            np.float64, np.int64, np.int64, np.uint8,
+            np.int64, np.int64, bool, np.uint8
+        )
+        columns = [
+            np.concatenate(column).astype(dtype, copy=False)
+            if column else np.zeros(0, dtype=dtype)
+            for column, dtype in zip(columns, dtypes)
+        ]
+        order = np.argsort(columns[0], kind='stable')
+        return IldxFrameIndex(*(column[order] for column in columns))
+
+    def decode_frames(
+        self, index: IldxFrameIndex, positions: Sequence[int]
+    ) -> List[np.ndarray]:
+        positions = np.asarray(positions, dtype=np.int64)
+        record_offsets = index.record_offsets[positions]
+        unique_offsets, first_positions, inverse = np.unique(
+            record_offsets, return_index=True, return_inverse=True
+        )
+        unique_positions = positions[first_positions]
+
+        groups = {}
+        for position in unique_positions.tolist():
+            key = (
+                int(index.format_codes[position]),
+                int(index.palette_indices[position])
+            )
+            groups.setdefault(key, []).append(position)
+
+        data = memoryview(self._data)
+        points_by_offset = {}
+        for (format_code, palette_index), group_positions in groups.items():
+            dtype = ILDX_RECORD_DTYPES[IldxFormatCode(format_code)]
+            offsets = index.record_offsets[group_positions].tolist()
+            lengths = index.record_amounts[group_positions]
+            records = np.frombuffer(
+                b"".join(
+                    data[offset:offset + length * dtype.itemsize]
+                    for offset, length in zip(offsets, lengths.tolist())
+                ),
+                dtype
+            )
+            ends = np.cumsum(lengths)
+            points = self._convert_records(
+                records, ends - lengths, ends, self._palettes[palette_index]
+            )
+            points_by_offset.update(zip(offsets, np.split(points, ends[:-1])))
+
+        unique_points = [
+            points_by_offset[offset] for offset in unique_offsets.tolist()
+        ]
+        return [unique_points[idx] for idx in inverse.tolist()]
+
+    def _convert_records(
+        self, records: np.ndarray, starts: np.ndarray, ends: np.ndarray,
+        palette: np.ndarray
+    ) -> np.ndarray:
+        points = np.empty(len(records), dtype=HELIOS_POINT_DTYPE)
+
+        x = records['x'].astype(np.int32)
+        y = records['y'].astype(np.int32)
+        points['x'] = (-(x + 0xFFFF // 2) * 0xFFF // 0xFFFF) & 0xFFFF
+        points['y'] = ((y + 0xFFFF // 2) * 0xFFF // 0xFFFF) & 0xFFFF
+
+        non_empty = ends > starts
+        visible = (records['statusCode'] & ILDX_STATUS_CODE_BLANKING_MASK) == 0
+        visible[starts[non_empty]] = False
+        visible[ends[non_empty] - 1] = False
+
+        if 'colorIndex' in records.dtype.names:
+            colors = palette[records['colorIndex']]
+            points['r'] = colors[:, 0]
+            points['g'] = colors[:, 1]
+            points['b'] = colors[:, 2]
+        else:
+            for channel in ('r', 'g', 'b'):
+                points[channel] = np.where(visible, records[channel], 0)
+        points['i'] = np.where(visible, 255, 0)
+        return points
@@ -0,0 +1,149 @@
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from backend.config import Config
+
+
+class PointOptimizer:
+
+    ENABLED: bool = Config.get_constant('ilda_optimize_points')
+    MAX_POINTS_PER_SECOND: int = int(
+        Config.get_constant('ilda_max_points_per_second')
+    )
+    DWELL_POINTS: int = int(Config.get_constant('ilda_dwell_points'))
+    MIN_FRAME_POINTS: int = 2
+
+    _max_points_per_second: int
+    _dwell_points: int
+
+    @classmethod
+    def default(cls) -> 'PointOptimizer':
+        return cls() if cls.ENABLED else None
+
+    @classmethod
+    def default_settings(cls) -> Dict[str, Any]:
+        optimizer = cls.default()
+        return None if optimizer is None else optimizer.settings()
+
+    def __init__(
+        self, max_points_per_second: int = None, dwell_points: int = None
+    ):
+        self._max_points_per_second = (
+            self.MAX_POINTS_PER_SECOND if max_points_per_second is None
+            else max_points_per_second
+        )
+        self._dwell_points = (
+            self.DWELL_POINTS if dwell_points is None else dwell_points
+        )
+
+    @property
+    def max_points_per_second(self) -> int:
+        return self._max_points_per_second
+
+    def settings(self) -> Dict[str, Any]:
+        return {
+            'max_points_per_second': self._max_points_per_second,
+            'dwell_points': self._dwell_points
+        }
+
+    def point_budget(self, frame_rate: int) -> int:
+        return max(
+            self._max_points_per_second // max(frame_rate, 1),
+            self.MIN_FRAME_POINTS
+        )
+
+    def optimize(self, points: np.ndarray, frame_rate: int) -> np.ndarray:
+        if len(points) < self.MIN_FRAME_POINTS:
+            return points
+        points, keep = self._insert_dwell(points)
+        budget = self.point_budget(frame_rate)
+        if len(points) > budget:
+            points = points[self._decimate(keep, budget)]
+        elif len(points) < budget:
+            points = self._interpolate(points, budget)
+        return points
+
+    @staticmethod
+    def _transitions(points: np.ndarray) -> np.ndarray:
+        lit = points['i'] > 0
+        colors = (
+            (points['r'].astype(np.int32) << 16)
+            | (points['g'].astype(np.int32) << 8)
+            | points['b']
+        )
+        transitions = np.zeros(len(points), dtype=bool)
+        transitions[1:] = (lit[1:] != lit[:-1]) | (
+            lit[1:] & lit[:-1] & (colors[1:] != colors[:-1])
+        )
+        return transitions
+
+    def _insert_dwell(
+        self, points: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        transitions = self._transitions(points)
+        keep = transitions.copy()
+        keep[[0, -1]] = True
+        if self._dwell_points == 0 or not transitions.any():
+            return points, keep
+
+        repeats = np.where(transitions, 1 + self._dwell_points, 1)
+        sources = np.repeat(np.arange(len(points)), repeats)
+        is_dwell = np.ones(len(sources), dtype=bool)
+        is_dwell[np.cumsum(repeats) - 1] = False
+        previous = sources[is_dwell] - 1
+        blanked = points['i'][previous] == 0
+
+        color_sources = sources.copy()
+        color_sources[is_dwell] = previous
+        position_sources = sources.copy()
+        position_sources[is_dwell] = np.where(
+            blanked, sources[is_dwell], previous
+        )
+
+        optimized = points[position_sources]
+        for field in ('r', 'g', 'b', 'i'):
+            optimized[field] = points[field][color_sources]
+        return optimized, np.repeat(keep, repeats)
+
+    @staticmethod
+    def _interpolate(points: np.ndarray, budget: int) -> np.ndarray:
+        x = points['x'].astype(np.float64)
+        y = points['y'].astype(np.float64)
+        lengths = np.zeros(len(points))
+        lengths[1:] = np.hypot(np.diff(x), np.diff(y))
+        lengths[points['i'] == 0] = 0.0
+        total_length = lengths.sum()
+        if total_length == 0.0:
+            return points
+
+        inserts = np.floor(
+            lengths * ((budget - len(points)) / total_length)
+        ).astype(np.int64)
+        if not inserts.any():
+            return points
+        repeats = inserts + 1
+        sources = np.repeat(np.arange(len(points)), repeats)
+        steps = np.arange(len(sources)) - np.repeat(
+            np.cumsum(repeats) - repeats, repeats
+        )
+        fractions = (steps + 1) / np.repeat(repeats, repeats)
+        previous = np.maximum(sources - 1, 0)
+
+        interpolated = points[sources]
+        for field, values in (('x', x), ('y', y)):
+            interpolated[field] = np.round(
+                values[previous]
+                + (values[sources] - values[previous]) * fractions
+            )
+        return interpolated
+
+    @staticmethod
+    def _decimate(keep: np.ndarray, budget: int) -> np.ndarray:
+        kept = np.flatnonzero(keep)
+        if len(kept) >= budget:
+            picks = np.linspace(0, len(kept) - 1, budget).round()
+            return kept[picks.astype(np.int64)]
+        others = np.flatnonzero(~keep)
+        picks = np.linspace(0, len(others) - 1, budget - len(kept)).round()
+        return np.sort(np.concatenate((kept, others[picks.astype(np.int64)])))
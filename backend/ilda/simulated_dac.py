@@ -0,0 +1,156 @@
+from collections import deque
+from threading import Lock
+from typing import Any, Deque, Dict, List, Tuple
+
+import backend.time_util as tu
+from backend.ilda.dac_backend import DacBackend
+from backend.ilda.ilda import HeliosPointPointer
+
+
+FrameRecord = Tuple[float, float, float, int, int]
+
+
+class SimulatedDac:
+
+    _busy_until: float
+    _buffer_free_at: float
+    _shutter_closed: bool
+    _frames: Deque[FrameRecord]
+    _frames_written: int
+    _frames_rejected: int
+    _frames_clamped: int
+    _points_written: int
+    _transfer_seconds: float
+
+    def __init__(self, log_size: int):
+        self._busy_until = 0.0
+        self._buffer_free_at = 0.0
+        self._shutter_closed = True
+        self._frames = deque(maxlen=log_size)
+        self._frames_written = 0
+        self._frames_rejected = 0
+        self._frames_clamped = 0
+        self._points_written = 0
+        self._transfer_seconds = 0.0
+
+    def is_ready(self, now: float) -> bool:
+        return now >= self._buffer_free_at
+
+    def write(
+        self, written_at: float, transfer_seconds: float,
+        points_per_second: int, point_amount: int, clamped: bool
+    ):
+        transferred_at = written_at + transfer_seconds
+        started_at = max(transferred_at, self._busy_until)
+        self._busy_until = started_at + point_amount / points_per_second
+        self._buffer_free_at = started_at
+        self._frames.append((
+            written_at, started_at, self._busy_until,
+            points_per_second, point_amount
+        ))
+        self._frames_written += 1
+        self._frames_clamped += clamped
+        self._points_written += point_amount
+        self._transfer_seconds += transfer_seconds
+
+    def reject(self):
+        self._frames_rejected += 1
+
+    def stop(self, now: float):
+        self._busy_until = now
+        self._buffer_free_at = now
+
+    def set_shutter(self, closed: bool):
+        self._shutter_closed = closed
+
+    @property
+    def frames(self) -> List[FrameRecord]:
+        return list(self._frames)
+
+    def get_state(self) -> Dict[str, Any]:
+        return {
+            'frames_written': self._frames_written,
+            'frames_rejected': self._frames_rejected,
+            'frames_clamped': self._frames_clamped,
+            'points_written': self._points_written,
+            'transfer_seconds': self._transfer_seconds,
+            'shutter_closed': self._shutter_closed
+        }
+
+
+class SimulatedDacBackend(DacBackend):
+
+    MIN_POINTS_PER_SECOND: int = 7
+    MAX_POINTS_PER_SECOND: int = 65535
+    USB_BYTES_PER_SECOND: float = 1_000_000.0
+    USB_LATENCY: float = 0.001
+    BYTES_PER_POINT: int = 7
+    FRAME_OVERHEAD_BYTES: int = 5
+    ERROR_NOT_READY: int = -1
+    LOG_SIZE: int = 100_000
+
+    _device_amount: int
+    _sleep: bool
+    _dacs: List[SimulatedDac]
+    _lock: Lock
+
+    def __init__(self, device_amount: int = 1, sleep: bool = True):
+        self._device_amount = device_amount
+        self._sleep = sleep
+        self._dacs = []
+        self._lock = Lock()
+
+    def open_devices(self) -> int:
+        with self._lock:
+            self._dacs = [
+                SimulatedDac(self.LOG_SIZE)
+                for _ in range(self._device_amount)
+            ]
+        return self._device_amount
+
+    def close_devices(self):
+        pass
+
+    def transfer_seconds(self, point_amount: int) -> float:
+        return self.USB_LATENCY + (
+            point_amount * self.BYTES_PER_POINT + self.FRAME_OVERHEAD_BYTES
+        ) / self.USB_BYTES_PER_SECOND
+
+    def get_status(self, dac_index: int) -> int:
+        with self._lock:
+            ready = self._dacs[dac_index].is_ready(tu.monotonic_now())
+        return self.STATUS_READY if ready else 0
+
+    def write_frame(
+        self, dac_index: int, points_per_second: int, flags: int,
+        points: HeliosPointPointer, point_amount: int
+    ) -> int:
+        now = tu.monotonic_now()
+        dac = self._dacs[dac_index]
+        transfer_seconds = self.transfer_seconds(point_amount)
+        clamped_points_per_second = min(
+            max(points_per_second, self.MIN_POINTS_PER_SECOND),
+            self.MAX_POINTS_PER_SECOND
+        )
+        with self._lock:
+            if not dac.is_ready(now):
+                dac.reject()
+                return self.ERROR_NOT_READY
+            dac.write(
+                now, transfer_seconds, clamped_points_per_second,
+                point_amount, clamped_points_per_second != points_per_second
+            )
+        if self._sleep:
+            tu.sleep(transfer_seconds)
+        return self.STATUS_READY
+
+    def set_shutter(self, dac_index: int, closed: bool):
+        with self._lock:
+            self._dacs[dac_index].set_shutter(closed)
+
+    def stop(self, dac_index: int):
+        with self._lock:
+            self._dacs[dac_index].stop(tu.monotonic_now())
+
+    def dac(self, dac_index: int) -> SimulatedDac:
+        return self._dacs[dac_index]
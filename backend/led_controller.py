@@ -99,7 +99,7 @@ class LedController:
             )
 
     def _led_status(self, period: float, duty: float) -> Any:
-        timestamp_inside_period = tu.timestamp_now() % period
+        timestamp_inside_period = tu.monotonic_now() % period
         return (
             GPIO.HIGH
             if timestamp_inside_period <= period * duty
@@ -6,22 +6,31 @@ import shutil
 import json
 import os
 import io
-import hashlib
-import pickle
 from itertools import chain
+from bisect import bisect_left
+
+import numpy as np
 
 import backend.time_util as tu
 from backend.address import Address
 from backend.command import Command
+from backend.compiled_program import CompiledProgram
 from backend.config import Config
+from backend.fuse_table import FuseTable
 from backend.hardware import Hardware
 from backend.led_controller import LedController
 from backend.logger import logger
 from backend.instance import Instance
+from backend.rl_exception import RlException
+from backend.salvo import Salvo
+from backend.show_clock import ShowClock
 
 from backend.audio.audio_player import AudioPlayer
 from backend.ilda.ilda_player import IldaPlayer
+from backend.ilda.ilda_timeline import IldaTimeline
+from backend.ilda.point_optimizer import PointOptimizer
 from backend.dmx.dmx_player import DmxPlayer
+from backend.dmx.dmx_timeline import DmxTimeline
 
 from backend.zipfile_handler import ZipfileHandler
 
@@ -29,24 +38,26 @@ from backend.zipfile_handler import ZipfileHandler
 class Program:
 
     LOCAL_PROGRAM_PATH: str = "programs/local_program.zip"
-    LOCAL_PROGRAM_PKL_PATH: str = "programs/local_program.pkl"
-    LOCAL_PROGRAM_MD5_PATH: str = "programs/local_program.md5"
+    LOCAL_PROGRAM_COMPILED_PATH: str = "programs/local_program.rlc"
+    LOCAL_PROGRAM_MUSIC_PATH: str = "programs/local_program_music"
 
-    class InvalidProgram(Exception):
-        pass
+    class InvalidProgram(RlException):
+        def __init__(self, message: str, errors: List[str] = None):
+            super().__init__(message)
+            self.errors = [message] if errors is None else errors
 
     _name: str
     _command_list: List[Command]
+    _salvos: List[Salvo]
     _thread: Thread
     _pause_event: Event
-    _paused: bool
     _continue_event: Event
     _stop_event: Event
-    _start_timestamp: float
-    _last_current_timestamp_before_pause: float
+    _wakeup_event: Event
+    _clock: ShowClock
     _callback: Callable
-    _seconds_paused: float
-    _command_idx: int
+    _salvo_idx: int
+    _fire_delays: List[float]
     _zipfile_handler: ZipfileHandler
 
     _has_fuses: bool
@@ -55,109 +66,158 @@ class Program:
     _has_dmx: bool
 
     _audio_player: AudioPlayer
-    _ilda_player: IldaPlayer
-    _dmx_player: DmxPlayer
+    _ilda_players: Dict[int, IldaPlayer]
+    _dmx_players: Dict[int, DmxPlayer]
 
     local_program: 'Program' = None
 
     @classmethod
-    def raise_on_json(cls, json_data: List):
+    def raise_on_json(cls, json_data: List) -> FuseTable:
         if not isinstance(json_data, list):
             raise cls.InvalidProgram("A program has to be a list!")
 
-        for idx, event in enumerate(json_data):
-            if not isinstance(event, Dict):
-                raise cls.InvalidProgram(f"Element {idx}: has to be a dict!")
+        fuse_table = FuseTable.from_json(json_data)
+        errors = fuse_table.errors
+        if errors:
+            raise cls.InvalidProgram(
+                f"{len(errors)} invalid elements:\n" + "\n".join(errors),
+                errors
+            )
+        return fuse_table
 
-            for key in ['name', 'device_id', 'letter', 'number', 'timestamp']:
-                if key not in event.keys():
-                    raise cls.InvalidProgram(
-                        f"Element {idx}: Key '{key}' missing!"
-                    )
+    @classmethod
+    def compile_settings(cls) -> Dict[str, Any]:
+        return {
+            'device_id': Config.get_value('device_id'),
+            'chip_amount': Config.get_value('chip_amount'),
+            'ilda_optimizer': PointOptimizer.default_settings()
+        }
 
-            if not isinstance(event['name'], str):
-                raise cls.InvalidProgram(
-                    f"Element {idx}: 'name' has to be a string!"
-                )
-            if not isinstance(event['device_id'], str):
-                raise cls.InvalidProgram(
-                    f"Element {idx}: 'device_id' has to be a string!"
-                )
+    @classmethod
+    def compile_zip(
+        cls, zip_filename: str, compiled_filename: str, music_path: str
+    ):
+        logger.info(f"Compiling {zip_filename} to {compiled_filename}")
+        zipfile_handler = ZipfileHandler(zip_filename)
+        device_id = Config.get_value('device_id')
 
-            try:
-                number = int(event['number'])
-                if not 0 <= number <= 15:
-                    raise cls.InvalidProgram(
-                        f"Element {idx}: 'number' {number} out of range!"
-                    )
-            except ValueError:
-                raise cls.InvalidProgram(
-                    f"Element {idx}: 'number' has to be an integer!"
-                )
-            try:
-                timestamp = float(event['timestamp'])
-                if timestamp < 0.0:
-                    raise cls.InvalidProgram(
-                        f"Element {idx}: 'timestamp' {timestamp} is negative!"
-                    )
-            except ValueError:
-                raise cls.InvalidProgram(
-                    f"Element {idx}: 'timestamp' has to be a float!"
-                )
+        meta = CompiledProgram.source_signature(zip_filename)
+        meta['source_md5'] = CompiledProgram.source_md5(zip_filename)
+        meta['music_filename'] = None
+        meta.update(cls.compile_settings())
+        meta['dmx_output'] = None
+        sections = {}
+        timelines = {}
 
-    @classmethod
-    def _file_md5(cls, file_path: str) -> str:
-        with open(file_path, 'rb') as file:
-            content = file.read()
-            return hashlib.md5(content).hexdigest()
+        if zipfile_handler.has_fuses and device_id in zipfile_handler.fuses_device_ids:
+            events = cls.raise_on_json(
+                zipfile_handler.fuses_data
+            ).events_for(device_id)
+            sections[CompiledProgram.FUSES_SECTION] = np.array(
+                [
+                    (timestamp, letter.encode('ascii'), number)
+                    for _, letter, number, timestamp in events
+                ],
+                dtype=CompiledProgram.FUSE_DTYPE
+            )
+            sections[CompiledProgram.FUSE_NAMES_SECTION] = json.dumps(
+                [event[0] for event in events]
+            ).encode('utf-8')
 
-    @classmethod
-    def _load_local_program_from_pickle(cls):
-        with open(cls.LOCAL_PROGRAM_PKL_PATH, 'rb') as local_program_file:
-            cls.local_program = pickle.load(local_program_file)
+        if zipfile_handler.has_music and device_id in zipfile_handler.music_device_ids:
+            extension = os.path.splitext(zipfile_handler.music_filename)[1]
+            meta['music_filename'] = f"{music_path}{extension}"
+            shutil.copyfile(
+                zipfile_handler.music_filename, meta['music_filename']
+            )
 
-    @classmethod
-    def _load_local_program_from_zip(cls):
-        cls.local_program = cls.from_zip("Local-Program", cls.LOCAL_PROGRAM_PATH)
+        if zipfile_handler.has_ilda and device_id in zipfile_handler.ilda_device_ids:
+            timelines = IldaTimeline.from_ildx_by_projector(
+                zipfile_handler.ilda_filename
+            )
+            sections.update(CompiledProgram.ilda_tables(timelines))
 
-        with open(cls.LOCAL_PROGRAM_PKL_PATH, 'wb') as local_program_file:
-            pickle.dump(cls.local_program, local_program_file)  # TODO: Check if program object is pickable 
+        if zipfile_handler.has_dmx and device_id in zipfile_handler.dmx_device_ids:
+            dmx_timelines = {
+                universe: DmxTimeline.from_frames(frames)
+                for universe, frames in DmxPlayer.read_file(
+                    zipfile_handler.dmx_filename
+                ).items()
+            }
+            meta['dmx_keyframe_interval'] = DmxTimeline.KEYFRAME_INTERVAL
+            meta['dmx_output'] = zipfile_handler.dmx_output
+            sections.update(CompiledProgram.dmx_tables(dmx_timelines))
+
+        CompiledProgram.write(compiled_filename, meta, sections)
+        for projector_number, timeline in timelines.items():
+            logger.info(
+                f"ILDA scan rates of projector {projector_number}: "
+                f"{timeline.scan_rate_statistics()}"
+            )
 
-        computed_md5 = cls._file_md5(cls.LOCAL_PROGRAM_PATH)
-        with open(cls.LOCAL_PROGRAM_MD5_PATH, 'w') as md5_file:
-            md5_file.write(computed_md5)
-            
     @classmethod
     def build_local_program(cls):
         def thread_target():
-            if os.path.exists(cls.LOCAL_PROGRAM_PATH):
-                computed_md5 = cls._file_md5(cls.LOCAL_PROGRAM_PATH)
-                logger.info(f"Local program found at {cls.LOCAL_PROGRAM_PATH} with md5 {computed_md5}")
-
-                if os.path.exists(cls.LOCAL_PROGRAM_MD5_PATH):
-                    with open(cls.LOCAL_PROGRAM_MD5_PATH, 'r') as md5_file:
-                        stored_md5 = md5_file.read()
-                        logger.info(f"Stored md5 {stored_md5} found at {cls.LOCAL_PROGRAM_MD5_PATH}")
-                else:
-                    logger.info(f"No stored md5 not found at {cls.LOCAL_PROGRAM_MD5_PATH}")
-                    stored_md5 = None
-
-                if os.path.exists(cls.LOCAL_PROGRAM_PKL_PATH) and stored_md5 == computed_md5:
-                    logger.info(f"Loading local program from pickle")
-                    cls._load_local_program_from_pickle()
-                else:
-                    logger.info(f"Loading local program from zip")
-                    cls._load_local_program_from_zip()
-                
-            else:
+            if not os.path.exists(cls.LOCAL_PROGRAM_PATH):
                 logger.error(f"Local program not found at {cls.LOCAL_PROGRAM_PATH}")
                 raise FileNotFoundError(f"Local program not found at {cls.LOCAL_PROGRAM_PATH}")
 
+            if CompiledProgram.is_valid_for(
+                cls.LOCAL_PROGRAM_COMPILED_PATH, cls.LOCAL_PROGRAM_PATH,
+                cls.compile_settings()
+            ):
+                logger.info(f"Compiled local program at {cls.LOCAL_PROGRAM_COMPILED_PATH} is up to date")
+            else:
+                cls.compile_zip(
+                    cls.LOCAL_PROGRAM_PATH,
+                    cls.LOCAL_PROGRAM_COMPILED_PATH,
+                    cls.LOCAL_PROGRAM_MUSIC_PATH
+                )
+
+            cls.local_program = cls.from_compiled(
+                "Local-Program",
+                CompiledProgram(cls.LOCAL_PROGRAM_COMPILED_PATH)
+            )
             logger.info("Local program ready")
 
         thread = Thread(target=thread_target, name="local_program_builder")
         thread.start()
-            
+
+    @classmethod
+    def from_compiled(
+        cls, name: str, compiled_program: CompiledProgram
+    ) -> 'Program':
+        logger.info(f"Building program from compiled program {name}")
+        program = cls(name)
+        device_id = Config.get_value('device_id')
+
+        if compiled_program.has_fuses:
+            fuses = compiled_program.fuses.tolist()
+            for (timestamp, letter, number), fuse_name in zip(
+                fuses, compiled_program.fuse_names
+            ):
+                address = Address(device_id, letter.decode('ascii'), number)
+                program.add_command(Command(address, timestamp, fuse_name))
+
+        if compiled_program.meta['music_filename'] is not None:
+            program.add_music(compiled_program.meta['music_filename'])
+
+        if compiled_program.has_ilda:
+            for projector_number, timeline in (
+                compiled_program.ilda_timelines().items()
+            ):
+                program.add_ilda_timeline(timeline, projector_number)
+
+        if compiled_program.has_dmx:
+            for universe, timeline in (
+                compiled_program.dmx_timelines().items()
+            ):
+                program.add_dmx_timeline(
+                    timeline, universe, compiled_program.meta['dmx_output']
+                )
+
+        return program
+
     @classmethod
     def from_zip(cls, name: str, zip_filename: str) -> 'Program':
         logger.info(f"Building program from zip {name}")
@@ -178,7 +238,9 @@ class Program:
             program.add_ilda(zipfile_handler.ilda_filename)
 
         if zipfile_handler.has_dmx and device_id in zipfile_handler.dmx_device_ids:
-            program.add_dmx(zipfile_handler.dmx_filename)
+            program.add_dmx(
+                zipfile_handler.dmx_filename, zipfile_handler.dmx_output
+            )
 
         return program
 
@@ -189,21 +251,15 @@ class Program:
         json_data: List, 
         zipfile_handler: ZipfileHandler = None
     ) -> 'Program':
+        fuse_table = cls.raise_on_json(json_data)
+        device_id = Config.get_value('device_id')
         program = cls(name, zipfile_handler)
-        for event in json_data:
-            address = Address(
-                event['device_id'],
-                event['letter'],
-                event['number']
-            )
-            if address.device_id != Config.get_value('device_id'):
-                continue
-            command = Command(
-                address,
-                event['timestamp'],
-                event['name']
-            )
-            program.add_command(command)
+        for command_name, letter, number, timestamp in fuse_table.events_for(device_id):
+            program.add_command(Command(
+                Address(device_id, letter, number),
+                timestamp,
+                command_name
+            ))
         return program
 
     @classmethod
@@ -217,15 +273,15 @@ class Program:
     def __init__(self, name: str, zipfile_handler: ZipfileHandler = None):
         self._name = name
         self._command_list = []
+        self._salvos = []
         self._thread = None
-        self._paused = False
         self._pause_event = None
         self._continue_event = None
         self._stop_event = None
-        self._start_timestamp = None
-        self._last_current_timestamp_before_pause = None
+        self._wakeup_event = None
+        self._clock = ShowClock()
         self._callback = None
-        self._seconds_paused = 0
+        self._fire_delays = []
         self._zipfile_handler = zipfile_handler
 
         self._has_fuses = False
@@ -234,16 +290,17 @@ class Program:
         self._has_dmx = False
 
         self._audio_player = None
-        self._ilda_player = None
-        self._dmx_player = None
+        self._ilda_players = {}
+        self._dmx_players = {}
 
     def reset(self):
+        self._clock.reset()
         for command in self._command_list:
             command.reset()
-        if self._has_ilda:
-            self._ilda_player.reset()
-        if self._has_dmx:
-            self._dmx_player.reset()
+        for ilda_player in self._ilda_players.values():
+            ilda_player.reset()
+        for dmx_player in self._dmx_players.values():
+            dmx_player.reset()
 
     def add_command(self, command: Command):
         self._has_fuses = True
@@ -252,64 +309,106 @@ class Program:
     def add_music(self, filename: str):
         logger.info("Adding music")
         self._has_music = True
-        self._audio_player = AudioPlayer(filename)
+        self._audio_player = AudioPlayer(filename, self._clock)
 
     def add_ilda(self, filename: str):
         logger.info("Adding ilda")
         self._has_ilda = True
-        self._ilda_player = IldaPlayer(filename)
+        self._ilda_players.update(IldaPlayer.from_file(filename, self._clock))
+
+    def add_ilda_timeline(self, timeline: IldaTimeline, projector_number: int):
+        logger.info(f"Adding ilda timeline for projector {projector_number}")
+        self._has_ilda = True
+        self._ilda_players[projector_number] = IldaPlayer(
+            timeline, self._clock, projector_number
+        )
 
-    def add_dmx(self, filename: str):
+    def add_dmx(self, filename: str, output: str = None):
         logger.info("Adding dmx")
         self._has_dmx = True
-        self._dmx_player = DmxPlayer(filename)
+        self._dmx_players.update(
+            DmxPlayer.from_file(filename, self._clock, output)
+        )
+
+    def add_dmx_timeline(
+        self, timeline: DmxTimeline, universe: int, output: str = None
+    ):
+        logger.info(f"Adding dmx timeline for universe {universe}")
+        self._has_dmx = True
+        self._dmx_players[universe] = DmxPlayer(
+            timeline, self._clock, universe, output
+        )
 
     def _command_sort_key(self, command: Command) -> float:
         return command.timestamp
 
-    def run(self, callback: Callable):
+    def run(self, callback: Callable, offset: float = 0.0):
         self._pause_event = Event()
         self._continue_event = Event()
         self._stop_event = Event()
+        self._wakeup_event = Event()
         self._command_list.sort(key=self._command_sort_key)
+        self._salvos = Salvo.from_commands(self._command_list)
         self._callback = callback
+        self._salvo_idx = bisect_left(
+            [salvo.timestamp for salvo in self._salvos], offset
+        )
+        self._fire_delays = []
+        if offset > 0.0:
+            self._seek_players(offset)
+        self._clock.start(offset)
         self._thread = Thread(target=self._thread_handler)
         self._thread.name = f"program_{self._name}"
         self._thread.start()
         if self._audio_player:
             self._audio_player.play()
-        if self._ilda_player:
-            self._ilda_player.play()
-        if self._dmx_player:
-            self._dmx_player.play()
+        for ilda_player in self._ilda_players.values():
+            ilda_player.play()
+        for dmx_player in self._dmx_players.values():
+            dmx_player.play()
         LedController.instance().load_preset('running')
 
+    def _seek_players(self, offset: float):
+        logger.info(f"Starting program at offset {offset}")
+        if self._audio_player:
+            self._audio_player.seek(offset)
+        for ilda_player in self._ilda_players.values():
+            ilda_player.seek(offset)
+        for dmx_player in self._dmx_players.values():
+            dmx_player.seek(offset)
+
     def pause(self):
+        self._clock.pause()
         self._pause_event.set()
+        self._wakeup_event.set()
         if self._audio_player:
             self._audio_player.pause()
-        if self._ilda_player:
-            self._ilda_player.pause()
-        if self._dmx_player:
-            self._dmx_player.pause()
+        for ilda_player in self._ilda_players.values():
+            ilda_player.pause()
+        for dmx_player in self._dmx_players.values():
+            dmx_player.pause()
 
     def continue_(self):
+        self._clock.resume()
         self._continue_event.set()
+        self._wakeup_event.set()
         if self._audio_player:
             self._audio_player.play()
-        if self._ilda_player:
-            self._ilda_player.play()
-        if self._dmx_player:
-            self._dmx_player.play()
+        for ilda_player in self._ilda_players.values():
+            ilda_player.play()
+        for dmx_player in self._dmx_players.values():
+            dmx_player.play()
 
     def stop(self):
+        self._clock.pause()
         self._stop_event.set()
+        self._wakeup_event.set()
         if self._audio_player:
             self._audio_player.stop()
-        if self._ilda_player:
-            self._ilda_player.stop()
-        if self._dmx_player:
-            self._dmx_player.stop()
+        for ilda_player in self._ilda_players.values():
+            ilda_player.stop()
+        for dmx_player in self._dmx_players.values():
+            dmx_player.stop()
         self.join()
 
     def join(self):
@@ -317,41 +416,26 @@ class Program:
         self._thread = None
         LedController.instance().load_preset('idle')
 
-    @property
-    def _current_total_seconds(self) -> float:
-        return tu.timestamp_now()
-
     @property
     def _current_timestamp(self) -> float:
-        if self._paused:
-            return self._last_current_timestamp_before_pause
-        if self._start_timestamp is None:
+        if not self._clock.is_started:
             return None
-        return self._current_total_seconds - self._start_timestamp
+        return self._clock.now()
 
-    def _pause_handler(self) -> float:
-        self._last_current_timestamp_before_pause = self._current_timestamp
-        self._paused = True
-        pause_started_timestamp = self._current_total_seconds
+    def _pause_handler(self):
         while not self._continue_event.is_set():
             if self._stop_event.is_set():
-                pause_ended_timestamp = self._current_total_seconds
-                return pause_ended_timestamp - pause_started_timestamp
-            tu.sleep(tu.TIME_RESOLUTION)
+                return
+            self._wakeup_event.wait()
+            self._wakeup_event.clear()
         self._pause_event.clear()
         self._continue_event.clear()
-        pause_ended_timestamp = self._current_total_seconds
-        self._paused = False
-        return pause_ended_timestamp - pause_started_timestamp
 
     def _thread_handler(self):
-        self._seconds_paused = 0
-        self._command_idx = 0
-        self._start_timestamp = self._current_total_seconds
-
         hardware_was_locked = Hardware.is_locked()
         if hardware_was_locked:
             Hardware.unlock()
+        Hardware.reconcile()
         try:
             self._program_mainloop()
         finally:
@@ -364,27 +448,40 @@ class Program:
         self._callback()
 
     def _program_mainloop(self):
-        while (not self._stop_event.is_set()) and self._command_list:
+        while (
+            not self._stop_event.is_set()
+            and self._salvo_idx < len(self._salvos)
+        ):
 
             if self._pause_event.is_set():
-                self._seconds_paused += self._pause_handler()
-                for command in self._command_list:
-                    command.increase_timestamp(self._seconds_paused)
+                self._pause_handler()
                 if self._stop_event.is_set():
                     break
 
-            tu.sleep(tu.TIME_RESOLUTION)
-
-            command = self._command_list[self._command_idx]
-            if command.timestamp <= self._current_timestamp:
-                try:
-                    logger.debug(f"Light {command}")
-                    command.light()
-                except Exception:
-                    logger.exception(f"Exception while fireing {command}")
-                self._command_idx += 1
-                if self._command_idx >= len(self._command_list):
-                    break
+            self._fire_due_salvos()
+            if self._salvo_idx >= len(self._salvos):
+                break
+
+            salvo = self._salvos[self._salvo_idx]
+            timeout = self._clock.seconds_until(salvo.timestamp)
+            if timeout > 0:
+                self._wakeup_event.wait(timeout)
+            self._wakeup_event.clear()
+
+    def _fire_due_salvos(self):
+        current_timestamp = self._clock.now()
+        while self._salvo_idx < len(self._salvos):
+            salvo = self._salvos[self._salvo_idx]
+            if salvo.timestamp > current_timestamp:
+                break
+            try:
+                salvo.light(self._salvo_lit)
+            except Exception:
+                logger.exception(f"Exception while fireing {salvo}")
+            self._salvo_idx += 1
+
+    def _salvo_lit(self, salvo: Salvo):
+        self._fire_delays.append(self._clock.now() - salvo.timestamp)
 
     def _other_players_running(self) -> bool:
         result = False
@@ -392,9 +489,15 @@ class Program:
         if self._has_music:
             result = result or self._audio_player.is_playing() or self._audio_player.is_paused()
         if self._has_ilda:
-            result = result or self._ilda_player.is_playing() or self._ilda_player.is_paused()
+            result = result or any(
+                ilda_player.is_playing() or ilda_player.is_paused()
+                for ilda_player in self._ilda_players.values()
+            )
         if self._has_dmx:
-            result = result or self._dmx_player.is_playing() or self._dmx_player.is_paused()
+            result = result or any(
+                dmx_player.is_playing() or dmx_player.is_paused()
+                for dmx_player in self._dmx_players.values()
+            )
 
         return result
 
@@ -411,16 +514,54 @@ class Program:
     def name(self) -> str:
         return self._name
 
+    @property
+    def fire_delays(self) -> List[float]:
+        return self._fire_delays
+
+    @property
+    def salvo_spreads(self) -> List[float]:
+        return [
+            salvo.spread for salvo in self._salvos
+            if salvo.spread is not None
+        ]
+
     def get_state(self) -> Dict[str, Any]:
+        current_timestamp = self._current_timestamp
         return {
             'name': self._name,
             'command_list': [
-                cmd.get_state()
+                cmd.get_state(current_timestamp or 0.0)
                 for cmd in self._command_list
             ],
-            'time_paused': self._seconds_paused,
-            'start_timestamp': self._start_timestamp,
-            'current_timestamp': self._current_timestamp,
+            'time_paused': self._clock.seconds_paused,
+            'start_timestamp': self._clock.start_timestamp,
+            'current_timestamp': current_timestamp,
+            'max_fire_delay': max(self._fire_delays, default=None),
+            'max_salvo_spread': max(self.salvo_spreads, default=None),
+            'ilda_memory': {
+                projector_number: ilda_player.memory_usage()
+                for projector_number, ilda_player in self._ilda_players.items()
+            },
+            'ilda_feeder': {
+                projector_number: ilda_player.feeder_state()
+                for projector_number, ilda_player in self._ilda_players.items()
+            },
+            'ilda_playback': {
+                projector_number: ilda_player.playback_state()
+                for projector_number, ilda_player in self._ilda_players.items()
+            },
+            'dmx_playback': {
+                universe: dmx_player.playback_state()
+                for universe, dmx_player in self._dmx_players.items()
+            },
+            'dmx_output': {
+                universe: dmx_player.output_state()
+                for universe, dmx_player in self._dmx_players.items()
+            },
+            'ilda_scan_rates': {
+                projector_number: ilda_player.scan_rate_statistics()
+                for projector_number, ilda_player in self._ilda_players.items()
+            },
             'is_running': self.is_running
         }
 
@@ -0,0 +1,54 @@
+from itertools import groupby
+from typing import Callable, List
+
+from backend.command import Command
+from backend.ignition_engine import IgnitionEngine
+from backend.logger import logger
+
+
+class Salvo:
+
+    _timestamp: float
+    _commands: List[Command]
+    _spread: float
+    _on_lit: Callable[['Salvo'], None]
+
+    @classmethod
+    def from_commands(cls, commands: List[Command]) -> List['Salvo']:
+        return [
+            cls(timestamp, list(group))
+            for timestamp, group in groupby(
+                commands, key=lambda command: command.timestamp
+            )
+        ]
+
+    def __init__(self, timestamp: float, commands: List[Command]):
+        self._timestamp = timestamp
+        self._commands = commands
+        self._spread = None
+        self._on_lit = None
+
+    def _lit(self, spread: float):
+        self._spread = spread
+        if self._on_lit is not None:
+            self._on_lit(self)
+
+    def light(self, on_lit: Callable[['Salvo'], None] = None):
+        logger.debug(f"Light {self}")
+        self._on_lit = on_lit
+        IgnitionEngine.light(self._commands, self._lit)
+
+    @property
+    def timestamp(self) -> float:
+        return self._timestamp
+
+    @property
+    def commands(self) -> List[Command]:
+        return self._commands
+
+    @property
+    def spread(self) -> float:
+        return self._spread
+
+    def __str__(self):
+        return f"Salvo ({self._timestamp}): {len(self._commands)} commands"
@@ -9,21 +9,29 @@ from backend.logger import logger
 
 class Schedule:
 
+    COARSE_WAIT_MARGIN: float = 0.05
+    MAX_COARSE_WAIT: float = 1.0
+    SPIN_THRESHOLD: float = 0.002
+
     _scheduled_time: str
     _callback: Callable
     _datetime: datetime
+    _deadline: float
     _thread: Thread
     _cancel_event: Event
     _faulty: bool
+    _start_error: float
 
     def __init__(self, time: str, callback: Callable):
         self._scheduled_time = time
         self._datetime = tu.string_to_datetime(time)
+        self._deadline = tu.datetime_to_monotonic(self._datetime)
         self._callback = callback
         self._thread = Thread(target=self._thread_handler)
         self._thread.name = "schedule"
         self._cancel_event = Event()
         self._faulty = False
+        self._start_error = None
 
     def start(self):
         self._thread.start()
@@ -37,19 +45,44 @@ class Schedule:
         self._thread.join()
         LedController.instance().load_preset('loaded')
 
-    def _thread_handler(self):
+    def _coarse_wait(self) -> bool:
+        while not self._cancel_event.is_set():
+            self._deadline = tu.datetime_to_monotonic(self._datetime)
+            timeout = (
+                self._deadline - self.COARSE_WAIT_MARGIN - tu.monotonic_now()
+            )
+            if timeout <= 0:
+                return True
+            self._cancel_event.wait(min(timeout, self.MAX_COARSE_WAIT))
+        return False
+
+    def _fine_wait(self) -> bool:
+        timestamp = self.timestamp
         while not self._cancel_event.is_set():
-            if tu.datetime_reached(self._datetime):
-                try:
-                    logger.debug("Calling schedule callback")
-                    self._callback()
-                except Exception:
-                    logger.exception(
-                        "Exception while calling schedule callback"
-                    )
-                    self._faulty = True
-                break
-            tu.sleep(tu.TIME_RESOLUTION)
+            seconds_left = timestamp - tu.timestamp_now()
+            if seconds_left <= 0:
+                return True
+            if seconds_left > self.SPIN_THRESHOLD:
+                self._cancel_event.wait(seconds_left - self.SPIN_THRESHOLD)
+        return False
+
+    def _thread_handler(self):
+        if not self._coarse_wait():
+            return
+        if not self._fine_wait():
+            return
+        self._start_error = tu.timestamp_now() - self.timestamp
+        try:
+            self._callback()
+        except Exception:
+            logger.exception(
+                "Exception while calling schedule callback"
+            )
+            self._faulty = True
+        logger.debug(
+            f"Called schedule callback with start error "
+            f"{self._start_error:.6f} s"
+        )
 
     @property
     def timestamp(self):
@@ -57,12 +90,13 @@ class Schedule:
 
     @property
     def seconds_left(self) -> float:
-        return self.timestamp - tu.timestamp_now()
+        return self._deadline - tu.monotonic_now()
 
     def get_state(self) -> Dict[str, Any]:
         return {
             'timestamp': self.timestamp,
             'seconds_left': self.seconds_left,
             'faulty': self._faulty,
+            'start_error': self._start_error,
             'scheduled_time': self._scheduled_time
         }
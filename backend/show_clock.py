@@ -0,0 +1,81 @@
+import backend.time_util as tu
+
+
+class ShowClock:
+
+    _origin: float
+    _paused_at: float
+    _pause_started: float
+    _seconds_paused: float
+    _start_timestamp: float
+    _running: bool
+    _started: bool
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._running = False
+        self._started = False
+        self._origin = 0.0
+        self._paused_at = 0.0
+        self._pause_started = 0.0
+        self._seconds_paused = 0.0
+        self._start_timestamp = None
+
+    def start(self, offset: float = 0.0):
+        self._seconds_paused = 0.0
+        self._start_timestamp = tu.timestamp_now()
+        self._origin = tu.monotonic_now() - offset
+        self._started = True
+        self._running = True
+
+    def pause(self):
+        if not self._running:
+            return
+        self._pause_started = tu.monotonic_now()
+        self._paused_at = self._pause_started - self._origin
+        self._running = False
+
+    def resume(self):
+        if self._running or not self._started:
+            return
+        now = tu.monotonic_now()
+        self._seconds_paused += now - self._pause_started
+        self._origin = now - self._paused_at
+        self._running = True
+
+    def seek(self, timestamp: float):
+        if self._running:
+            self._origin = tu.monotonic_now() - timestamp
+        else:
+            self._paused_at = timestamp
+
+    def now(self) -> float:
+        if self._running:
+            return tu.monotonic_now() - self._origin
+        return self._paused_at
+
+    def seconds_until(self, timestamp: float) -> float:
+        return timestamp - self.now()
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def is_started(self) -> bool:
+        return self._started
+
+    @property
+    def seconds_paused(self) -> float:
+        if self._started and not self._running:
+            return (
+                self._seconds_paused
+                + tu.monotonic_now() - self._pause_started
+            )
+        return self._seconds_paused
+
+    @property
+    def start_timestamp(self) -> float:
+        return self._start_timestamp
@@ -5,6 +5,7 @@ from backend.config import Config
 
 TIME_ORIGIN: datetime = datetime(1970, 1, 1)
 TIME_RESOLUTION: float = Config.get_constant('time_resolution')
+NS_PER_S: int = 1_000_000_000
 
 
 def get_system_time() -> str:
@@ -15,6 +16,29 @@ def timestamp_now() -> float:
     return (datetime.now() - TIME_ORIGIN).total_seconds()
 
 
+def monotonic_ns() -> int:
+    return time.monotonic_ns()
+
+
+def monotonic_now() -> float:
+    return time.monotonic()
+
+
+def perf_counter_ns() -> int:
+    return time.perf_counter_ns()
+
+
+def wall_anchor() -> float:
+    monotonic_before = time.monotonic()
+    wall_timestamp = timestamp_now()
+    monotonic_after = time.monotonic()
+    return wall_timestamp - (monotonic_before + monotonic_after) / 2
+
+
+def datetime_to_monotonic(dt: datetime) -> float:
+    return datetime_to_timestamp(dt) - wall_anchor()
+
+
 def string_to_datetime(t: str) -> datetime:
     return datetime.fromisoformat(t)
 
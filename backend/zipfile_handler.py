@@ -48,6 +48,10 @@ class ZipfileHandler:
     def has_dmx(self) -> bool:
         return self._metadata['has_dmx']
     
+    @property
+    def dmx_output(self) -> str:
+        return self._metadata.get('dmx_output')
+
     @property
     def fuses_device_ids(self) -> List[str]:
         return self._metadata['fuses_device_ids']
@@ -0,0 +1,41 @@
+"""Compares the cost of the wall clock and monotonic clock functions.
+
+Run from the repository root:
+    python3 -m benchmarks.clock --calls 1000000
+"""
+import argparse
+from datetime import datetime, timedelta
+from timeit import timeit
+
+import backend.time_util as tu
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    future = datetime.now() + timedelta(days=1)
+    candidates = {
+        'timestamp_now': tu.timestamp_now,
+        'datetime_reached': lambda: tu.datetime_reached(future),
+        'monotonic_now': tu.monotonic_now,
+        'monotonic_ns': tu.monotonic_ns,
+        'perf_counter_ns': tu.perf_counter_ns,
+    }
+    for name, function in candidates.items():
+        seconds = timeit(function, number=args.calls)
+        print(f"{name:<24} {seconds / args.calls * tu.NS_PER_S:9.1f} ns/call")
+
+    resolutions = []
+    for _ in range(1000):
+        start = tu.monotonic_ns()
+        end = tu.monotonic_ns()
+        while end == start:
+            end = tu.monotonic_ns()
+        resolutions.append(end - start)
+    print(f"{'monotonic_ns step':<24} {min(resolutions):9.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Sends DMX universes over Art-Net or sACN to a UDP listener on loopback.
+
+Run from the repository root:
+    python3 -m benchmarks.dmx_network --protocol artnet --universes 4 --seconds 10 --rate 40
+"""
+import argparse
+import socket
+import struct
+import time
+from threading import Thread
+from typing import Dict
+
+from backend.dmx.network_dmx_interface import (
+    ArtNetPacket, DmxPacket, NetworkDmxInterface, NetworkDmxSender
+)
+from benchmarks.util import print_percentiles
+
+
+def packet_universe(packet_type: type, packet: bytes) -> int:
+    if packet_type is ArtNetPacket:
+        return struct.unpack_from('<H', packet, 14)[0]
+    return struct.unpack_from('>H', packet, 113)[0] - 1
+
+
+class Listener:
+
+    _socket: socket.socket
+    _packet_type: type
+    _thread: Thread
+    _running: bool
+    received: Dict[int, int]
+    receive_times: Dict[int, float]
+
+    def __init__(self, packet_type: type):
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind(("127.0.0.1", 0))
+        self._socket.settimeout(0.1)
+        self._packet_type = packet_type
+        self._running = True
+        self.received = {}
+        self.receive_times = {}
+        self._thread = Thread(target=self._receive)
+        self._thread.start()
+
+    @property
+    def port(self) -> int:
+        return self._socket.getsockname()[1]
+
+    def _receive(self):
+        while self._running:
+            try:
+                packet = self._socket.recv(1024)
+            except socket.timeout:
+                continue
+            now = time.monotonic()
+            universe = packet_universe(self._packet_type, packet)
+            self.received[universe] = self.received.get(universe, 0) + 1
+            update = struct.unpack_from(
+                '>I', packet, self._packet_type.HEADER_SIZE
+            )[0]
+            self.receive_times.setdefault(update, now)
+
+    def close(self):
+        self._running = False
+        self._thread.join()
+        self._socket.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--protocol', choices=list(NetworkDmxSender.PACKET_TYPES),
+        default='artnet'
+    )
+    parser.add_argument('--universes', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=10.0)
+    parser.add_argument('--rate', type=float, default=40.0)
+    args = parser.parse_args()
+
+    packet_type = NetworkDmxSender.PACKET_TYPES[args.protocol]
+    listener = Listener(packet_type)
+    sender = NetworkDmxSender(args.protocol, f"127.0.0.1:{listener.port}")
+    interfaces = [
+        NetworkDmxInterface(sender, universe)
+        for universe in range(args.universes)
+    ]
+    for interface in interfaces:
+        interface.initialize()
+
+    render_times = {}
+    updates = 1
+    filler = bytes(DmxPacket.SLOT_AMOUNT - 4)
+    cpu_start = time.process_time()
+    start = time.monotonic()
+    while time.monotonic() - start < args.seconds:
+        values = struct.pack('>I', updates) + filler
+        render_times[updates] = time.monotonic()
+        for interface in interfaces:
+            interface.set_channels(1, values)
+            interface.render()
+        updates += 1
+        time.sleep(1.0 / args.rate)
+    wall = time.monotonic() - start
+    cpu = time.process_time() - cpu_start
+    for interface in interfaces:
+        interface.destroy()
+    time.sleep(0.2)
+    listener.close()
+
+    state = sender.get_state()
+    print(f"{'cpu':<16} {cpu / wall * 100:8.1f} %")
+    print(f"{'player updates':<16} {(updates - 1) / wall:8.1f} /s")
+    print(f"{'packets sent':<16} {state['packets_sent'] / wall:8.1f} /s")
+    print(f"{'send errors':<16} {state['send_errors']:8d}")
+    for universe in range(args.universes):
+        print(
+            f"universe {universe}: "
+            f"{listener.received.get(universe, 0)} packets received"
+        )
+    print_percentiles(
+        "render to receive",
+        [
+            (listener.receive_times[update] - render_time) * 1e3
+            for update, render_time in render_times.items()
+            if update in listener.receive_times
+        ]
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Compares dmx.bin load times of the vectorized and the per-value parser.
+
+Run from the repository root:
+    python3 -m benchmarks.dmx_parse --minutes 10 --rate 40 --channels 96 --repeat 3
+    python3 -m benchmarks.dmx_parse --file /path/to/dmx.bin --repeat 3
+"""
+import argparse
+from timeit import default_timer
+from typing import List, Tuple
+
+import numpy as np
+
+from backend.dmx.dmx import (
+    DMX_MAGIC, DmxHeader, DmxElement, DmxValue, DMX_HEADER_DTYPE,
+    DMX_ELEMENT_DTYPE, DMX_VALUE_DTYPE
+)
+from backend.dmx.dmx_player import DmxPlayer
+from backend.dmx.dmx_timeline import DmxFrame
+
+
+class LegacyDmxParser:
+
+    HEADER_SIZE: int = DMX_HEADER_DTYPE.itemsize
+    ELEMENT_SIZE: int = DMX_ELEMENT_DTYPE.itemsize
+    VALUE_SIZE: int = DMX_VALUE_DTYPE.itemsize
+
+    @classmethod
+    def read_dmx_data(cls, dmx_data: bytes) -> List[DmxFrame]:
+        header = DmxHeader.from_buffer_copy(dmx_data[:cls.HEADER_SIZE])
+        frames = []
+        offset = cls.HEADER_SIZE
+        for _1 in range(header.elementAmount):
+            dmx_element = DmxElement.from_buffer_copy(
+                dmx_data[offset:offset + cls.ELEMENT_SIZE]
+            )
+            offset += cls.ELEMENT_SIZE
+            values = []
+            for _2 in range(dmx_element.valueAmount):
+                dmx_value = DmxValue.from_buffer_copy(
+                    dmx_data[offset:offset + cls.VALUE_SIZE]
+                )
+                offset += cls.VALUE_SIZE
+                values.append((dmx_value.channel, dmx_value.value))
+            frames.append(DmxFrame(
+                dmx_element.timestamp / 1000.0,
+                np.array(values, dtype=DMX_VALUE_DTYPE)
+            ))
+        return frames
+
+
+def generate(minutes: float, rate: float, channels: int) -> bytes:
+    rng = np.random.default_rng(0)
+    element_amount = int(minutes * 60 * rate)
+    header = np.zeros(1, dtype=DMX_HEADER_DTYPE)
+    header[0] = (DMX_MAGIC, 0, 0, element_amount, int(minutes * 60000))
+    chunks = [header.tobytes()]
+    for i in range(element_amount):
+        value_amount = int(rng.integers(0, channels + 1))
+        element = np.zeros(1, dtype=DMX_ELEMENT_DTYPE)
+        element[0] = (int(i * 1000 / rate), value_amount)
+        values = np.zeros(value_amount, dtype=DMX_VALUE_DTYPE)
+        values['channel'] = np.sort(
+            rng.choice(512, value_amount, replace=False)
+        ) + 1
+        values['value'] = rng.integers(0, 256, value_amount)
+        chunks.append(element.tobytes())
+        chunks.append(values.tobytes())
+    return b''.join(chunks)
+
+
+def measure(parse, data: bytes, repeat: int) -> Tuple[float, List[DmxFrame]]:
+    best = float('inf')
+    frames = None
+    for _ in range(repeat):
+        start = default_timer()
+        frames = parse(data)
+        best = min(best, default_timer() - start)
+    return best, frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--file', default=None)
+    parser.add_argument('--minutes', type=float, default=10.0)
+    parser.add_argument('--rate', type=float, default=40.0)
+    parser.add_argument('--channels', type=int, default=96)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, 'rb') as file:
+            data = file.read()
+    else:
+        data = generate(args.minutes, args.rate, args.channels)
+
+    legacy_seconds, legacy_frames = measure(
+        LegacyDmxParser.read_dmx_data, data, args.repeat
+    )
+    seconds, frames = measure(
+        lambda dmx_data: DmxPlayer._read_dmx_data(dmx_data)[1],
+        data, args.repeat
+    )
+
+    identical = len(frames) == len(legacy_frames) and all(
+        frame.timestamp == legacy_frame.timestamp
+        and np.array_equal(frame.values['channel'], legacy_frame.values['channel'])
+        and np.array_equal(frame.values['value'], legacy_frame.values['value'])
+        for frame, legacy_frame in zip(frames, legacy_frames)
+    )
+    value_amount = sum(len(frame.values) for frame in frames)
+    print(f"{len(data) / 1e6:.2f} MB, {len(frames)} frames, {value_amount} values")
+    print(f"{'per-value parser':<20} {legacy_seconds * 1e3:9.1f} ms")
+    print(f"{'vectorized parser':<20} {seconds * 1e3:9.1f} ms")
+    print(f"{'speedup':<20} {legacy_seconds / seconds:9.1f} x")
+    print(f"{'identical output':<20} {identical}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Measures the FTDI DMX refresh thread against a null device.
+
+The null device sleeps for the wire time of each frame (44 µs per slot), so
+the player-side timings show whether channel updates wait on the bus.
+
+Run from the repository root:
+    python3 -m benchmarks.dmx_refresh --seconds 10 --channels 64 --rate 40 --universes 1
+"""
+import argparse
+import time
+
+import backend.dmx.ftdi_dmx_interface as ftdi_dmx_interface
+from backend.dmx.ftdi_dmx_interface import FtdiDmxInterface
+from benchmarks.util import print_percentiles
+
+
+class NullFtdiFunctions:
+
+    def __init__(self, device: 'NullDevice'):
+        self._device = device
+
+    def __getattr__(self, name: str):
+        if name == 'ftdi_write_data':
+            return self._device.write_data
+        return lambda *args: 0
+
+
+class NullDevice:
+
+    SLOT_SECONDS: float = 44e-6
+
+    writes: int = 0
+
+    def __init__(self, device_id: str = None):
+        self.ftdi_fn = NullFtdiFunctions(self)
+
+    def write_data(self, data, length: int = None) -> int:
+        NullDevice.writes += 1
+        length = len(data) if length is None else length
+        time.sleep(length * self.SLOT_SECONDS)
+        return length
+
+    def write(self, data: bytes) -> int:
+        return self.write_data(data)
+
+    def close(self):
+        pass
+
+
+def measure(seconds: float, channels: int, rate: float, universes: int):
+    ftdi_dmx_interface.Device = NullDevice
+    interfaces = [
+        FtdiDmxInterface(f"null{universe}") for universe in range(universes)
+    ]
+    for interface in interfaces:
+        interface.initialize()
+    NullDevice.writes = 0
+    updates = 0
+    update_times = []
+    cpu_start = time.process_time()
+    start = time.monotonic()
+    while time.monotonic() - start < seconds:
+        if rate > 0:
+            for interface in interfaces:
+                update_start = time.perf_counter()
+                interface.set_channels(1, bytes([updates % 256]) * channels)
+                interface.render()
+                update_times.append((time.perf_counter() - update_start) * 1e3)
+            updates += 1
+            time.sleep(1.0 / rate)
+        else:
+            time.sleep(0.1)
+    wall = time.monotonic() - start
+    cpu = time.process_time() - cpu_start
+    writes = NullDevice.writes
+    states = [interface.get_state() for interface in interfaces]
+    for interface in interfaces:
+        interface.destroy()
+    print(f"{'cpu':<16} {cpu / wall * 100:8.1f} %")
+    print(f"{'bus writes':<16} {writes / wall:8.1f} /s")
+    print(f"{'player updates':<16} {updates / wall:8.1f} /s")
+    print_percentiles("set_channels + render", update_times)
+    for state in states:
+        print(f"interface {state['serial']}")
+        for key, value in state.items():
+            print(f"  {key:<22} {value}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seconds', type=float, default=10.0)
+    parser.add_argument('--channels', type=int, default=64)
+    parser.add_argument('--rate', type=float, default=40.0)
+    parser.add_argument('--universes', type=int, default=1)
+    args = parser.parse_args()
+    measure(args.seconds, args.channels, args.rate, args.universes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Measures the delay from each salvo deadline to its DummySMBus write.
+
+Run from the repository root:
+    python3 -m benchmarks.fuse_jitter --commands 200 --duration 10 \
+        --salvo-size 10
+"""
+import argparse
+import random
+from threading import Event
+
+from backend.address import Address
+from backend.command import Command
+from backend.ignition_engine import IgnitionEngine
+from backend.led_controller import LedController
+from backend.program import Program
+from benchmarks.util import print_percentiles
+
+
+def build_program(
+    command_amount: int, duration: float, salvo_size: int, seed: int
+) -> Program:
+    rng = random.Random(seed)
+    addresses = Address.all_addresses()
+    program = Program("Jitter-Benchmark")
+    timestamp = None
+    for idx in range(command_amount):
+        address = addresses[idx % len(addresses)]
+        if idx % salvo_size == 0:
+            timestamp = round(rng.uniform(0.0, duration), 3)
+        program.add_command(Command(address, timestamp, f"cmd_{idx}"))
+    return program
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--commands', type=int, default=200)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--salvo-size', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    LedController()
+    program = build_program(
+        args.commands, args.duration, args.salvo_size, args.seed
+    )
+    finished_event = Event()
+    program.run(callback=finished_event.set)
+    finished_event.wait()
+    program.join()
+    IgnitionEngine.drain()
+
+    delays = [delay * 1000.0 for delay in program.fire_delays]
+    spreads = [spread * 1000.0 for spread in program.salvo_spreads]
+    print_percentiles("fire delay", delays)
+    print_percentiles("salvo spread", spreads)
+
+
+if __name__ == "__main__":
+    main()
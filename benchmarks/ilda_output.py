@@ -0,0 +1,73 @@
+"""Plays an ILDX file into simulated Helios DACs and reports output timing.
+
+Run from the repository root:
+    python3 -m benchmarks.ilda_output --file /path/to/ilda.ildx --seconds 10 --offset 0
+"""
+import argparse
+import time
+
+import numpy as np
+
+from backend.ilda.dac_feeder import DacFeeder
+from backend.ilda.ilda_player import IldaPlayer
+from backend.ilda.ilda_timeline import IldaTimeline
+from backend.ilda.simulated_dac import SimulatedDacBackend
+from backend.show_clock import ShowClock
+from benchmarks.util import print_percentiles
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--file', required=True)
+    parser.add_argument('--seconds', type=float, default=10.0)
+    parser.add_argument('--offset', type=float, default=None)
+    args = parser.parse_args()
+
+    timelines = IldaTimeline.from_ildx_by_projector(args.file)
+    backend = SimulatedDacBackend(max(timelines) + 1)
+    DacFeeder.use_backend(backend)
+
+    offset = args.offset
+    if offset is None:
+        offset = min(
+            float(timeline.timestamps[0]) for timeline in timelines.values()
+        )
+    clock = ShowClock()
+    players = {
+        projector_number: IldaPlayer(timeline, clock, projector_number)
+        for projector_number, timeline in timelines.items()
+    }
+    for player in players.values():
+        player.seek(offset)
+    clock.start(offset)
+    for player in players.values():
+        player.play()
+    time.sleep(args.seconds)
+    for player in players.values():
+        player.stop()
+        player.destroy()
+
+    for projector_number, player in players.items():
+        frames = np.array(backend.dac(projector_number).frames)
+        print(f"projector {projector_number}")
+        if len(frames):
+            written_at, started_at, ended_at = frames[:, :3].T
+            print_percentiles(
+                "write to scan start",
+                ((started_at - written_at) * 1e3).tolist()
+            )
+            print_percentiles(
+                "scan start interval", (np.diff(started_at) * 1e3).tolist()
+            )
+            gaps = np.maximum(started_at[1:] - ended_at[:-1], 0.0)
+            print_percentiles("scan gap", (gaps * 1e3).tolist())
+        for key, value in player.feeder_state().items():
+            print(f"  {key:<22} {value}")
+        for key, value in backend.dac(projector_number).get_state().items():
+            print(f"  {key:<22} {value}")
+        for key, value in player.playback_state().items():
+            print(f"  {key:<22} {value}")
+
+
+if __name__ == "__main__":
+    main()
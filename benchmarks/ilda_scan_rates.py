@@ -0,0 +1,43 @@
+"""Reports per-frame ILDA scan rates before and after point optimization.
+
+Run from the repository root:
+    python3 -m benchmarks.ilda_scan_rates --file /path/to/ilda.ildx --max-pps 30000 --dwell 3
+"""
+import argparse
+from timeit import default_timer
+
+from backend.ilda.ilda_timeline import IldaTimeline
+from backend.ilda.point_optimizer import PointOptimizer
+from benchmarks.util import print_percentiles
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--file', required=True)
+    parser.add_argument(
+        '--max-pps', type=int, default=PointOptimizer.MAX_POINTS_PER_SECOND
+    )
+    parser.add_argument(
+        '--dwell', type=int, default=PointOptimizer.DWELL_POINTS
+    )
+    args = parser.parse_args()
+
+    timeline = IldaTimeline.from_ildx(
+        args.file, PointOptimizer(args.max_pps, args.dwell)
+    )
+    start = default_timer()
+    timeline.frame_points(range(len(timeline)))
+    seconds = default_timer() - start
+
+    scan_rates = timeline.scan_rates()
+    print(f"{len(timeline)} frames loaded and optimized in {seconds * 1e3:.1f} ms")
+    print_percentiles(
+        "requested scan rate", scan_rates['requested'].tolist(), "pps"
+    )
+    print_percentiles("output scan rate", scan_rates['output'].tolist(), "pps")
+    for key, value in timeline.scan_rate_statistics().items():
+        print(f"{key:<24} {value}")
+
+
+if __name__ == "__main__":
+    main()
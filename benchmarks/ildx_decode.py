@@ -0,0 +1,217 @@
+"""Compares ILDX load times of the vectorized and the per-point decoder.
+
+Run from the repository root:
+    python3 -m benchmarks.ildx_decode --file /path/to/ilda.ildx --repeat 3
+"""
+import argparse
+import ctypes
+from dataclasses import dataclass
+from timeit import default_timer
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from backend.ilda.ilda import HELIOS_POINT_DTYPE
+from backend.ilda.ildx import (
+    IldxFormatCode, ILDX_STATUS_CODE_BLANKING_MASK, IldxHeader,
+    IldxColorPlatteRecord, Ildx3dIndexedRecord, Ildx2dIndexedRecord, Ildx3dTrueColorRecord,
+    Ildx2dTrueColorRecord, decode_start_timestamp
+)
+from backend.ilda.ildx_decoder import IldaFrame, IldxDecoder
+
+
+@dataclass
+class IldaAnimation:
+    frames: List[IldaFrame]
+    start_timestamp: int
+    fps: int
+
+
+class LegacyIldxDecoder(IldxDecoder):
+
+    INDEXED_FORMAT_CODES = (
+        IldxFormatCode.ILDX_FORMAT_CODE_3D_INDEXED,
+        IldxFormatCode.ILDX_FORMAT_CODE_2D_INDEXED
+    )
+    RECORD_TYPES = {
+        IldxFormatCode.ILDX_FORMAT_CODE_3D_INDEXED: Ildx3dIndexedRecord,
+        IldxFormatCode.ILDX_FORMAT_CODE_2D_INDEXED: Ildx2dIndexedRecord,
+        IldxFormatCode.ILDX_FORMAT_CODE_3D_TRUE_COLOR: Ildx3dTrueColorRecord,
+        IldxFormatCode.ILDX_FORMAT_CODE_2D_TRUE_COLOR: Ildx2dTrueColorRecord
+    }
+    COLOR_SIZE = ctypes.sizeof(IldxColorPlatteRecord)
+
+    def decode(self) -> List[IldaFrame]:
+        self._color_palette = self.DEFAULT_COLOR_PALETTE
+        animations = {}
+        animation, offset, was_palette = self._read_animation(0)
+        while animation is not None:
+            if not was_palette:
+                animations[animation.start_timestamp / 1000.0] = animation
+            animation, offset, was_palette = self._read_animation(offset)
+
+        items = []
+        for start_timestamp, animation in animations.items():
+            ms_per_frame = 1000.0 / animation.fps
+            for i, frame in enumerate(animation.frames):
+                frame.timestamp = start_timestamp + (i * ms_per_frame) / 1000.0
+                frame.last_frame = i == len(animation.frames) - 1
+                frame.points_per_second = animation.fps * len(frame.points)
+            items.extend(animation.frames)
+        return items
+
+    def _read_animation(
+        self, offset: int
+    ) -> Tuple[IldaAnimation, int, bool]:
+        try:
+            header = IldxHeader.from_buffer_copy(
+                self._data[offset:offset + self.HEADER_SIZE]
+            )
+            header.frameOrPaletteName.decode('utf-8')
+        except ValueError:
+            return None, offset, False
+
+        fps = header.framesPerSecondOrFrameAmount or self.DEFAULT_FPS
+        format_code = IldxFormatCode(header.formatCode)
+        if format_code == IldxFormatCode.ILDX_FORMAT_CODE_COLOR_PALETTE:
+            offset += self.HEADER_SIZE
+            self._color_palette = []
+            for _ in range(header.numberOfRecords):
+                color = IldxColorPlatteRecord.from_buffer_copy(
+                    self._data[offset:offset + self.COLOR_SIZE]
+                )
+                self._color_palette.append((color.r, color.g, color.b))
+                offset += self.COLOR_SIZE
+            return IldaAnimation(None, -1, -1), offset, True
+        if header.totalFrames == 0:
+            return None, offset, False
+
+        frames = []
+        for i in range(header.totalFrames):
+            new_frames, offset = self._read_frame(offset, i == 0)
+            if new_frames is None:
+                break
+            frames.extend(new_frames)
+        return (
+            IldaAnimation(frames, decode_start_timestamp(header), fps),
+            offset, False
+        )
+
+    def _read_frame(
+        self, offset: int, is_first_frame: bool = False
+    ) -> Tuple[List[IldaFrame], int]:
+        data = self._data
+        try:
+            header = IldxHeader.from_buffer_copy(
+                data[offset:offset + self.HEADER_SIZE]
+            )
+        except ValueError:
+            return None, offset + self.HEADER_SIZE
+        offset += self.HEADER_SIZE
+
+        format_code = IldxFormatCode(header.formatCode)
+        number_of_points = header.numberOfRecords
+        if is_first_frame:
+            repetitions = 1
+        else:
+            repetitions = max(1, header.framesPerSecondOrFrameAmount)
+
+        point_type = self.RECORD_TYPES[format_code]
+        point_size = ctypes.sizeof(point_type)
+        if format_code in self.INDEXED_FORMAT_CODES:
+            converter_func = self._convert_indexed_point
+        else:
+            converter_func = self._convert_true_color_point
+
+        raw_points = [
+            point_type.from_buffer_copy(
+                data[offset + i * point_size:offset + (i + 1) * point_size]
+            )
+            for i in range(number_of_points)
+        ]
+        points = np.array(
+            [
+                converter_func(point, i == 0 or i == len(raw_points) - 1)
+                for i, point in enumerate(raw_points)
+            ],
+            dtype=HELIOS_POINT_DTYPE
+        )
+        return (
+            [IldaFrame(None, points) for _ in range(repetitions)],
+            offset + number_of_points * point_size
+        )
+
+    def _rescale_point(self, x: int, y: int) -> Tuple[int, int]:
+        return (
+            (-(x + 0xFFFF // 2) * 0xFFF // 0xFFFF) & 0xFFFF,
+            ((y + 0xFFFF // 2) * 0xFFF // 0xFFFF) & 0xFFFF
+        )
+
+    def _convert_indexed_point(
+        self, point: Union[Ildx2dIndexedRecord, Ildx3dIndexedRecord],
+        is_end_point: bool
+    ) -> Tuple[int, ...]:
+        blanked = bool(point.statusCode & ILDX_STATUS_CODE_BLANKING_MASK)
+        return (
+            *self._rescale_point(point.x, point.y),
+            *self._color_palette[point.colorIndex],
+            0 if (blanked or is_end_point) else 255
+        )
+
+    def _convert_true_color_point(
+        self, point: Union[Ildx3dTrueColorRecord, Ildx2dTrueColorRecord],
+        is_end_point: bool
+    ) -> Tuple[int, ...]:
+        visible = not (
+            point.statusCode & ILDX_STATUS_CODE_BLANKING_MASK or is_end_point
+        )
+        return (
+            *self._rescale_point(point.x, point.y),
+            point.r if visible else 0,
+            point.g if visible else 0,
+            point.b if visible else 0,
+            255 if visible else 0
+        )
+
+
+def measure(decoder_class: type, data: bytes, repeat: int) -> Tuple[
+    float, List[IldaFrame]
+]:
+    best = float('inf')
+    frames = None
+    for _ in range(repeat):
+        start = default_timer()
+        frames = decoder_class(data).decode()
+        best = min(best, default_timer() - start)
+    return best, frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--file', required=True)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with open(args.file, 'rb') as file:
+        data = file.read()
+
+    legacy_seconds, legacy_frames = measure(
+        LegacyIldxDecoder, data, args.repeat
+    )
+    seconds, frames = measure(IldxDecoder, data, args.repeat)
+
+    identical = len(frames) == len(legacy_frames) and all(
+        frame.timestamp == legacy_frame.timestamp
+        and np.array_equal(frame.points, legacy_frame.points)
+        for frame, legacy_frame in zip(frames, legacy_frames)
+    )
+    point_amount = sum(len(frame.points) for frame in frames)
+    print(f"{len(data) / 1e6:.2f} MB, {len(frames)} frames, {point_amount} points")
+    print(f"{'per-point decoder':<20} {legacy_seconds * 1e3:9.1f} ms")
+    print(f"{'vectorized decoder':<20} {seconds * 1e3:9.1f} ms")
+    print(f"{'speedup':<20} {legacy_seconds / seconds:9.1f} x")
+    print(f"{'identical output':<20} {identical}")
+
+
+if __name__ == "__main__":
+    main()
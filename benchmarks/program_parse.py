@@ -0,0 +1,83 @@
+"""Measures validating, grouping and parsing JSON programs of growing size.
+
+Run from the repository root:
+    python3 -m benchmarks.program_parse --events 1000 10000 100000
+"""
+import argparse
+import random
+from string import ascii_lowercase
+from timeit import default_timer
+from typing import Any, Dict, List
+
+from backend.config import Config
+from backend.program import Program
+
+
+def build_events(
+    event_amount: int, device_amount: int, seed: int
+) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    device_ids = [Config.get_value('device_id')] + [
+        f"device{idx}" for idx in range(1, device_amount)
+    ]
+    return [
+        {
+            'name': f"event_{idx}",
+            'device_id': rng.choice(device_ids),
+            'letter': rng.choice(ascii_lowercase[:4]),
+            'number': rng.randrange(16),
+            'timestamp': round(rng.uniform(0.0, 600.0), 3)
+        }
+        for idx in range(event_amount)
+    ]
+
+
+def measure(function, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = default_timer()
+        function()
+        best = min(best, default_timer() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--events', type=int, nargs='+', default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument('--devices', type=int, default=8)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for event_amount in args.events:
+        events = build_events(event_amount, args.devices, args.seed)
+        fuse_table = Program.raise_on_json(events)
+        timings = {
+            'raise_on_json': lambda: Program.raise_on_json(events),
+            'split_json': lambda: fuse_table.split_json(events),
+            'from_json': lambda: Program.from_json("Benchmark", events),
+        }
+        for name, function in timings.items():
+            seconds = measure(function, args.repeat)
+            print(
+                f"{event_amount:>7} events  {name:<14} "
+                f"{seconds * 1e3:9.2f} ms  "
+                f"{seconds / event_amount * 1e6:7.2f} us/event"
+            )
+
+        broken = [dict(event) for event in events]
+        for event in broken[::100]:
+            event['number'] = 99
+        try:
+            Program.raise_on_json(broken)
+        except Program.InvalidProgram as exception:
+            print(
+                f"{event_amount:>7} events  reported "
+                f"{len(exception.errors)} errors in one pass"
+            )
+
+
+if __name__ == "__main__":
+    main()
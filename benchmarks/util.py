@@ -0,0 +1,24 @@
+from statistics import quantiles
+from typing import Dict, List
+
+PERCENTILES: List[int] = [50, 90, 99]
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    if len(values) < 2:
+        value = values[0] if values else 0.0
+        result = {f"p{p}": value for p in PERCENTILES}
+        result['max'] = value
+        return result
+    cut_points = quantiles(values, n=100, method='inclusive')
+    result = {f"p{p}": cut_points[p - 1] for p in PERCENTILES}
+    result['max'] = max(values)
+    return result
+
+
+def print_percentiles(title: str, values: List[float], unit: str = "ms"):
+    result = percentiles(values)
+    columns = "  ".join(
+        f"{key}={value:9.3f} {unit}" for key, value in result.items()
+    )
+    print(f"{title:<24} n={len(values):<7} {columns}")
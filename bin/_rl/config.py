@@ -222,6 +222,30 @@ class Config:
     def set_debug(cls, value: bool):
         cls._set_config('debug', bool(value))
 
+    @classmethod
+    def get_dmx_serials(cls) -> str:
+        return cls._get_config('dmx_serials')
+
+    @classmethod
+    def set_dmx_serials(cls, value: str):
+        cls._set_config('dmx_serials', str(value))
+
+    @classmethod
+    def get_dmx_output(cls) -> str:
+        return cls._get_config('dmx_output')
+
+    @classmethod
+    def set_dmx_output(cls, value: str):
+        cls._set_config('dmx_output', str(value))
+
+    @classmethod
+    def get_dmx_target(cls) -> str:
+        return cls._get_config('dmx_target')
+
+    @classmethod
+    def set_dmx_target(cls, value: str):
+        cls._set_config('dmx_target', str(value))
+
     @classmethod
     def get_master(cls) -> bool:
         return cls._get_run_config('master')
@@ -283,6 +307,8 @@ class Config:
                 return FormatValidator.validate_timezone(value)
             elif key == 'system_time':
                 return FormatValidator.validate_datetime(value)
+            elif key == 'dmx_output':
+                return value in ['ftdi', 'artnet', 'sacn']
             else:
                 return True
         elif key == 'chip_amount':
@@ -296,6 +322,9 @@ class Config:
         'device_id': Ask.string,
         'chip_amount': Ask.integer,
         'debug': Ask.boolean,
+        'dmx_serials': Ask.string,
+        'dmx_output': Ask.string,
+        'dmx_target': Ask.string,
         'master': Ask.boolean,
         'device': Ask.boolean,
         'timezone': Ask.timezone,
@@ -307,6 +336,9 @@ class Config:
         'device_id': str,
         'chip_amount': int,
         'debug': bool,
+        'dmx_serials': str,
+        'dmx_output': str,
+        'dmx_target': str,
         'master': bool,
         'device': bool,
         'timezone': str,
@@ -319,6 +351,9 @@ Config.SET_METHODS: Dict[str, Callable] = {
     'device_id': Config.set_device_id,
     'chip_amount': Config.set_chip_amount,
     'debug': Config.set_debug,
+    'dmx_serials': Config.set_dmx_serials,
+    'dmx_output': Config.set_dmx_output,
+    'dmx_target': Config.set_dmx_target,
     'master': Config.set_master,
     'device': Config.set_device,
     'timezone': Config.set_timezone,
@@ -331,6 +366,9 @@ Config.GET_METHODS: Dict[str, Callable] = {
     'device_id': Config.get_device_id,
     'chip_amount': Config.get_chip_amount,
     'debug': Config.get_debug,
+    'dmx_serials': Config.get_dmx_serials,
+    'dmx_output': Config.get_dmx_output,
+    'dmx_target': Config.get_dmx_target,
     'master': Config.get_master,
     'device': Config.get_device,
     'timezone': Config.get_timezone,
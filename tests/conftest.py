@@ -0,0 +1,4 @@
+from backend.instance import Instance
+
+# Devices compile and load the local program when backend.program is imported.
+Instance._is_master = True
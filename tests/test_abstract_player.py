@@ -0,0 +1,27 @@
+from backend.abstract_player import AbstractPlayer
+
+
+class DummyPlayer(AbstractPlayer):
+
+    def __init__(self):
+        self._timestamps = [0.0]
+        super().__init__()
+
+    def _start_playing(self):
+        pass
+
+    def _play_item(self):
+        pass
+
+    def _end_playing(self):
+        pass
+
+
+def test_lateness_on_bucket_boundary_counts_in_upper_bucket():
+    player = DummyPlayer()
+    for lateness in [0.0005, 0.001, 0.005, 0.5, 0.7]:
+        player._count_lateness(lateness)
+    assert player.playback_state()['lateness_histogram'] == {
+        '<1ms': 1, '<5ms': 1, '<10ms': 1, '<50ms': 0,
+        '<100ms': 0, '<500ms': 0, '>=500ms': 2
+    }
@@ -0,0 +1,50 @@
+import pytest
+
+from backend.controller import DeviceController
+from backend.led_controller import LedController
+
+
+class FakeProgram:
+
+    name: str = "fake"
+
+    def __init__(self):
+        self.calls = []
+
+    def run(self, callback, offset: float = 0.0):
+        self.calls.append(('run', offset))
+
+    def pause(self):
+        self.calls.append(('pause',))
+
+    def continue_(self):
+        self.calls.append(('continue',))
+
+    def stop(self):
+        self.calls.append(('stop',))
+
+
+@pytest.fixture
+def program():
+    led_controller = LedController.instance() or LedController()
+    program = FakeProgram()
+    DeviceController._state_machine.transition(DeviceController.LOADED, program)
+    yield program
+    DeviceController._state_machine.reset()
+    DeviceController._program = None
+    led_controller.off()
+
+
+def test_run_pause_run_continues_program(program):
+    DeviceController.run_program(2.5)
+    DeviceController.pause_program()
+    DeviceController.run_program()
+    assert DeviceController._state_machine.state == DeviceController.RUNNING
+    assert program.calls == [('run', 2.5), ('pause',), ('continue',)]
+
+
+def test_run_program_ignores_offset_when_paused(program):
+    DeviceController.run_program()
+    DeviceController.pause_program()
+    DeviceController.run_program(10.0)
+    assert program.calls == [('run', 0.0), ('pause',), ('continue',)]
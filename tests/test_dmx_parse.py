@@ -0,0 +1,18 @@
+import numpy as np
+
+from backend.dmx.dmx_player import DmxPlayer
+from benchmarks.dmx_parse import LegacyDmxParser, generate
+
+
+def test_matches_legacy_parser():
+    data = generate(minutes=0.1, rate=40, channels=32)
+    universe, frames, offset = DmxPlayer._read_dmx_data(data)
+    legacy_frames = LegacyDmxParser.read_dmx_data(data)
+    assert offset == len(data)
+    assert len(frames) == len(legacy_frames) == 240
+    for frame, legacy_frame in zip(frames, legacy_frames):
+        assert frame.timestamp == legacy_frame.timestamp
+        assert np.array_equal(
+            frame.values['channel'], legacy_frame.values['channel']
+        )
+        assert np.array_equal(frame.values['value'], legacy_frame.values['value'])
@@ -0,0 +1,60 @@
+import numpy as np
+
+from backend.dmx.dmx import DMX_UNIVERSE_SIZE, DMX_VALUE_DTYPE
+from backend.dmx.dmx_timeline import DmxFrame, DmxTimeline
+
+
+def random_frames(amount, seed=0):
+    rng = np.random.default_rng(seed)
+    frames = []
+    for position in range(amount):
+        value_amount = int(rng.integers(0, 8))
+        values = np.zeros(value_amount, dtype=DMX_VALUE_DTYPE)
+        values['channel'] = np.sort(
+            rng.choice(512, value_amount, replace=False)
+        ) + 1
+        values['value'] = rng.integers(0, 256, value_amount)
+        frames.append(DmxFrame(position / 40.0, values))
+    return frames
+
+
+def replay(frames):
+    state = np.zeros(DMX_UNIVERSE_SIZE, dtype=np.uint8)
+    states = []
+    for frame in frames:
+        states.append(state.copy())
+        state[frame.values['channel']] = frame.values['value']
+    states.append(state.copy())
+    return states
+
+
+def test_state_and_span_match_replay():
+    interval = DmxTimeline.KEYFRAME_INTERVAL
+    frames = random_frames(2 * interval + 17)
+    timeline = DmxTimeline.from_frames(frames)
+    states = replay(frames)
+    assert len(timeline) == len(frames)
+    positions = set(range(0, len(frames), 7)) | {
+        interval - 1, interval, interval + 1,
+        2 * interval - 1, 2 * interval, len(frames) - 1
+    }
+    for position in sorted(positions):
+        assert np.array_equal(timeline.state_at(position), states[position])
+        first_channel, span = timeline.span(position)
+        applied = states[position].copy()
+        applied[first_channel:first_channel + len(span)] = span
+        assert np.array_equal(applied, states[position + 1])
+        channels = frames[position].values['channel']
+        if len(channels):
+            assert first_channel == channels.min()
+            assert first_channel + len(span) - 1 == channels.max()
+        else:
+            assert len(span) == 0
+
+
+def test_final_keyframe_on_interval_boundary():
+    interval = DmxTimeline.KEYFRAME_INTERVAL
+    frames = random_frames(interval, seed=1)
+    timeline = DmxTimeline.from_frames(frames)
+    assert len(timeline.keyframes) == 2
+    assert np.array_equal(timeline.keyframes[1], replay(frames)[-1])
@@ -0,0 +1,52 @@
+from backend.fuse_table import FuseTable
+
+
+def event(**overrides):
+    event = {
+        'name': "fuse", 'device_id': "Device", 'letter': "a",
+        'number': 3, 'timestamp': 1.5
+    }
+    event.update(overrides)
+    return event
+
+
+def test_valid_events():
+    table = FuseTable.from_json([event(), event(letter="B", timestamp=0.5)])
+    assert table.errors == []
+    assert table.events_for("device") == [
+        ("fuse", "b", 3, 0.5), ("fuse", "a", 3, 1.5)
+    ]
+
+
+def test_empty_letter_is_invalid():
+    table = FuseTable.from_json([event(), event(letter="")])
+    assert table.errors == [
+        "Element 1: 'letter' has to be an ascii letter!"
+    ]
+
+
+def test_non_string_letter_is_reported_once():
+    table = FuseTable.from_json([event(letter=1)])
+    assert table.errors == ["Element 0: 'letter' has to be a string!"]
+
+
+def test_list_numbers_are_invalid():
+    table = FuseTable.from_json([event(number=[1]), event(number=[2])])
+    assert table.errors == [
+        "Element 0: 'number' has to be an integer!",
+        "Element 1: 'number' has to be an integer!"
+    ]
+
+
+def test_ragged_timestamps_are_invalid():
+    table = FuseTable.from_json([event(timestamp=[1.0]), event(timestamp=[])])
+    assert table.errors == [
+        "Element 0: 'timestamp' has to be a float!",
+        "Element 1: 'timestamp' has to be a float!"
+    ]
+
+
+def test_non_integral_number_is_invalid():
+    table = FuseTable.from_json([event(number=3.7), event(number="4")])
+    assert table.errors == ["Element 0: 'number' has to be an integer!"]
+    assert table.events_for("device")[1][2] == 4
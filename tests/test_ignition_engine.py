@@ -0,0 +1,65 @@
+import pytest
+
+import backend.time_util as tu
+from backend.address import Address
+from backend.command import Command
+from backend.hardware import Hardware
+from backend.ignition_engine import IgnitionEngine
+
+
+@pytest.fixture
+def hardware(monkeypatch):
+    calls = []
+    now = [100.0]
+    monkeypatch.setattr(tu, 'monotonic_now', lambda: now[0])
+    monkeypatch.setattr(
+        Hardware, 'light_many',
+        lambda addresses: calls.append(('light', addresses)) or 0.001
+    )
+    monkeypatch.setattr(
+        Hardware, 'unlight_many',
+        lambda addresses: calls.append(('unlight', addresses))
+    )
+    monkeypatch.setattr(IgnitionEngine, '_pending', [])
+    yield calls, now
+
+
+def command(number, timestamp=0.0):
+    return Command(Address("device", "a", number), timestamp, f"fuse {number}")
+
+
+def test_unlights_in_ignition_order(hardware):
+    calls, now = hardware
+    first, second, third = command(1), command(2), command(3)
+    spreads = []
+    IgnitionEngine._ignite([first], spreads.append)
+    now[0] += 0.1
+    IgnitionEngine._ignite([second, third], spreads.append)
+    assert spreads == [0.001, 0.001]
+    assert first.fireing and second.fireing and third.fireing
+
+    IgnitionEngine._extinguish_due(now[0] + IgnitionEngine.IGNITION_DURATION - 0.05)
+    assert first.fired and not second.fired
+    IgnitionEngine._extinguish_due(now[0] + IgnitionEngine.IGNITION_DURATION)
+    assert second.fired and third.fired and not third.fireing
+    assert IgnitionEngine.pending_amount() == 0
+    assert calls == [
+        ('light', [first.address]),
+        ('light', [second.address, third.address]),
+        ('unlight', [first.address]),
+        ('unlight', [second.address, third.address])
+    ]
+
+
+def test_failed_light_is_not_fireing(hardware, monkeypatch):
+    def fail(addresses):
+        raise OSError("bus error")
+
+    monkeypatch.setattr(Hardware, 'light_many', fail)
+    failed = command(1)
+    lit = []
+    IgnitionEngine._ignite([failed], lit.append)
+    state = failed.get_state()
+    assert not state['fireing'] and not state['fired'] and state['faulty']
+    assert lit == []
+    assert IgnitionEngine.pending_amount() == 0
@@ -0,0 +1,92 @@
+import socket
+import struct
+
+import pytest
+
+from backend.dmx.network_dmx_interface import (
+    ArtNetPacket, NetworkDmxInterface, NetworkDmxSender, SacnPacket
+)
+
+
+@pytest.fixture
+def receiver():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.settimeout(2.0)
+    yield sock
+    sock.close()
+
+
+def open_interface(protocol, receiver, universe):
+    target = f"127.0.0.1:{receiver.getsockname()[1]}"
+    interface = NetworkDmxInterface(
+        NetworkDmxSender(protocol, target), universe
+    )
+    interface.initialize()
+    return interface
+
+
+def test_artnet_packet(receiver):
+    interface = open_interface('artnet', receiver, 3)
+    try:
+        interface.set_channels(1, bytes([10, 20]))
+        interface.set_channels(512, bytes([30]))
+        interface.render()
+        packet = receiver.recv(1024)
+    finally:
+        interface.destroy()
+    assert len(packet) == ArtNetPacket.HEADER_SIZE + 512
+    assert packet[:8] == ArtNetPacket.ID
+    assert struct.unpack_from('<H', packet, 8)[0] == ArtNetPacket.OP_DMX
+    assert struct.unpack_from('>H', packet, 10)[0] == 14
+    assert packet[12] == 1
+    assert struct.unpack_from('<H', packet, 14)[0] == 3
+    assert struct.unpack_from('>H', packet, 16)[0] == 512
+    slots = packet[ArtNetPacket.HEADER_SIZE:]
+    assert slots[:3] == bytes([10, 20, 0])
+    assert slots[-1] == 30
+
+
+def test_sacn_packet(receiver):
+    interface = open_interface('sacn', receiver, 3)
+    try:
+        interface.set_channels(2, bytes([40]))
+        interface.render()
+        packet = receiver.recv(1024)
+    finally:
+        interface.destroy()
+    assert len(packet) == SacnPacket.HEADER_SIZE + 512
+    assert packet[4:16] == SacnPacket.ACN_ID
+    assert packet[111] == 1
+    assert struct.unpack_from('>H', packet, 113)[0] == 4
+    assert struct.unpack_from('>H', packet, 123)[0] == 513
+    slots = packet[SacnPacket.HEADER_SIZE:]
+    assert slots[:3] == bytes([0, 40, 0])
+
+
+def test_sequence_wraps():
+    artnet = ArtNetPacket(0, "test")
+    sacn = SacnPacket(0, "test")
+    artnet_sequences = []
+    sacn_sequences = []
+    for _ in range(512):
+        artnet.advance_sequence()
+        sacn.advance_sequence()
+        artnet_sequences.append(artnet.buffer[ArtNetPacket.SEQUENCE_OFFSET])
+        sacn_sequences.append(sacn.buffer[SacnPacket.SEQUENCE_OFFSET])
+    assert artnet_sequences[:256] == list(range(1, 256)) + [1]
+    assert sacn_sequences[:257] == list(range(1, 256)) + [0, 1]
+    assert 0 not in artnet_sequences
+
+
+@pytest.mark.parametrize('protocol', ['artnet', 'sacn'])
+def test_keepalive_resends(monkeypatch, receiver, protocol):
+    monkeypatch.setattr(NetworkDmxSender, 'KEEPALIVE_INTERVAL', 0.05)
+    interface = open_interface(protocol, receiver, 0)
+    try:
+        interface.set_channels(1, bytes([7]))
+        packets = [receiver.recv(1024) for _ in range(3)]
+    finally:
+        interface.destroy()
+    header_size = NetworkDmxSender.PACKET_TYPES[protocol].HEADER_SIZE
+    assert all(packet[header_size] == 7 for packet in packets)
@@ -0,0 +1,18 @@
+from backend.address import Address
+from backend.command import Command
+from backend.salvo import Salvo
+
+
+def test_groups_equal_timestamps():
+    commands = [
+        Command(Address("device", letter, number), timestamp, "fuse")
+        for letter, number, timestamp in [
+            ("a", 0, 1.0), ("a", 1, 1.0), ("b", 0, 1.0),
+            ("a", 2, 1.5), ("c", 3, 2.0), ("c", 4, 2.0)
+        ]
+    ]
+    salvos = Salvo.from_commands(commands)
+    assert [salvo.timestamp for salvo in salvos] == [1.0, 1.5, 2.0]
+    assert [salvo.commands for salvo in salvos] == [
+        commands[:3], commands[3:4], commands[4:]
+    ]
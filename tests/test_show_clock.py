@@ -0,0 +1,61 @@
+import pytest
+
+import backend.time_util as tu
+from backend.show_clock import ShowClock
+
+
+@pytest.fixture
+def now(monkeypatch):
+    now = [50.0]
+    monkeypatch.setattr(tu, 'monotonic_now', lambda: now[0])
+    return now
+
+
+def test_start_with_offset(now):
+    clock = ShowClock()
+    assert not clock.is_started and clock.now() == 0.0
+    clock.start(2.0)
+    now[0] += 1.5
+    assert clock.is_running
+    assert clock.now() == pytest.approx(3.5)
+    assert clock.seconds_until(5.0) == pytest.approx(1.5)
+
+
+def test_pause_and_resume(now):
+    clock = ShowClock()
+    clock.start()
+    now[0] += 1.0
+    clock.pause()
+    now[0] += 4.0
+    assert clock.now() == pytest.approx(1.0)
+    assert clock.seconds_paused == pytest.approx(4.0)
+    clock.resume()
+    now[0] += 0.5
+    assert clock.now() == pytest.approx(1.5)
+    assert clock.seconds_paused == pytest.approx(4.0)
+    clock.pause()
+    now[0] += 1.0
+    clock.resume()
+    assert clock.seconds_paused == pytest.approx(5.0)
+
+
+def test_resume_requires_start(now):
+    clock = ShowClock()
+    clock.resume()
+    assert not clock.is_running
+
+
+def test_seek(now):
+    clock = ShowClock()
+    clock.start()
+    now[0] += 1.0
+    clock.seek(10.0)
+    now[0] += 0.25
+    assert clock.now() == pytest.approx(10.25)
+    clock.pause()
+    clock.seek(3.0)
+    now[0] += 2.0
+    assert clock.now() == pytest.approx(3.0)
+    clock.resume()
+    now[0] += 1.0
+    assert clock.now() == pytest.approx(4.0)